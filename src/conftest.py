@@ -28,6 +28,10 @@ class FakeLambdaContext:
     aws_request_id: str = "test-request-id"
     log_group_name: str = "/aws/lambda/test-function"
     log_stream_name: str = "test-stream"
+    remaining_time_in_millis: int = 300_000
+
+    def get_remaining_time_in_millis(self) -> int:
+        return self.remaining_time_in_millis
 
 
 @pytest.fixture()
@@ -2,7 +2,8 @@
 
 Triggered by EventBridge cron. Scans the DynamoDB `companies` table and
 publishes one SQS message per company so the Worker Lambda can scrape each
-careers page independently.
+careers page independently. A company item's optional `ats_options` map
+(per-backend fetch options, e.g. Greenhouse departments) is forwarded as is.
 
 Environment variables expected:
     COMPANIES_TABLE  - DynamoDB table name for companies
@@ -13,6 +14,7 @@ from __future__ import annotations
 
 import json
 import os
+from decimal import Decimal
 from typing import Any
 
 import boto3
@@ -24,6 +26,15 @@ dynamodb = boto3.resource("dynamodb")
 sqs = boto3.client("sqs")
 
 
+def _json_default(value: Any) -> Any:
+    """Serialise the Decimals (DynamoDB numbers) and sets an item's nested ats_options may contain."""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, set):
+        return sorted(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
 @logger.inject_lambda_context
 def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     """Entry point for the Orchestrator Lambda.
@@ -53,9 +64,11 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
             "careers_url": company["careers_url"],
             "ats": company.get("ats", "unknown"),
         }
+        if company.get("ats_options"):
+            message["ats_options"] = company["ats_options"]
         sqs.send_message(
             QueueUrl=queue_url,
-            MessageBody=json.dumps(message),
+            MessageBody=json.dumps(message, default=_json_default),
         )
         published += 1
         logger.info("Queued company", company=company["company_name"], ats=message["ats"])
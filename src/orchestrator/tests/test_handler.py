@@ -89,3 +89,22 @@ def test_handler_missing_ats_defaults_to_unknown(aws_resources: dict, lambda_con
 
     body = _messages(aws_resources)[0]
     assert body["ats"] == "unknown"
+
+
+def test_handler_forwards_ats_options(aws_resources: dict, lambda_context) -> None:
+    """handler() should forward a company's ats_options map, including DynamoDB numbers, to the Worker."""
+    aws_resources["table"].put_item(
+        Item={
+            "company_name": "Datadog",
+            "careers_url": "https://boards-api.greenhouse.io/v1/boards/datadog/jobs",
+            "ats": "greenhouse",
+            "ats_options": {"departments": ["Engineering"], "max_pages": 3},
+        }
+    )
+    aws_resources["table"].put_item(Item={"company_name": "Acme Corp", "careers_url": "https://acme.com/jobs"})
+
+    handler({}, lambda_context)
+
+    bodies = {body["company_name"]: body for body in _messages(aws_resources)}
+    assert bodies["Datadog"]["ats_options"] == {"departments": ["Engineering"], "max_pages": 3}
+    assert "ats_options" not in bodies["Acme Corp"]
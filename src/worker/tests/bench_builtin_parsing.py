@@ -0,0 +1,90 @@
+"""Benchmark Built In HTML parsing against the full-tree BeautifulSoup implementation it replaced.
+
+Parses the saved fixture pages in fixtures/ with both the current parsers
+(_builtin_page_jobs, _builtin_description_text) and the previous ones
+(a full html.parser tree per page), checks they produce the same output,
+and reports the time per page. Not collected by pytest; run it directly:
+
+    PYTHONPATH=src/worker python src/worker/tests/bench_builtin_parsing.py
+"""
+
+from __future__ import annotations
+
+import os
+import timeit
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+from bs4.element import Tag
+
+# worker.handler creates its boto3 resources at import time.
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+from worker.handler import (  # noqa: E402
+    _BUILTIN_BASE_URL,
+    _builtin_description_text,
+    _builtin_page_jobs,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _card_text_by_icon(card: Tag, icon_class: str) -> str:
+    icon = card.select_one(f".{icon_class}")
+    if not icon:
+        return ""
+    parent = icon.find_parent("div")
+    sibling = parent.find_next_sibling() if parent else None
+    return sibling.get_text(strip=True) if sibling else ""
+
+
+def full_tree_page_jobs(html: str) -> list[dict[str, str]]:
+    """The previous search page parser: a full tree, then a select() for the cards."""
+    soup = BeautifulSoup(html, "html.parser")
+    jobs = []
+    for card in soup.select('[data-id="job-card"]'):
+        title_el = card.select_one('[data-id="job-card-title"]')
+        company_el = card.select_one('[data-id="company-title"]')
+        if not title_el or not company_el:
+            continue
+        geo = _card_text_by_icon(card, "fa-location-dot")
+        workplace = _card_text_by_icon(card, "fa-house-building")
+        href = title_el.get("href", "")
+        jobs.append(
+            {
+                "title": title_el.get_text(strip=True),
+                "url": _BUILTIN_BASE_URL + (href if isinstance(href, str) else ""),
+                "location": f"{geo} ({workplace})" if geo and workplace else geo or workplace,
+                "company": company_el.get_text(strip=True),
+            }
+        )
+    return jobs
+
+
+def full_tree_description_text(html: str) -> str:
+    """The previous job page parser: a full tree with the page chrome decomposed, then get_text()."""
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup(["script", "style", "noscript", "header", "footer", "nav"]):
+        tag.decompose()
+    return soup.get_text(separator=" ", strip=True)
+
+
+def _bench(label: str, current, previous, html: str, number: int) -> None:
+    assert current(html) == previous(html), f"{label}: output differs from the full-tree parser"
+    current_ms = min(timeit.repeat(lambda: current(html), number=number, repeat=5)) / number * 1000
+    previous_ms = min(timeit.repeat(lambda: previous(html), number=number, repeat=5)) / number * 1000
+    print(
+        f"{label:<14} {len(html) / 1024:7.0f} KB  full tree {previous_ms:7.2f} ms  "
+        f"current {current_ms:7.2f} ms  ({previous_ms / current_ms:.1f}x)"
+    )
+
+
+def main() -> None:
+    search_page = (FIXTURES / "builtin_search_page.html").read_text()
+    job_page = (FIXTURES / "builtin_job_page.html").read_text()
+    _bench("search page", _builtin_page_jobs, full_tree_page_jobs, search_page, number=20)
+    _bench("job page", _builtin_description_text, full_tree_description_text, job_page, number=20)
+
+
+if __name__ == "__main__":
+    main()
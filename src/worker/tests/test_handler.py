@@ -3,29 +3,75 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import boto3
 import pytest
 import requests
+from bs4 import BeautifulSoup
 from moto import mock_aws
 
 from worker.handler import (
+    _DYNAMODB_WRITE_BUFFER_SIZE,
+    _CLEARANCE_FALSE_POSITIVE_PHRASES,
+    _EXCLUDE_TITLE_KEYWORDS,
+    _GENERIC_CLEARANCE_KEYWORDS,
+    _HIGH_CLEARANCE_KEYWORDS,
+    _HTTP_MAX_ATTEMPTS,
+    _HTTP_POOL_MAXSIZE,
+    _KNOWN_COMPANIES_TTL_SECONDS,
+    _CrawlState,
+    _HostRateLimiter,
+    _KnownCompanyIndex,
+    _NO_CLEARANCE_PHRASES,
     _TITLE_KEYWORDS,
-    _builtin_location_matches,
+    _builtin_card_fields,
+    _builtin_description_text,
+    _builtin_filter_config,
+    _builtin_page_jobs,
+    _cached_description_verdicts,
+    _cached_response,
+    _classify_location,
+    _company_name_key,
+    _existing_job_ids,
     _fetch_builtin_jobs,
     _fetch_greenhouse_jobs,
+    _fetch_lever_jobs,
     _fetch_jobs,
     _fetch_workday_jobs,
-    _filter_relevant_jobs,
+    _http_connection_stats,
+    _http_get,
+    _http_session,
     _is_non_us_location,
-    _location_matches,
+    _iter_json_array,
+    _iter_relevant_jobs,
+    _known_company_index,
+    _listing_filter_stage,
+    _listing_skip_counts,
+    _location_filter_config,
     _make_job_id,
+    _parse_processes,
+    _ParsePool,
+    _put_new_jobs,
+    _response_cache_key,
+    _response_cache_stats,
     _requires_excluded_clearance,
+    _store_board_crawl_state,
+    _store_description_verdicts,
+    _store_response,
+    _workday_page_reaches_mark,
     handler,
 )
 
 REGION = "us-east-1"
+FIXTURES = Path(__file__).parent / "fixtures"
 
 
 def test_make_job_id_is_deterministic() -> None:
@@ -42,6 +88,12 @@ def test_make_job_id_differs_for_different_inputs() -> None:
     assert id1 != id2
 
 
+@pytest.fixture(autouse=True)
+def response_cache(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    """Point the on-disk response cache at a per-test file, so no test is served another's responses."""
+    monkeypatch.setenv("RESPONSE_CACHE_PATH", str(tmp_path / "response-cache.sqlite3"))
+
+
 @pytest.fixture()
 def aws_resources(monkeypatch: pytest.MonkeyPatch):
     with mock_aws():
@@ -58,15 +110,41 @@ def aws_resources(monkeypatch: pytest.MonkeyPatch):
             AttributeDefinitions=[{"AttributeName": "company_name", "AttributeType": "S"}],
             BillingMode="PAY_PER_REQUEST",
         )
+        verdicts_table = dynamodb.create_table(
+            TableName="test-description-verdicts",
+            KeySchema=[{"AttributeName": "job_url", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "job_url", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        crawl_state_table = dynamodb.create_table(
+            TableName="test-crawl-state",
+            KeySchema=[{"AttributeName": "board_url", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "board_url", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
 
         monkeypatch.setenv("JOBS_TABLE", "test-jobs")
         monkeypatch.setenv("COMPANIES_TABLE", "test-companies")
+        monkeypatch.setenv("DESCRIPTION_CACHE_TABLE", "test-description-verdicts")
+        monkeypatch.setenv("CRAWL_STATE_TABLE", "test-crawl-state")
+        # Every test's tables are new, so no test may reuse another's index of them.
+        monkeypatch.setattr("worker.handler._known_company_indexes", {})
+
+        yield {
+            "table": table,
+            "companies_table": companies_table,
+            "verdicts_table": verdicts_table,
+            "crawl_state_table": crawl_state_table,
+        }
+
 
-        yield {"table": table, "companies_table": companies_table}
+def _sqs_record(company_name: str, careers_url: str, ats: str = "unknown", message_id: str = "msg-1") -> dict:
+    body = json.dumps({"company_name": company_name, "careers_url": careers_url, "ats": ats})
+    return {"messageId": message_id, "body": body}
 
 
 def _sqs_event(company_name: str, careers_url: str, ats: str = "unknown") -> dict:
-    return {"Records": [{"body": json.dumps({"company_name": company_name, "careers_url": careers_url, "ats": ats})}]}
+    return {"Records": [_sqs_record(company_name, careers_url, ats)]}
 
 
 # --- handler integration tests (ATS dispatch mocked at _fetch_jobs) ---
@@ -113,6 +191,7 @@ def test_handler_deduplicates_jobs(mock_fetch, aws_resources: dict, lambda_conte
 
     assert first["jobs_written"] == 1
     assert second["jobs_written"] == 0
+    assert second["jobs_duplicate"] == 1
     assert aws_resources["table"].scan()["Count"] == 1
 
 
@@ -137,11 +216,11 @@ def test_handler_passes_ats_to_fetch(mock_fetch, aws_resources: dict, lambda_con
 
     handler(_sqs_event("Datadog", "https://boards.greenhouse.io/datadog", ats="greenhouse"), lambda_context)
 
-    mock_fetch.assert_called_once_with("Datadog", "https://boards.greenhouse.io/datadog", "greenhouse")
+    assert mock_fetch.call_args.args[:3] == ("Datadog", "https://boards.greenhouse.io/datadog", "greenhouse")
 
 
-@patch("worker.handler.requests.get")
-@patch("worker.handler.requests.post")
+@patch("worker.handler._http_get")
+@patch("worker.handler._http_post")
 def test_handler_writes_workday_jobs_across_pages(mock_post, mock_get, aws_resources: dict, lambda_context) -> None:
     """handler() should paginate a Workday keyword search and persist all matching jobs to DynamoDB."""
     page1_postings = [_workday_posting("Store Associate", f"R{i}") for i in range(19)]
@@ -168,6 +247,100 @@ def test_handler_writes_workday_jobs_across_pages(mock_post, mock_get, aws_resou
     assert items[0]["url"] == "https://acme.wd1.myworkdayjobs.com/acme-careers/job/Remote/Platform-Engineer_R001"
 
 
+@patch("worker.handler._fetch_jobs")
+def test_handler_persists_jobs_fetched_before_a_failure(mock_fetch, aws_resources: dict, lambda_context) -> None:
+    """Jobs already yielded by a fetcher should be written even if the fetch later dies (e.g. a timeout)."""
+
+    def fetch(*args):
+        yield {"title": "Platform Engineer", "url": "https://acme.com/jobs/1", "location": "Remote"}
+        raise RuntimeError("Lambda timed out")
+
+    mock_fetch.side_effect = fetch
+
+    result = handler(_sqs_event("Acme Corp", "https://acme.com/jobs"), lambda_context)
+
+    assert result["batchItemFailures"] == [{"itemIdentifier": "msg-1"}]
+    items = aws_resources["table"].scan()["Items"]
+    assert [item["title"] for item in items] == ["Platform Engineer"]
+
+
+@patch("worker.handler._fetch_jobs")
+def test_handler_reports_only_failed_records(mock_fetch, aws_resources: dict, lambda_context) -> None:
+    """A failing company should be reported in batchItemFailures without affecting the rest of the batch."""
+
+    def fetch(company_name, careers_url, ats, crawl_state, ats_options, skipped):
+        if company_name == "Broken Corp":
+            raise RuntimeError("boom")
+        return [{"title": "Platform Engineer", "url": f"{careers_url}/1", "location": "Remote"}]
+
+    mock_fetch.side_effect = fetch
+    event = {
+        "Records": [
+            _sqs_record("Acme Corp", "https://acme.com/jobs", message_id="msg-1"),
+            _sqs_record("Broken Corp", "https://broken.com/jobs", message_id="msg-2"),
+            _sqs_record("Initech", "https://initech.com/jobs", message_id="msg-3"),
+        ]
+    }
+
+    result = handler(event, lambda_context)
+
+    assert result["records_processed"] == 2
+    assert result["jobs_written"] == 2
+    assert result["batchItemFailures"] == [{"itemIdentifier": "msg-2"}]
+    assert {item["company"] for item in aws_resources["table"].scan()["Items"]} == {"Acme Corp", "Initech"}
+
+
+@patch("worker.handler._fetch_jobs")
+def test_handler_reports_records_still_running_at_the_deadline(
+    mock_fetch, aws_resources: dict, lambda_context, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A company still running near the Lambda deadline should be redelivered alone, not time out the batch."""
+    monkeypatch.setattr("worker.handler._HANDLER_DEADLINE_MARGIN_SECONDS", 0)
+    lambda_context.remaining_time_in_millis = 500
+    release = threading.Event()
+
+    def fetch(company_name, careers_url, ats, crawl_state, ats_options, skipped):
+        if company_name == "Slow Corp":
+            release.wait(timeout=5)
+            raise RuntimeError("abandoned")
+        return [{"title": "Platform Engineer", "url": f"{careers_url}/1", "location": "Remote"}]
+
+    mock_fetch.side_effect = fetch
+    event = {
+        "Records": [
+            _sqs_record("Acme Corp", "https://acme.com/jobs", message_id="msg-1"),
+            _sqs_record("Slow Corp", "https://slow.com/jobs", message_id="msg-2"),
+        ]
+    }
+
+    try:
+        result = handler(event, lambda_context)
+    finally:
+        release.set()
+
+    assert result["records_processed"] == 1
+    assert result["jobs_written"] == 1
+    assert result["batchItemFailures"] == [{"itemIdentifier": "msg-2"}]
+
+
+@patch("worker.handler._fetch_jobs")
+def test_handler_processes_batch_records_concurrently(mock_fetch, aws_resources: dict, lambda_context) -> None:
+    """Every record of a batch should be in flight at once rather than processed one after another."""
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fetch(company_name, careers_url, ats, crawl_state, ats_options, skipped):
+        barrier.wait()
+        return []
+
+    mock_fetch.side_effect = fetch
+    event = {"Records": [_sqs_record(f"Co {i}", f"https://co{i}.com/jobs", message_id=f"msg-{i}") for i in range(3)]}
+
+    result = handler(event, lambda_context)
+
+    assert result["records_processed"] == 3
+    assert result["batchItemFailures"] == []
+
+
 @patch("worker.handler._fetch_jobs")
 def test_handler_uses_per_job_company_when_present(mock_fetch, aws_resources: dict, lambda_context) -> None:
     """handler() should prefer a job's own "company" key (e.g. from the builtin fetcher) over company_name."""
@@ -193,13 +366,13 @@ def test_handler_defaults_ats_to_unknown(mock_fetch, aws_resources: dict, lambda
 
     handler(event, lambda_context)
 
-    mock_fetch.assert_called_once_with("Acme", "https://acme.com/jobs", "unknown")
+    assert mock_fetch.call_args.args[:3] == ("Acme", "https://acme.com/jobs", "unknown")
 
 
 def test_fetch_jobs_returns_empty_for_unrecognised_ats() -> None:
     """_fetch_jobs should return no jobs (not raise) for an unrecognised ats value."""
-    assert _fetch_jobs("Acme", "https://acme.com/jobs", "unknown") == []
-    assert _fetch_jobs("Acme", "https://acme.com/jobs", "some-other-ats") == []
+    assert list(_fetch_jobs("Acme", "https://acme.com/jobs", "unknown")) == []
+    assert list(_fetch_jobs("Acme", "https://acme.com/jobs", "some-other-ats")) == []
 
 
 # --- _fetch_jobs dispatch unit tests ---
@@ -210,7 +383,25 @@ def test_fetch_jobs_dispatches_greenhouse(mock_gh) -> None:
     """_fetch_jobs should call _fetch_greenhouse_jobs for ats='greenhouse'."""
     mock_gh.return_value = []
     _fetch_jobs("Acme", "https://boards.greenhouse.io/acme", "greenhouse")
-    mock_gh.assert_called_once_with("https://boards.greenhouse.io/acme")
+    mock_gh.assert_called_once_with(
+        "https://boards.greenhouse.io/acme", None, departments=[], offices=[], skipped=None, company_name="Acme"
+    )
+
+
+@patch("worker.handler._fetch_greenhouse_jobs")
+def test_fetch_jobs_passes_greenhouse_ats_options(mock_gh) -> None:
+    """_fetch_jobs should pass Greenhouse departments/offices options through, accepting a single string."""
+    mock_gh.return_value = []
+    options = {"departments": ["Engineering", "Infrastructure"], "offices": "United States"}
+    _fetch_jobs("Acme", "https://boards.greenhouse.io/acme", "greenhouse", ats_options=options)
+    mock_gh.assert_called_once_with(
+        "https://boards.greenhouse.io/acme",
+        None,
+        departments=["Engineering", "Infrastructure"],
+        offices=["United States"],
+        skipped=None,
+        company_name="Acme",
+    )
 
 
 @patch("worker.handler._fetch_lever_jobs")
@@ -218,75 +409,940 @@ def test_fetch_jobs_dispatches_lever(mock_lv) -> None:
     """_fetch_jobs should call _fetch_lever_jobs for ats='lever'."""
     mock_lv.return_value = []
     _fetch_jobs("Acme", "https://jobs.lever.co/acme", "lever")
-    mock_lv.assert_called_once_with("https://jobs.lever.co/acme")
+    mock_lv.assert_called_once_with(
+        "https://jobs.lever.co/acme",
+        None,
+        filters={"team": [], "department": [], "location": [], "commitment": []},
+        skipped=None,
+    )
+
+
+@patch("worker.handler._fetch_workday_jobs")
+def test_fetch_jobs_dispatches_workday(mock_wd) -> None:
+    """_fetch_jobs should call _fetch_workday_jobs for ats='workday'."""
+    mock_wd.return_value = []
+    _fetch_jobs("Acme", "https://acme.wd1.myworkdayjobs.com/acme", "workday")
+    mock_wd.assert_called_once_with(
+        "https://acme.wd1.myworkdayjobs.com/acme", "Acme", None, strategy="auto", page_size=20, skipped=None
+    )
+
+
+@patch("worker.handler._fetch_workday_jobs")
+def test_fetch_jobs_passes_workday_options(mock_wd) -> None:
+    """_fetch_jobs should pass a company's Workday strategy and page size, clamping the page size."""
+    mock_wd.return_value = []
+    _fetch_jobs(
+        "Acme", "https://acme.wd1.myworkdayjobs.com/acme", "workday", ats_options={"strategy": "full", "page_size": 500}
+    )
+    _fetch_jobs("Acme", "https://acme.wd1.myworkdayjobs.com/acme", "workday", ats_options={"strategy": "bogus"})
+    assert mock_wd.call_args_list[0].kwargs == {"strategy": "full", "page_size": 100, "skipped": None}
+    assert mock_wd.call_args_list[1].kwargs == {"strategy": "auto", "page_size": 20, "skipped": None}
+
+
+@pytest.mark.parametrize("page_size", ["big", None, [50]])
+@patch("worker.handler._fetch_workday_jobs")
+def test_fetch_jobs_falls_back_on_invalid_workday_page_size(mock_wd, page_size) -> None:
+    """An unparseable Workday page_size option should fall back to the default rather than fail the record."""
+    mock_wd.return_value = []
+    _fetch_jobs("Acme", "https://acme.wd1.myworkdayjobs.com/acme", "workday", ats_options={"page_size": page_size})
+    assert mock_wd.call_args.kwargs["page_size"] == 20
+
+
+@patch("worker.handler._fetch_builtin_jobs")
+def test_fetch_jobs_dispatches_builtin(mock_bi) -> None:
+    """_fetch_jobs should call _fetch_builtin_jobs for ats='builtin'."""
+    mock_bi.return_value = []
+    _fetch_jobs("Built In - AWS Search", "https://builtin.com/jobs?search=AWS", "builtin")
+    mock_bi.assert_called_once_with("https://builtin.com/jobs?search=AWS", None, None)
+
+
+# --- _existing_job_ids unit tests ---
+
+
+def test_existing_job_ids_checks_in_batches(aws_resources: dict) -> None:
+    """_existing_job_ids should find stored IDs across more keys than one BatchGetItem allows."""
+    job_ids = [f"job-{i}" for i in range(250)]
+    for job_id in job_ids[::50]:
+        aws_resources["table"].put_item(Item={"job_id": job_id})
+
+    assert _existing_job_ids(job_ids + job_ids[:10]) == set(job_ids[::50])
+
+
+def test_existing_job_ids_without_jobs_table_finds_nothing(monkeypatch: pytest.MonkeyPatch) -> None:
+    """_existing_job_ids should fail open (treat everything as new) when JOBS_TABLE isn't configured."""
+    monkeypatch.delenv("JOBS_TABLE", raising=False)
+    assert _existing_job_ids(["job-1"]) == set()
+
+
+# --- _put_new_jobs unit tests ---
+
+
+def test_put_new_jobs_inserts_only_absent_items(aws_resources: dict) -> None:
+    """_put_new_jobs should write new items, leave existing ones untouched, and count each."""
+    table = aws_resources["table"]
+    table.put_item(Item={"job_id": "job-3", "title": "Original"})
+    items = [
+        {"job_id": f"job-{i}", "company": "Acme", "title": f"Platform Engineer {i}", "url": f"https://acme.com/{i}"}
+        for i in range(40)
+    ]
+
+    written, duplicates = _put_new_jobs("test-jobs", items)
+
+    assert (written, duplicates) == (39, 1)
+    assert table.scan()["Count"] == 40
+    assert table.get_item(Key={"job_id": "job-3"})["Item"]["title"] == "Original"
+
+
+def test_put_new_jobs_consumes_items_with_bounded_buffer() -> None:
+    """_put_new_jobs should pull items lazily, never running more than the buffer size ahead of the writers."""
+    completed = 0
+    lock = threading.Lock()
+    lag = []
+
+    def fake_put(table_name: str, item: dict) -> bool:
+        nonlocal completed
+        time.sleep(0.001)
+        with lock:
+            completed += 1
+        return True
+
+    def items():
+        for i in range(200):
+            with lock:
+                lag.append(i - completed)
+            yield {"job_id": f"job-{i}"}
+
+    with patch("worker.handler._put_new_job", side_effect=fake_put):
+        assert _put_new_jobs("test-jobs", items()) == (200, 0)
+
+    assert max(lag) <= _DYNAMODB_WRITE_BUFFER_SIZE
+
+
+def test_put_new_jobs_empty_input_writes_nothing(aws_resources: dict) -> None:
+    """_put_new_jobs should be a no-op for an empty list."""
+    assert _put_new_jobs("test-jobs", []) == (0, 0)
+
+
+# --- HTTP session layer unit tests ---
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture()
+def keep_alive_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class _ThrottlingHandler(BaseHTTPRequestHandler):
+    """Answers each path's first N requests with the status and Retry-After encoded in it.
+
+    e.g. /429/2/0 returns 429 with "Retry-After: 0" twice, then 200;
+    /503/9/- returns 503 (no Retry-After) nine times. Every request is
+    recorded in `requests_seen`.
+    """
+
+    protocol_version = "HTTP/1.1"
+    requests_seen: list[str] = []
+
+    def do_GET(self) -> None:
+        _, status, times, retry_after = self.path.split("/")
+        self.requests_seen.append(self.path)
+        throttled = self.requests_seen.count(self.path) <= int(times)
+        self.send_response(int(status) if throttled else 200)
+        if throttled and retry_after != "-":
+            self.send_header("Retry-After", retry_after)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture()
+def throttling_server():
+    _ThrottlingHandler.requests_seen = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ThrottlingHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_http_session_is_shared_per_host() -> None:
+    """_http_session should hand back the same Session for every URL on a host, and a separate one per host."""
+    board_a = _http_session("https://boards-api.greenhouse.io/v1/boards/a/jobs")
+    board_b = _http_session("https://boards-api.greenhouse.io/v1/boards/b/jobs")
+    lever = _http_session("https://api.lever.co/v0/postings/acme")
+
+    assert board_a is board_b
+    assert board_a is not lever
+
+
+def test_http_session_mounts_pooled_retrying_adapter() -> None:
+    """Each host Session should use a sized connection pool, a retry adapter, and negotiate compression."""
+    url = "https://acme.wd1.myworkdayjobs.com/wday/cxs/acme/acme-careers/jobs"
+    session = _http_session(url)
+    adapter = session.get_adapter(url)
+
+    assert adapter._pool_maxsize == _HTTP_POOL_MAXSIZE
+    assert adapter.max_retries.total == 2
+    assert "gzip" in session.headers["Accept-Encoding"]
+
+
+def test_http_connection_stats_counts_reused_connections(keep_alive_server: str) -> None:
+    """Sequential requests to one host should open a single connection and reuse it for the rest."""
+    before = _http_connection_stats()
+
+    for i in range(3):
+        _http_get(f"{keep_alive_server}/jobs/{i}").raise_for_status()
+
+    after = _http_connection_stats()
+    assert after["requests_sent"] - before["requests_sent"] == 3
+    assert after["connections_opened"] - before["connections_opened"] == 1
+
+
+def test_http_get_retries_throttled_request_after_retry_after(throttling_server: str) -> None:
+    """A 429 with Retry-After should be retried once the server allows, not surfaced to the caller."""
+    resp = _http_get(f"{throttling_server}/429/2/0")
+
+    assert resp.status_code == 200
+    assert _ThrottlingHandler.requests_seen == ["/429/2/0"] * 3
+
+
+def test_http_get_gives_up_after_max_attempts(throttling_server: str) -> None:
+    """A host that keeps failing should get _HTTP_MAX_ATTEMPTS attempts, then its last response returned."""
+    with patch("worker.handler.random.uniform", return_value=0.0) as mock_jitter:
+        resp = _http_get(f"{throttling_server}/503/9/-")
+
+    assert resp.status_code == 503
+    assert len(_ThrottlingHandler.requests_seen) == _HTTP_MAX_ATTEMPTS
+    # Without Retry-After, each wait is drawn from a doubling backoff window.
+    assert [c.args for c in mock_jitter.call_args_list] == [(0, 1.0), (0, 2.0), (0, 4.0)]
+
+
+def test_http_get_does_not_retry_client_errors(throttling_server: str) -> None:
+    """4xx responses other than 429 won't change on retry, so should be returned immediately."""
+    resp = _http_get(f"{throttling_server}/404/9/-")
+
+    assert resp.status_code == 404
+    assert len(_ThrottlingHandler.requests_seen) == 1
+
+
+def test_host_rate_limiter_pause_holds_back_every_request() -> None:
+    """After pause(), acquire() should wait out the pause even with tokens available."""
+    limiter = _HostRateLimiter(rate=1000.0, burst=4)
+    limiter.pause(0.1)
+
+    start = time.monotonic()
+    limiter.acquire()
+
+    assert time.monotonic() - start >= 0.09
+
+
+def test_host_rate_limiter_spaces_requests_beyond_burst() -> None:
+    """Once the burst is spent, requests should be admitted at the sustained rate."""
+    limiter = _HostRateLimiter(rate=50.0, burst=2)
+
+    start = time.monotonic()
+    for _ in range(7):
+        limiter.acquire()
+
+    # 2 immediately, then 5 more at 50/s.
+    assert time.monotonic() - start >= 0.09
+
+
+# --- response cache unit tests ---
+
+
+def _response(body: bytes, content_type: str = "application/json") -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = content_type
+    response._content = body
+    response._content_consumed = True
+    return response
+
+
+def test_http_get_serves_repeat_request_from_response_cache(keep_alive_server: str) -> None:
+    """A repeated GET within the TTL should be answered from the cache without touching the network."""
+    url = f"{keep_alive_server}/jobs/cached"
+    http_before = _http_connection_stats()
+    cache_before = _response_cache_stats()
+
+    first = _http_get(url, params={"page": 1})
+    second = _http_get(url, params={"page": 1})
+
+    assert second.json() == first.json() == {"ok": True}
+    assert _http_connection_stats()["requests_sent"] - http_before["requests_sent"] == 1
+    cache = _response_cache_stats()
+    assert cache["hits"] - cache_before["hits"] == 1
+    assert cache["misses"] - cache_before["misses"] == 1
+    assert cache["bytes_saved"] - cache_before["bytes_saved"] == len(b'{"ok": true}')
+
+
+def test_http_get_cache_keys_on_query_params(keep_alive_server: str) -> None:
+    """Requests differing only in their params (e.g. a Built In page number) should not share an entry."""
+    http_before = _http_connection_stats()
+
+    _http_get(f"{keep_alive_server}/jobs", params={"page": 1})
+    _http_get(f"{keep_alive_server}/jobs", params={"page": 2})
+
+    assert _http_connection_stats()["requests_sent"] - http_before["requests_sent"] == 2
+
+
+def test_http_get_does_not_cache_error_responses(throttling_server: str) -> None:
+    """Only 200 responses should be cached; an error should be re-requested next time."""
+    _http_get(f"{throttling_server}/404/9/-")
+    _http_get(f"{throttling_server}/404/9/-")
+
+    assert len(_ThrottlingHandler.requests_seen) == 2
+
+
+def test_http_get_without_cache_ttl_always_hits_network(
+    keep_alive_server: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """RESPONSE_CACHE_TTL_SECONDS=0 should disable the response cache."""
+    monkeypatch.setenv("RESPONSE_CACHE_TTL_SECONDS", "0")
+    http_before = _http_connection_stats()
+
+    _http_get(f"{keep_alive_server}/jobs/uncached")
+    _http_get(f"{keep_alive_server}/jobs/uncached")
+
+    assert _http_connection_stats()["requests_sent"] - http_before["requests_sent"] == 2
+
+
+def test_http_get_skips_response_cache_when_streaming(keep_alive_server: str) -> None:
+    """A streamed request is never cached, so it shouldn't be looked up or counted as a miss either."""
+    cache_before = _response_cache_stats()
+
+    _http_get(f"{keep_alive_server}/jobs/streamed", stream=True).close()
+    _http_get(f"{keep_alive_server}/jobs/streamed", stream=True).close()
+
+    cache = _response_cache_stats()
+    assert cache["hits"] == cache_before["hits"]
+    assert cache["misses"] == cache_before["misses"]
+
+
+def test_cached_response_round_trips_body_and_expires() -> None:
+    """A stored body should come back intact (decompressed) within the TTL, and be a miss once older."""
+    key = _response_cache_key("GET", "https://builtin.com/job/1", {})
+    _store_response(key, "https://builtin.com/job/1", _response("<p>Café</p>".encode(), "text/html; charset=utf-8"))
+
+    cached = _cached_response(key, "https://builtin.com/job/1", ttl=3600)
+    assert cached is not None
+    assert cached.text == "<p>Café</p>"
+    assert _cached_response(key, "https://builtin.com/job/1", ttl=0) is None
+
+
+def test_store_response_evicts_least_recently_used_over_size_bound() -> None:
+    """Once the cache is over its size bound, the least recently used entries should be evicted first."""
+    keys = [_response_cache_key("GET", f"https://acme.com/{i}", {}) for i in range(4)]
+    with patch("worker.handler._RESPONSE_CACHE_MAX_BYTES", 3500):
+        for key in keys[:3]:
+            _store_response(key, "https://acme.com", _response(os.urandom(1000)))
+        # keys[0] is the oldest entry, but a hit makes keys[1] the least recently used.
+        assert _cached_response(keys[0], "https://acme.com", ttl=3600) is not None
+        _store_response(keys[3], "https://acme.com", _response(os.urandom(1000)))
+
+    present = [_cached_response(key, "https://acme.com", ttl=3600) is not None for key in keys]
+    assert present == [True, False, True, True]
+
+
+def test_store_response_tracks_size_of_replaced_entries() -> None:
+    """Re-storing a key should replace its size in the running total rather than add to it."""
+    key = _response_cache_key("GET", "https://acme.com/board", {})
+    with patch("worker.handler._RESPONSE_CACHE_MAX_BYTES", 2500):
+        for _ in range(5):
+            _store_response(key, "https://acme.com", _response(os.urandom(1000)))
+        other = _response_cache_key("GET", "https://acme.com/other", {})
+        _store_response(other, "https://acme.com", _response(os.urandom(1000)))
+
+    assert _cached_response(key, "https://acme.com", ttl=3600) is not None
+    assert _cached_response(other, "https://acme.com", ttl=3600) is not None
+
+
+# --- _fetch_greenhouse_jobs unit tests ---
+
+
+def _board_response(payload: object, status: int = 200, etag: str = '"v1"') -> requests.Response:
+    response = _response(json.dumps(payload).encode() if status == 200 else b"")
+    response.status_code = status
+    response.headers["ETag"] = etag
+    response.headers["Last-Modified"] = "Mon, 12 Oct 2026 09:00:00 GMT"
+    return response
+
+
+def _greenhouse_posting(title: str, content: str = "") -> dict:
+    return {
+        "title": title,
+        "absolute_url": f"https://job-boards.greenhouse.io/acme/jobs/{title}",
+        "location": {"name": "Remote"},
+        "content": content,
+    }
+
+
+@patch("worker.handler._http_get")
+def test_fetch_greenhouse_jobs_requests_full_content(mock_get) -> None:
+    """_fetch_greenhouse_jobs should request content=true to get full descriptions for free."""
+    mock_get.return_value = _board_response({"jobs": [_greenhouse_posting("Platform Engineer")]})
+
+    list(_fetch_greenhouse_jobs("https://boards-api.greenhouse.io/v1/boards/acme/jobs"))
+
+    assert mock_get.call_args.kwargs["params"] == {"content": "true"}
+
+
+@patch("worker.handler._http_get")
+def test_fetch_greenhouse_jobs_excludes_high_clearance_description(mock_get) -> None:
+    """_fetch_greenhouse_jobs should drop postings whose description requires a high clearance."""
+    mock_get.return_value = _board_response(
+        {
+            "jobs": [
+                _greenhouse_posting("Cloud Engineer", content="Must hold an active Top Secret clearance."),
+                _greenhouse_posting("Platform Engineer", content="No clearance required."),
+            ]
+        }
+    )
+
+    jobs = list(_fetch_greenhouse_jobs("https://boards-api.greenhouse.io/v1/boards/acme/jobs"))
+
+    assert [j["title"] for j in jobs] == ["Platform Engineer"]
+
+
+@patch("worker.handler._http_get")
+def test_fetch_greenhouse_jobs_allows_public_trust_description(mock_get) -> None:
+    """_fetch_greenhouse_jobs should keep postings whose description only requires Public Trust."""
+    mock_get.return_value = _board_response(
+        {"jobs": [_greenhouse_posting("Cloud Engineer", content="Requires a Public Trust clearance.")]}
+    )
+
+    jobs = list(_fetch_greenhouse_jobs("https://boards-api.greenhouse.io/v1/boards/acme/jobs"))
+
+    assert [j["title"] for j in jobs] == ["Cloud Engineer"]
+
+
+@patch("worker.handler._http_get")
+def test_fetch_greenhouse_jobs_applies_listing_filters_before_description_scan(mock_get) -> None:
+    """Only postings passing the listing-level stages should have their description scanned."""
+    mock_get.return_value = _board_response(
+        {
+            "jobs": [
+                _greenhouse_posting("Account Executive", content="Must hold an active Top Secret clearance."),
+                _greenhouse_posting("Platform Engineering Manager", content="No clearance required."),
+                _greenhouse_posting("Platform Engineer", content="No clearance required."),
+            ]
+        }
+    )
+
+    with patch("worker.handler._requires_excluded_clearance", return_value=False) as mock_clearance:
+        jobs = list(_fetch_greenhouse_jobs("https://boards-api.greenhouse.io/v1/boards/acme/jobs"))
+
+    assert [j["title"] for j in jobs] == ["Platform Engineer"]
+    # One title-only check for the Platform Engineer listing, plus one scan of its description.
+    scanned = [c.args[0] for c in mock_clearance.call_args_list]
+    assert scanned == ["Platform Engineer", "Platform Engineer No clearance required."]
+
+
+@patch("worker.handler._http_get")
+def test_fetch_greenhouse_jobs_streams_board(mock_get) -> None:
+    """The board should be requested as a stream, and a non-JSON page should yield nothing rather than raise."""
+    mock_get.return_value = _response(b"<html><body>Careers</body></html>", content_type="text/html")
+
+    assert list(_fetch_greenhouse_jobs("https://boards.greenhouse.io/acme")) == []
+    assert mock_get.call_args.kwargs["stream"] is True
+
+
+def _chunked(document: str, size: int) -> Iterator[bytes]:
+    raw = document.encode()
+    for start in range(0, len(raw), size):
+        yield raw[start : start + size]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64 * 1024])
+def test_iter_json_array_matches_json_loads_across_chunk_boundaries(chunk_size: int) -> None:
+    """Elements should decode identically however the document is split — mid-string, mid-number, mid-UTF-8."""
+    jobs = [
+        {"title": "Platform Engineer", "id": 1234567, "content": 'Café — “quotes”, \\ and " escapes'},
+        {"title": "SRE", "id": -1.5e3, "location": {"name": "Zürich"}, "tags": [1, [2, {}]]},
+    ]
+    document = json.dumps({"meta": {"total": 2}, "jobs": jobs, "after": [1, 2, 3]}, ensure_ascii=False, indent=1)
+
+    assert list(_iter_json_array(_chunked(document, chunk_size), "jobs")) == jobs
+    assert list(_iter_json_array(_chunked(json.dumps(jobs), chunk_size))) == jobs
+    assert list(_iter_json_array(_chunked('{"jobs": []}', chunk_size), "jobs")) == []
+    assert list(_iter_json_array(_chunked('{"meta": {}}', chunk_size), "jobs")) == []
+
+
+def test_iter_json_array_is_lazy_and_rejects_malformed_documents() -> None:
+    """An element should be yielded before the rest of the stream is read, and a truncated document should raise."""
+    chunks_read = []
+
+    def chunks():
+        for chunk in (b'[{"a": 1},', b' {"a": 2}', b"]"):
+            chunks_read.append(chunk)
+            yield chunk
+
+    elements = _iter_json_array(chunks())
+    assert next(elements) == {"a": 1}
+    assert chunks_read == [b'[{"a": 1},']
+    assert list(elements) == [{"a": 2}]
+
+    with pytest.raises(json.JSONDecodeError):
+        list(_iter_json_array([b'[{"a": 1}, {"a"']))
+    with pytest.raises(json.JSONDecodeError):
+        list(_iter_json_array([b"<html>"], "jobs"))
+
+
+def _greenhouse_listing_job(job_id: int, title: str) -> dict:
+    return {
+        "id": job_id,
+        "title": title,
+        "absolute_url": f"https://job-boards.greenhouse.io/acme/jobs/{job_id}",
+        "location": {"name": "Remote"},
+    }
+
+
+def _mock_greenhouse_narrowed_board(mock_get, contents: dict[int, str]) -> None:
+    """Serve a departments and an offices listing, plus per-job content, from mock_get."""
+    departments = {
+        "departments": [
+            {
+                "id": 1,
+                "name": "Engineering",
+                "parent_id": None,
+                "jobs": [_greenhouse_listing_job(10, "Platform Engineer")],
+            },
+            {
+                "id": 2,
+                "name": "Infrastructure",
+                "parent_id": 1,
+                "jobs": [_greenhouse_listing_job(11, "Cloud Engineer")],
+            },
+            {"id": 3, "name": "Sales", "parent_id": None, "jobs": [_greenhouse_listing_job(12, "DevOps Engineer")]},
+        ]
+    }
+    offices = {
+        "offices": [
+            {"id": 7, "name": "United States", "departments": [{"id": 1, "jobs": [_greenhouse_listing_job(10, "x")]}]},
+            {"id": 8, "name": "London", "departments": [{"id": 2, "jobs": [_greenhouse_listing_job(11, "x")]}]},
+        ]
+    }
+
+    def fake_get(url, **kwargs):
+        if url.endswith("/departments"):
+            return _board_response(departments)
+        if url.endswith("/offices"):
+            return _board_response(offices)
+        return _board_response({"content": contents[int(url.rsplit("/", 1)[1])]})
+
+    mock_get.side_effect = fake_get
+
+
+@patch("worker.handler._http_get")
+def test_fetch_greenhouse_jobs_narrows_to_departments(mock_get) -> None:
+    """Only postings in matching departments (and their sub-departments) should be listed, with content per job."""
+    _mock_greenhouse_narrowed_board(mock_get, {10: "No clearance required.", 11: "Active TS/SCI clearance required."})
+    url = "https://boards-api.greenhouse.io/v1/boards/acme/jobs"
+
+    jobs = list(_fetch_greenhouse_jobs(url, departments=["engineering"]))
+
+    assert [j["title"] for j in jobs] == ["Platform Engineer"]
+    requested = [c.args[0] for c in mock_get.call_args_list]
+    assert requested == [
+        "https://boards-api.greenhouse.io/v1/boards/acme/departments",
+        "https://boards-api.greenhouse.io/v1/boards/acme/jobs/10",
+        "https://boards-api.greenhouse.io/v1/boards/acme/jobs/11",
+    ]
+    assert all("params" not in c.kwargs for c in mock_get.call_args_list)
+
+
+@patch("worker.handler._http_get")
+def test_fetch_greenhouse_jobs_intersects_departments_and_offices(mock_get) -> None:
+    """With both options set, a posting must be in a matching department and a matching office."""
+    _mock_greenhouse_narrowed_board(mock_get, {10: "", 11: ""})
+
+    jobs = list(
+        _fetch_greenhouse_jobs(
+            "https://boards-api.greenhouse.io/v1/boards/acme/jobs", departments=["Engineering"], offices=["united"]
+        )
+    )
+
+    assert [j["title"] for j in jobs] == ["Platform Engineer"]
+
+
+@patch("worker.handler._http_get")
+def test_fetch_greenhouse_jobs_narrowed_skips_content_fetch_for_known_jobs(mock_get, aws_resources: dict) -> None:
+    """A narrowed posting whose job_id is already in the jobs table should be dropped without a content fetch."""
+    _mock_greenhouse_narrowed_board(mock_get, {10: "No clearance required.", 11: "No clearance required."})
+    aws_resources["table"].put_item(
+        Item={"job_id": _make_job_id("Acme", "Platform Engineer", "https://job-boards.greenhouse.io/acme/jobs/10")}
+    )
+    url = "https://boards-api.greenhouse.io/v1/boards/acme/jobs"
+
+    jobs = list(_fetch_greenhouse_jobs(url, departments=["engineering"], company_name="Acme"))
+
+    assert [j["title"] for j in jobs] == ["Cloud Engineer"]
+    assert [c.args[0] for c in mock_get.call_args_list] == [
+        "https://boards-api.greenhouse.io/v1/boards/acme/departments",
+        "https://boards-api.greenhouse.io/v1/boards/acme/jobs/11",
+    ]
+
+
+# --- _fetch_lever_jobs unit tests ---
+
+
+def _lever_posting(title: str, description: str = "", lists: list | None = None) -> dict:
+    return {
+        "text": title,
+        "hostedUrl": f"https://jobs.lever.co/acme/{title.replace(' ', '-')}",
+        "categories": {"location": "Remote", "team": "Infrastructure"},
+        "descriptionPlain": description,
+        "lists": lists or [],
+    }
+
+
+@patch("worker.handler._http_get")
+def test_fetch_lever_jobs_pages_with_skip_and_limit(mock_get, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Pages should be requested until a short one, with the configured filters on every page."""
+    monkeypatch.setattr("worker.handler._LEVER_PAGE_SIZE", 2)
+    mock_get.side_effect = [
+        _board_response([_lever_posting("Platform Engineer"), _lever_posting("Account Executive")]),
+        _board_response([_lever_posting("Cloud Engineer"), _lever_posting("Site Reliability Engineer")]),
+        _board_response([_lever_posting("DevOps Engineer")]),
+    ]
+    url = "https://api.lever.co/v0/postings/acme"
+
+    jobs = list(_fetch_lever_jobs(url, state := _CrawlState(url), filters={"team": ["Infrastructure"], "location": []}))
+
+    assert [j["title"] for j in jobs] == [
+        "Platform Engineer",
+        "Cloud Engineer",
+        "Site Reliability Engineer",
+        "DevOps Engineer",
+    ]
+    assert [c.kwargs["params"] for c in mock_get.call_args_list] == [
+        {"team": ["Infrastructure"], "skip": 0, "limit": 2},
+        {"team": ["Infrastructure"], "skip": 2, "limit": 2},
+        {"team": ["Infrastructure"], "skip": 4, "limit": 2},
+    ]
+    # A multi-page board keeps no validators: its first page being unchanged says nothing about the rest.
+    assert state.completed
+    assert state.validators == {}
+
+
+@patch("worker.handler._http_get")
+def test_fetch_lever_jobs_checks_description_fields_for_clearance(mock_get) -> None:
+    """descriptionPlain and lists from the listing itself should drop high-clearance postings without extra requests."""
+    mock_get.return_value = _board_response(
+        [
+            _lever_posting("Cloud Engineer", description="Must hold an active Top Secret clearance."),
+            _lever_posting(
+                "Platform Engineer", lists=[{"text": "Requirements", "content": "<li>Active TS/SCI clearance</li>"}]
+            ),
+            _lever_posting("DevOps Engineer", description="Public Trust clearance preferred."),
+        ]
+    )
+
+    jobs = list(_fetch_lever_jobs("https://api.lever.co/v0/postings/acme"))
+
+    assert [j["title"] for j in jobs] == ["DevOps Engineer"]
+    assert mock_get.call_count == 1
+
+
+@patch("worker.handler._http_get")
+def test_fetch_lever_jobs_counts_listing_drops_into_given_counter(mock_get) -> None:
+    """Postings dropped by a listing-level stage should be counted into the caller's skip counter."""
+    mock_get.return_value = _board_response(
+        [
+            _lever_posting("Platform Engineer"),
+            _lever_posting("Account Executive"),
+            _lever_posting("Director of Platform Engineering"),
+        ]
+    )
+    skipped = _listing_skip_counts()
+
+    jobs = list(_fetch_lever_jobs("https://api.lever.co/v0/postings/acme", skipped=skipped))
+
+    assert [j["title"] for j in jobs] == ["Platform Engineer"]
+    assert skipped["title"] == 1
+    assert skipped["excluded_title"] == 1
+
+
+# --- Conditional board crawls ---
+
+
+@patch("worker.handler._http_get")
+def test_greenhouse_board_not_modified_skips_filter_and_writes(mock_get, aws_resources: dict, lambda_context) -> None:
+    """A 304 to the conditional request should short-circuit the company without touching the jobs table."""
+    url = "https://boards-api.greenhouse.io/v1/boards/acme/jobs"
+    mock_get.side_effect = [
+        _board_response({"jobs": [_greenhouse_posting("Platform Engineer")]}),
+        _board_response({}, 304),
+    ]
+
+    first = handler(_sqs_event("Acme", url, ats="greenhouse"), lambda_context)
+    with patch("worker.handler._put_new_job") as mock_put:
+        second = handler(_sqs_event("Acme", url, ats="greenhouse"), lambda_context)
+
+    assert first["jobs_written"] == 1
+    assert second["jobs_written"] == 0
+    mock_put.assert_not_called()
+    assert "headers" not in mock_get.call_args_list[0].kwargs or not mock_get.call_args_list[0].kwargs["headers"]
+    assert mock_get.call_args_list[1].kwargs["headers"] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 12 Oct 2026 09:00:00 GMT",
+    }
+
+
+@patch("worker.handler._http_get")
+def test_lever_board_with_identical_body_is_skipped(mock_get, aws_resources: dict, lambda_context) -> None:
+    """A server ignoring the conditional headers should still have every posting skipped by the snapshot."""
+    url = "https://api.lever.co/v0/postings/acme"
+    postings = [
+        {"text": "Platform Engineer", "hostedUrl": "https://jobs.lever.co/acme/1", "categories": {"location": "Remote"}}
+    ]
+    mock_get.side_effect = [_board_response(postings, etag='"v1"'), _board_response(postings, etag='"v2"')]
 
+    handler(_sqs_event("Acme", url, ats="lever"), lambda_context)
+    assert list(_fetch_lever_jobs(url, crawl_state := _CrawlState(url))) == []
 
-@patch("worker.handler._fetch_workday_jobs")
-def test_fetch_jobs_dispatches_workday(mock_wd) -> None:
-    """_fetch_jobs should call _fetch_workday_jobs for ats='workday'."""
-    mock_wd.return_value = []
-    _fetch_jobs("Acme", "https://acme.wd1.myworkdayjobs.com/acme", "workday")
-    mock_wd.assert_called_once_with("https://acme.wd1.myworkdayjobs.com/acme")
+    assert crawl_state.completed
+    assert crawl_state.diff_counts() == {"postings_added": 0, "postings_removed": 0, "postings_unchanged": 1}
 
 
-@patch("worker.handler._fetch_builtin_jobs")
-def test_fetch_jobs_dispatches_builtin(mock_bi) -> None:
-    """_fetch_jobs should call _fetch_builtin_jobs for ats='builtin'."""
-    mock_bi.return_value = []
-    _fetch_jobs("Built In - AWS Search", "https://builtin.com/jobs?search=AWS", "builtin")
-    mock_bi.assert_called_once_with("https://builtin.com/jobs?search=AWS")
+@patch("worker.handler._http_get")
+def test_board_crawl_state_is_ignored_after_filter_change(
+    mock_get, aws_resources: dict, lambda_context, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Validators recorded under another WORK_TYPE shouldn't skip the board — different jobs pass now."""
+    url = "https://boards-api.greenhouse.io/v1/boards/acme/jobs"
+    board = {"jobs": [_greenhouse_posting("Platform Engineer")]}
+    mock_get.side_effect = [_board_response(board), _board_response(board)]
+    handler(_sqs_event("Acme", url, ats="greenhouse"), lambda_context)
 
+    monkeypatch.setenv("WORK_TYPE", "any")
+    jobs = list(_fetch_greenhouse_jobs(url, _CrawlState(url)))
 
-# --- _fetch_greenhouse_jobs unit tests ---
+    assert [j["title"] for j in jobs] == ["Platform Engineer"]
+    assert not mock_get.call_args.kwargs["headers"]
 
 
-def _greenhouse_posting(title: str, content: str = "") -> dict:
-    return {
-        "title": title,
-        "absolute_url": f"https://job-boards.greenhouse.io/acme/jobs/{title}",
-        "location": {"name": "Remote"},
-        "content": content,
-    }
+@patch("worker.handler._put_new_job", side_effect=RuntimeError("throttled"))
+@patch("worker.handler._http_get")
+def test_board_crawl_state_not_stored_when_record_fails(
+    mock_get, _mock_put, aws_resources: dict, lambda_context
+) -> None:
+    """A company whose writes failed must be crawled in full on redelivery, not skipped as unchanged."""
+    url = "https://boards-api.greenhouse.io/v1/boards/acme/jobs"
+    mock_get.return_value = _board_response({"jobs": [_greenhouse_posting("Platform Engineer")]})
+
+    result = handler(_sqs_event("Acme", url, ats="greenhouse"), lambda_context)
+
+    assert result["batchItemFailures"] == [{"itemIdentifier": "msg-1"}]
+    assert "Item" not in aws_resources["crawl_state_table"].get_item(Key={"board_url": url})
+
+
+@patch("worker.handler._http_get")
+def test_changed_board_only_filters_postings_added_since_snapshot(mock_get, aws_resources: dict) -> None:
+    """Postings already in the last snapshot should skip clearance scanning and writes; only the new one runs."""
+    url = "https://boards-api.greenhouse.io/v1/boards/acme/jobs"
+    first = [_greenhouse_posting("Platform Engineer"), _greenhouse_posting("Cloud Engineer")]
+    second = [_greenhouse_posting("Cloud Engineer"), _greenhouse_posting("Site Reliability Engineer")]
+    mock_get.side_effect = [_board_response({"jobs": first}), _board_response({"jobs": second}, etag='"v2"')]
+    list(_fetch_greenhouse_jobs(url, state := _CrawlState(url)))
+    _store_board_crawl_state(state)
+    stored = aws_resources["crawl_state_table"].get_item(Key={"board_url": url})["Item"]
+
+    with patch("worker.handler._requires_excluded_clearance", return_value=False) as mock_clearance:
+        jobs = list(_fetch_greenhouse_jobs(url, state := _CrawlState(url)))
+    _store_board_crawl_state(state)
+
+    assert [j["title"] for j in jobs] == ["Site Reliability Engineer"]
+    assert all(c.args[0].startswith("Site Reliability Engineer") for c in mock_clearance.call_args_list)
+    assert state.diff_counts() == {"postings_added": 1, "postings_removed": 1, "postings_unchanged": 1}
+    restored = aws_resources["crawl_state_table"].get_item(Key={"board_url": url})["Item"]
+    assert restored["etag"] == '"v2"'
+    # The expiry counts from the last full crawl, so the board is still re-filtered in full weekly.
+    assert restored["expires_at"] == stored["expires_at"]
+
+
+@patch("worker.handler._http_get")
+@patch("worker.handler._http_post")
+def test_fetch_workday_jobs_skips_postings_in_snapshot(mock_post, mock_get, aws_resources: dict) -> None:
+    """A Workday board searched again with the same postings should fetch no descriptions at all."""
+    base_url = "https://acme.wd1.myworkdayjobs.com/acme-careers"
+    postings = [_workday_posting("Platform Engineer", "R001"), _workday_posting("Cloud Engineer", "R002")]
+    _mock_workday_search(mock_post, {"platform": [_workday_page(postings, total=2)]})
+    mock_get.return_value.json.return_value = _workday_job_detail("No clearance required.")
+    mock_get.return_value.raise_for_status.return_value = None
+    assert len(list(_fetch_workday_jobs(base_url, "Acme", state := _CrawlState(base_url)))) == 2
+    _store_board_crawl_state(state)
+    aws_resources["verdicts_table"].delete_item(Key={"job_url": base_url + postings[0]["externalPath"]})
+    mock_get.reset_mock()
 
+    jobs = list(_fetch_workday_jobs(base_url, "Acme", state := _CrawlState(base_url)))
 
-@patch("worker.handler.requests.get")
-def test_fetch_greenhouse_jobs_requests_full_content(mock_get) -> None:
-    """_fetch_greenhouse_jobs should request content=true to get full descriptions for free."""
-    mock_get.return_value.json.return_value = {"jobs": [_greenhouse_posting("Platform Engineer")]}
+    assert jobs == []
+    assert mock_get.call_count == 0
+    assert state.diff_counts() == {"postings_added": 0, "postings_removed": 0, "postings_unchanged": 2}
+
+
+@patch("worker.handler._http_get")
+@patch("worker.handler._http_post")
+def test_fetch_workday_jobs_stops_at_high_water_mark(mock_post, mock_get, aws_resources: dict) -> None:
+    """A search walked again should stop at the page holding its last crawl's newest posting."""
+    base_url = "https://acme.wd1.myworkdayjobs.com/acme-careers"
+    postings = [
+        {**_workday_posting(f"Platform Engineer {i}", f"R{i:03}"), "postedOn": f"Posted {i // 20} Days Ago"}
+        for i in range(60)
+    ]
+    pages = [_workday_page(postings[i : i + 20], total=60) for i in range(0, 60, 20)]
+    _mock_workday_search(mock_post, {"platform": pages})
+    mock_get.return_value.json.return_value = _workday_job_detail("No clearance required.")
     mock_get.return_value.raise_for_status.return_value = None
+    assert len(list(_fetch_workday_jobs(base_url, "Acme", state := _CrawlState(base_url)))) == 60
+    _store_board_crawl_state(state)
 
-    _fetch_greenhouse_jobs("https://boards-api.greenhouse.io/v1/boards/acme/jobs")
+    newest = _workday_posting("Platform Engineer New", "R999")
+    shifted = [newest, *postings]
+    pages = [_workday_page(shifted[i : i + 20], total=61) for i in range(0, 61, 20)]
+    _mock_workday_search(mock_post, {"platform": pages})
+    mock_post.reset_mock()
 
-    assert mock_get.call_args.kwargs["params"] == {"content": "true"}
+    jobs = list(_fetch_workday_jobs(base_url, "Acme", state := _CrawlState(base_url)))
+    _store_board_crawl_state(state)
+
+    assert [j["title"] for j in jobs] == ["Platform Engineer New"]
+    platform_calls = [c for c in mock_post.call_args_list if c.kwargs["json"]["searchText"] == "platform"]
+    assert [c.kwargs["json"]["offset"] for c in platform_calls] == [0]
+    assert state.diff_counts() == {"postings_added": 1, "postings_unchanged": 19}
+    stored = aws_resources["crawl_state_table"].get_item(Key={"board_url": base_url})["Item"]
+    assert stored["high_water"]["platform"]["path"] == newest["externalPath"]
+    # The postings not re-read this time stay in the snapshot.
+    assert len(stored["snapshot"].value) == 61 * 8
+
+
+@patch("worker.handler._http_get")
+@patch("worker.handler._http_post")
+def test_fetch_workday_jobs_keeps_high_water_mark_when_a_page_fails(mock_post, mock_get, aws_resources: dict) -> None:
+    """A search that lost a page should keep its previous mark, so the next crawl reads that page's postings."""
+    base_url = "https://acme.wd1.myworkdayjobs.com/acme-careers"
+    postings = [
+        {**_workday_posting(f"Platform Engineer {i}", f"R{i:03}"), "postedOn": f"Posted {i // 20} Days Ago"}
+        for i in range(60)
+    ]
+    _mock_workday_search(mock_post, {"platform": [_workday_page(postings[i : i + 20], total=60) for i in (0, 20, 40)]})
+    serve = mock_post.side_effect
 
+    def flaky_post(*args, **kwargs):
+        if kwargs["json"]["searchText"] == "platform" and kwargs["json"]["offset"] == 20:
+            raise requests.RequestException("503 Service Unavailable")
+        return serve(*args, **kwargs)
 
-@patch("worker.handler.requests.get")
-def test_fetch_greenhouse_jobs_excludes_high_clearance_description(mock_get) -> None:
-    """_fetch_greenhouse_jobs should drop postings whose description requires a high clearance."""
-    mock_get.return_value.json.return_value = {
-        "jobs": [
-            _greenhouse_posting("Cloud Engineer", content="Must hold an active Top Secret clearance."),
-            _greenhouse_posting("Platform Engineer", content="No clearance required."),
-        ]
-    }
+    mock_post.side_effect = flaky_post
+    mock_get.return_value.json.return_value = _workday_job_detail("No clearance required.")
+    mock_get.return_value.raise_for_status.return_value = None
+    assert len(list(_fetch_workday_jobs(base_url, "Acme", state := _CrawlState(base_url)))) == 40
+    _store_board_crawl_state(state)
+    stored = aws_resources["crawl_state_table"].get_item(Key={"board_url": base_url})["Item"]
+    assert "platform" not in stored.get("high_water", {})
+
+    mock_post.side_effect = serve
+    jobs = list(_fetch_workday_jobs(base_url, "Acme", _CrawlState(base_url)))
+
+    assert sorted(j["title"] for j in jobs) == sorted(p["title"] for p in postings[20:40])
+
+
+@patch("worker.handler._http_get")
+@patch("worker.handler._http_post")
+def test_fetch_workday_jobs_reads_past_mark_on_page_out_of_date_order(mock_post, mock_get, aws_resources: dict) -> None:
+    """A search whose top result stays put (ordered by relevance, not date) shouldn't stop at it as its mark."""
+    base_url = "https://acme.wd1.myworkdayjobs.com/acme-careers"
+    top = {**_workday_posting("Platform Engineer Top", "R100"), "postedOn": "Posted 5 Days Ago"}
+    others = [
+        {**_workday_posting(f"Platform Engineer {i}", f"R{i:03}"), "postedOn": f"Posted {i % 7} Days Ago"}
+        for i in range(39)
+    ]
+    ranked = [top, *others]
+    _mock_workday_search(mock_post, {"platform": [_workday_page(ranked[i : i + 20], total=40) for i in (0, 20)]})
+    mock_get.return_value.json.return_value = _workday_job_detail("No clearance required.")
     mock_get.return_value.raise_for_status.return_value = None
+    assert len(list(_fetch_workday_jobs(base_url, "Acme", state := _CrawlState(base_url)))) == 40
+    _store_board_crawl_state(state)
 
-    jobs = _fetch_greenhouse_jobs("https://boards-api.greenhouse.io/v1/boards/acme/jobs")
+    newest = _workday_posting("Platform Engineer New", "R999")
+    ranked = [*ranked, newest]
+    _mock_workday_search(mock_post, {"platform": [_workday_page(ranked[i : i + 20], total=41) for i in (0, 20, 40)]})
 
-    assert [j["title"] for j in jobs] == ["Platform Engineer"]
+    jobs = list(_fetch_workday_jobs(base_url, "Acme", _CrawlState(base_url)))
 
+    assert [j["title"] for j in jobs] == ["Platform Engineer New"]
 
-@patch("worker.handler.requests.get")
-def test_fetch_greenhouse_jobs_allows_public_trust_description(mock_get) -> None:
-    """_fetch_greenhouse_jobs should keep postings whose description only requires Public Trust."""
-    mock_get.return_value.json.return_value = {
-        "jobs": [_greenhouse_posting("Cloud Engineer", content="Requires a Public Trust clearance.")]
-    }
+
+@patch("worker.handler._http_get")
+@patch("worker.handler._http_post")
+def test_fetch_workday_jobs_reads_past_mark_with_capped_ages(mock_post, mock_get, aws_resources: dict) -> None:
+    """A mark taken from a "Posted 30+ Days Ago" posting says nothing about order, so the next crawl reads on."""
+    base_url = "https://acme.wd1.myworkdayjobs.com/acme-careers"
+    postings = [
+        {**_workday_posting(f"Platform Engineer {i}", f"R{i:03}"), "postedOn": "Posted 30+ Days Ago"} for i in range(40)
+    ]
+    _mock_workday_search(mock_post, {"platform": [_workday_page(postings[i : i + 20], total=40) for i in (0, 20)]})
+    mock_get.return_value.json.return_value = _workday_job_detail("No clearance required.")
     mock_get.return_value.raise_for_status.return_value = None
+    assert len(list(_fetch_workday_jobs(base_url, "Acme", state := _CrawlState(base_url)))) == 40
+    _store_board_crawl_state(state)
+    # Age the stored mark by a day, so a capped age taken at face value would look like the mark's.
+    aws_resources["crawl_state_table"].update_item(
+        Key={"board_url": base_url},
+        UpdateExpression="SET high_water.platform.marked_at = high_water.platform.marked_at - :day",
+        ExpressionAttributeValues={":day": 86400},
+    )
 
-    jobs = _fetch_greenhouse_jobs("https://boards-api.greenhouse.io/v1/boards/acme/jobs")
+    newest = _workday_posting("Platform Engineer New", "R999")
+    ranked = [*postings[:25], newest, *postings[25:]]
+    _mock_workday_search(mock_post, {"platform": [_workday_page(ranked[i : i + 20], total=41) for i in (0, 20, 40)]})
+
+    jobs = list(_fetch_workday_jobs(base_url, "Acme", _CrawlState(base_url)))
+
+    assert [j["title"] for j in jobs] == ["Platform Engineer New"]
 
-    assert [j["title"] for j in jobs] == ["Cloud Engineer"]
+
+def test_workday_page_reaches_mark() -> None:
+    """A newest-first page reaches its mark at the mark's posting or an older one, and says so only if ordered."""
+
+    def page(*posted_on: str) -> list[dict]:
+        return [{"externalPath": f"/job/{i}", "postedOn": text} for i, text in enumerate(posted_on)]
+
+    assert _workday_page_reaches_mark(page("Posted Today", "Posted Yesterday"), "/job/1", 1, None) == (True, 1)
+    # The mark's posting only counts on a page in date order, at the age the mark predicts.
+    assert _workday_page_reaches_mark(page("Posted 5 Days Ago", "Posted Today"), "/job/0", 5, None) == (None, 5)
+    assert _workday_page_reaches_mark(page("Posted Today", "Posted 9 Days Ago"), "/job/1", 2, None) == (None, 9)
+    assert _workday_page_reaches_mark(page("Posted Today", "Posted Yesterday"), "/job/1", None, None) == (None, 1)
+    assert _workday_page_reaches_mark(page("Posted Today", "Posted 3 Days Ago"), "/x", 2, None) == (True, 3)
+    assert _workday_page_reaches_mark(page("Posted Today", "Posted 2 Days Ago"), "/x", 2, None) == (False, 2)
+    assert _workday_page_reaches_mark(page("Posted Today"), "/x", 2, 1) == (None, 1)
+    assert _workday_page_reaches_mark(page("Posted 30+ Days Ago", "Reposted"), "/x", 2, None) == (None, None)
+    # A capped age is unknown, so a page of them can't vouch for a mark that was itself capped.
+    assert _workday_page_reaches_mark(page("Posted 30+ Days Ago"), "/job/0", 31, None) == (None, None)
 
 
 # --- _fetch_workday_jobs unit tests ---
@@ -313,25 +1369,28 @@ def _mock_workday_search(mock_post, keyword_pages: dict) -> None:
     """Wire mock_post.side_effect to return keyword-specific paginated pages.
 
     keyword_pages maps a searchText keyword to a list of page dicts (as
-    produced by _workday_page); any keyword not in the map — i.e. every
-    _TITLE_KEYWORDS entry not under test — gets an empty (0-total) page on
-    its first call, matching a real "no results for this search" response.
+    produced by _workday_page), served by the request's offset since pages
+    of one keyword may be requested concurrently and out of order; any
+    keyword not in the map — i.e. every _TITLE_KEYWORDS entry not under
+    test — gets an empty (0-total) page, matching a real "no results for
+    this search" response. Unless mapped too, the whole-board probe ("")
+    reports a board far too large to scan whole, so the keyword searches run.
     """
-    cursors = {kw: list(pages) for kw, pages in keyword_pages.items()}
 
     def fake_post(*args, **kwargs):
         keyword = kwargs["json"]["searchText"]
+        page_index = kwargs["json"]["offset"] // kwargs["json"]["limit"]
         mock_resp = MagicMock()
         mock_resp.raise_for_status.return_value = None
-        pages = cursors.get(keyword)
-        mock_resp.json.return_value = pages.pop(0) if pages else _workday_page([], total=0)
+        pages = keyword_pages.get(keyword, [_workday_page([], total=10_000)] if keyword == "" else [])
+        mock_resp.json.return_value = pages[page_index] if page_index < len(pages) else _workday_page([], total=0)
         return mock_resp
 
     mock_post.side_effect = fake_post
 
 
-@patch("worker.handler.requests.get")
-@patch("worker.handler.requests.post")
+@patch("worker.handler._http_get")
+@patch("worker.handler._http_post")
 def test_fetch_workday_jobs_single_page(mock_post, mock_get) -> None:
     """_fetch_workday_jobs should normalise postings from a single page of results."""
     _mock_workday_search(
@@ -340,7 +1399,7 @@ def test_fetch_workday_jobs_single_page(mock_post, mock_get) -> None:
     mock_get.return_value.json.return_value = _workday_job_detail("No clearance required.")
     mock_get.return_value.raise_for_status.return_value = None
 
-    jobs = _fetch_workday_jobs("https://acme.wd1.myworkdayjobs.com/acme-careers")
+    jobs = list(_fetch_workday_jobs("https://acme.wd1.myworkdayjobs.com/acme-careers", "Acme"))
 
     assert jobs == [
         {
@@ -349,8 +1408,9 @@ def test_fetch_workday_jobs_single_page(mock_post, mock_get) -> None:
             "location": "Remote",
         }
     ]
-    # One search call per _TITLE_KEYWORDS entry.
-    assert mock_post.call_count == len(_TITLE_KEYWORDS)
+    # The whole-board probe, then one search call per _TITLE_KEYWORDS entry.
+    assert mock_post.call_count == 1 + len(_TITLE_KEYWORDS)
+    assert mock_post.call_args_list[0].kwargs["json"] == {"limit": 20, "offset": 0, "searchText": ""}
     platform_call = next(c for c in mock_post.call_args_list if c.kwargs["json"]["searchText"] == "platform")
     assert platform_call.args[0] == "https://acme.wd1.myworkdayjobs.com/wday/cxs/acme/acme-careers/jobs"
     assert platform_call.kwargs["json"] == {"limit": 20, "offset": 0, "searchText": "platform"}
@@ -360,8 +1420,8 @@ def test_fetch_workday_jobs_single_page(mock_post, mock_get) -> None:
     )
 
 
-@patch("worker.handler.requests.get")
-@patch("worker.handler.requests.post")
+@patch("worker.handler._http_get")
+@patch("worker.handler._http_post")
 def test_fetch_workday_jobs_paginates_across_pages(mock_post, mock_get) -> None:
     """_fetch_workday_jobs should keep requesting pages for a keyword until all its postings are collected."""
     page1 = _workday_page([_workday_posting(f"Platform Engineer {i}", f"R00{i}") for i in range(20)], total=25)
@@ -370,7 +1430,7 @@ def test_fetch_workday_jobs_paginates_across_pages(mock_post, mock_get) -> None:
     mock_get.return_value.json.return_value = _workday_job_detail("No clearance required.")
     mock_get.return_value.raise_for_status.return_value = None
 
-    jobs = _fetch_workday_jobs("https://acme.wd1.myworkdayjobs.com/acme-careers")
+    jobs = list(_fetch_workday_jobs("https://acme.wd1.myworkdayjobs.com/acme-careers", "Acme"))
 
     assert len(jobs) == 25
     platform_calls = [c for c in mock_post.call_args_list if c.kwargs["json"]["searchText"] == "platform"]
@@ -379,8 +1439,8 @@ def test_fetch_workday_jobs_paginates_across_pages(mock_post, mock_get) -> None:
     assert mock_get.call_count == 25
 
 
-@patch("worker.handler.requests.get")
-@patch("worker.handler.requests.post")
+@patch("worker.handler._http_get")
+@patch("worker.handler._http_post")
 def test_fetch_workday_jobs_dedupes_posting_seen_under_multiple_keywords(mock_post, mock_get) -> None:
     """A posting matching more than one keyword search should only be processed (and its
     description fetched) once, not once per matching keyword."""
@@ -395,42 +1455,307 @@ def test_fetch_workday_jobs_dedupes_posting_seen_under_multiple_keywords(mock_po
     mock_get.return_value.json.return_value = _workday_job_detail("No clearance required.")
     mock_get.return_value.raise_for_status.return_value = None
 
-    jobs = _fetch_workday_jobs("https://acme.wd1.myworkdayjobs.com/acme-careers")
+    jobs = list(_fetch_workday_jobs("https://acme.wd1.myworkdayjobs.com/acme-careers", "Acme"))
 
     assert len(jobs) == 1
     assert mock_get.call_count == 1
 
 
+@patch("worker.handler._http_get")
+@patch("worker.handler._http_post")
+def test_fetch_workday_jobs_fetches_one_description_per_requisition(mock_post, mock_get) -> None:
+    """Copies of one requisition posted under several locations should share one description fetch."""
+    copies = [
+        _workday_posting("Platform Engineer", "R001", location) for location in ("Remote", "Remote-TX", "Remote-CA")
+    ]
+    tagged = {**_workday_posting("SRE", "R002-1"), "bulletFields": ["R002"]}
+    tagged_copy = {**_workday_posting("SRE", "R002-2", "Remote-TX"), "bulletFields": ["R002"]}
+    _mock_workday_search(mock_post, {"platform": [_workday_page([*copies, tagged, tagged_copy], total=5)]})
+    mock_get.return_value.json.return_value = _workday_job_detail("Requires TS/SCI clearance.")
+    mock_get.return_value.raise_for_status.return_value = None
+
+    jobs = list(_fetch_workday_jobs("https://acme.wd1.myworkdayjobs.com/acme-careers", "Acme"))
+
+    # Every copy shares its requisition's (excluding) verdict.
+    assert jobs == []
+    assert sorted(c.args[0].rsplit("/", 1)[1] for c in mock_get.call_args_list) == [
+        "Platform-Engineer_R001",
+        "SRE_R002-1",
+    ]
+
+
+@patch("worker.handler._http_get")
+@patch("worker.handler._http_post")
+def test_fetch_workday_jobs_ignores_bullet_fields_that_are_not_the_requisition(mock_post, mock_get) -> None:
+    """Postings sharing a bulletFields value their paths don't carry should each get their own description."""
+    postings = [
+        {**_workday_posting("Platform Engineer", "R010"), "bulletFields": ["Remote"]},
+        {**_workday_posting("Cloud Engineer", "R011"), "bulletFields": ["Remote"]},
+    ]
+    _mock_workday_search(mock_post, {"platform": [_workday_page(postings, total=2)]})
+    mock_get.side_effect = lambda url, **kwargs: MagicMock(
+        json=MagicMock(
+            return_value=_workday_job_detail(
+                "Requires TS/SCI clearance." if "R010" in url else "No clearance required."
+            )
+        )
+    )
+
+    jobs = list(_fetch_workday_jobs("https://acme.wd1.myworkdayjobs.com/acme-careers", "Acme"))
+
+    assert [job["title"] for job in jobs] == ["Cloud Engineer"]
+    assert mock_get.call_count == 2
+
+
+@patch("worker.handler._http_get")
+@patch("worker.handler._http_post")
+def test_fetch_workday_jobs_skips_description_for_listing_filtered_postings(mock_post, mock_get) -> None:
+    """Non-US and non-remote postings should be dropped from listing fields alone, without a description fetch."""
+    _mock_workday_search(
+        mock_post,
+        {
+            "platform": [
+                _workday_page(
+                    [
+                        _workday_posting("Platform Engineer", "R001", location="London, United Kingdom"),
+                        _workday_posting("Platform Engineer", "R002", location="Austin, TX"),
+                        _workday_posting("Platform Engineer", "R003"),
+                    ],
+                    total=3,
+                )
+            ]
+        },
+    )
+    mock_get.return_value.json.return_value = _workday_job_detail("No clearance required.")
+    mock_get.return_value.raise_for_status.return_value = None
+
+    jobs = list(_fetch_workday_jobs("https://acme.wd1.myworkdayjobs.com/acme-careers", "Acme"))
+
+    assert [j["url"].rsplit("_", 1)[1] for j in jobs] == ["R003"]
+    assert mock_get.call_count == 1
+
+
+@patch("worker.handler._http_get")
+@patch("worker.handler._http_post")
+def test_fetch_workday_jobs_uses_cached_description_verdicts(mock_post, mock_get, aws_resources: dict) -> None:
+    """Postings with a cached clearance verdict should be kept or dropped without a description fetch."""
+    base_url = "https://acme.wd1.myworkdayjobs.com/acme-careers"
+    postings = [_workday_posting("Platform Engineer", f"R00{i}") for i in range(3)]
+    _mock_workday_search(mock_post, {"platform": [_workday_page(postings, total=3)]})
+    mock_get.return_value.json.return_value = _workday_job_detail("No clearance required.")
+    mock_get.return_value.raise_for_status.return_value = None
+    expires_at = int(time.time()) + 3600
+    verdicts = aws_resources["verdicts_table"]
+    verdicts.put_item(
+        Item={"job_url": base_url + postings[0]["externalPath"], "excluded": True, "expires_at": expires_at}
+    )
+    verdicts.put_item(
+        Item={"job_url": base_url + postings[1]["externalPath"], "excluded": False, "expires_at": expires_at}
+    )
+
+    jobs = list(_fetch_workday_jobs(base_url, "Acme"))
+
+    assert [j["url"].rsplit("_", 1)[1] for j in jobs] == ["R001", "R002"]
+    assert mock_get.call_count == 1
+    # The freshly fetched verdict is written back for the next container.
+    stored = verdicts.get_item(Key={"job_url": base_url + postings[2]["externalPath"]})["Item"]
+    assert stored["excluded"] is False
+    assert stored["expires_at"] > expires_at
+
+
+@patch("worker.handler._http_get")
+@patch("worker.handler._http_post")
+def test_fetch_workday_jobs_requests_known_offsets_after_first_page(mock_post, mock_get) -> None:
+    """Once a keyword's first page reports its total, every remaining offset should be requested."""
+    pages = [
+        _workday_page([_workday_posting(f"Platform Engineer {i}", f"R{page}{i:02}") for i in range(20)], total=50)
+        for page in range(3)
+    ]
+    _mock_workday_search(mock_post, {"platform": pages})
+    mock_get.return_value.json.return_value = _workday_job_detail("No clearance required.")
+    mock_get.return_value.raise_for_status.return_value = None
+
+    jobs = list(_fetch_workday_jobs("https://acme.wd1.myworkdayjobs.com/acme-careers", "Acme"))
+
+    platform_calls = [c for c in mock_post.call_args_list if c.kwargs["json"]["searchText"] == "platform"]
+    assert sorted(c.kwargs["json"]["offset"] for c in platform_calls) == [0, 20, 40]
+    # Returned in (keyword, offset) order even though later pages may complete out of order.
+    assert [j["url"].rsplit("_", 1)[1] for j in jobs] == [f"R{page}{i:02}" for page in range(3) for i in range(20)]
+
+
+@patch("worker.handler._http_get")
+@patch("worker.handler._http_post")
+def test_fetch_workday_jobs_scans_small_board_whole(mock_post, mock_get) -> None:
+    """A board with fewer remaining pages than keywords should be scanned whole, without keyword searches."""
+    pages = [
+        _workday_page([_workday_posting("Platform Engineer", "R001"), _workday_posting("Accountant", "R002")], total=3),
+        _workday_page([_workday_posting("SRE", "R003")], total=3),
+    ]
+    _mock_workday_search(mock_post, {"": pages})
+    mock_get.return_value.json.return_value = _workday_job_detail("No clearance required.")
+    mock_get.return_value.raise_for_status.return_value = None
+
+    jobs = list(_fetch_workday_jobs("https://acme.wd1.myworkdayjobs.com/acme-careers", "Acme", page_size=2))
+
+    assert [j["title"] for j in jobs] == ["Platform Engineer", "SRE"]
+    assert [c.kwargs["json"] for c in mock_post.call_args_list] == [
+        {"limit": 2, "offset": 0, "searchText": ""},
+        {"limit": 2, "offset": 2, "searchText": ""},
+    ]
+
+
+@patch("worker.handler._http_get")
+@patch("worker.handler._http_post")
+def test_fetch_workday_jobs_full_strategy_scans_large_board(mock_post, mock_get) -> None:
+    """strategy="full" should page through the whole board even when keyword searches would be cheaper."""
+    _mock_workday_search(mock_post, {"": [_workday_page([], total=100)] * 5})
+
+    assert list(_fetch_workday_jobs("https://acme.wd1.myworkdayjobs.com/acme-careers", "Acme", strategy="full")) == []
+    assert {c.kwargs["json"]["searchText"] for c in mock_post.call_args_list} == {""}
+    assert sorted(c.kwargs["json"]["offset"] for c in mock_post.call_args_list) == [0, 20, 40, 60, 80]
+
+
+@patch("worker.handler._http_get")
+@patch("worker.handler._http_post")
+def test_fetch_workday_jobs_falls_back_to_keywords_when_probe_fails(mock_post, mock_get) -> None:
+    """A failed probe should fall back to the keyword searches rather than drop the board."""
+    _mock_workday_search(
+        mock_post, {"platform": [_workday_page([_workday_posting("Platform Engineer", "R001")], total=1)]}
+    )
+    keyword_post = mock_post.side_effect
+
+    def fake_post(*args, **kwargs):
+        if kwargs["json"]["searchText"] == "":
+            raise requests.RequestException("boom")
+        return keyword_post(*args, **kwargs)
+
+    mock_post.side_effect = fake_post
+    mock_get.return_value.json.return_value = _workday_job_detail("No clearance required.")
+    mock_get.return_value.raise_for_status.return_value = None
+
+    jobs = list(_fetch_workday_jobs("https://acme.wd1.myworkdayjobs.com/acme-careers", "Acme"))
+
+    assert [j["title"] for j in jobs] == ["Platform Engineer"]
+    assert mock_post.call_count == 1 + len(_TITLE_KEYWORDS)
+
+
+@patch("worker.handler._http_get")
+@patch("worker.handler._http_post")
+def test_fetch_workday_jobs_runs_keyword_searches_concurrently(
+    mock_post, mock_get, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """_fetch_workday_jobs should overlap keyword searches, up to WORKDAY_SEARCH_CONCURRENCY at once."""
+    monkeypatch.setenv("WORKDAY_SEARCH_CONCURRENCY", "3")
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def fake_post(*args, **kwargs):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        mock_resp = MagicMock()
+        mock_resp.raise_for_status.return_value = None
+        mock_resp.json.return_value = _workday_page([], total=0)
+        return mock_resp
+
+    mock_post.side_effect = fake_post
+
+    jobs = _fetch_workday_jobs("https://acme.wd1.myworkdayjobs.com/acme-careers", "Acme", strategy="keywords")
+    assert list(jobs) == []
+    assert mock_post.call_count == len(_TITLE_KEYWORDS)
+    assert 1 < peak <= 3
+
+
+@patch("worker.handler._http_get")
+@patch("worker.handler._http_post")
+def test_fetch_workday_jobs_skips_description_fetch_for_known_jobs(mock_post, mock_get, aws_resources: dict) -> None:
+    """A posting whose job_id is already in the jobs table should be dropped without a description fetch."""
+    known = _workday_posting("Platform Engineer", "R001")
+    new = _workday_posting("Cloud Engineer", "R002")
+    base_url = "https://acme.wd1.myworkdayjobs.com/acme-careers"
+    aws_resources["table"].put_item(
+        Item={"job_id": _make_job_id("Acme", known["title"], base_url + known["externalPath"])}
+    )
+    _mock_workday_search(mock_post, {"platform": [_workday_page([known, new], total=2)]})
+    mock_get.return_value.json.return_value = _workday_job_detail("No clearance required.")
+    mock_get.return_value.raise_for_status.return_value = None
+
+    jobs = list(_fetch_workday_jobs(base_url, "Acme"))
+
+    assert [j["title"] for j in jobs] == ["Cloud Engineer"]
+    assert mock_get.call_count == 1
+    assert mock_get.call_args.args[0].endswith(new["externalPath"])
+
+
 def test_fetch_workday_jobs_non_workday_url_returns_empty() -> None:
     """_fetch_workday_jobs should return [] and not attempt a request for a non-myworkdayjobs.com URL."""
-    assert _fetch_workday_jobs("https://acme.com/careers") == []
+    assert list(_fetch_workday_jobs("https://acme.com/careers", "Acme")) == []
 
 
-@patch("worker.handler.requests.post")
+@patch("worker.handler._http_post")
 def test_fetch_workday_jobs_request_failure_returns_empty(mock_post) -> None:
     """_fetch_workday_jobs should return [] when the HTTP request raises."""
     mock_post.side_effect = requests.RequestException("boom")
 
-    jobs = _fetch_workday_jobs("https://acme.wd1.myworkdayjobs.com/acme-careers")
+    jobs = list(_fetch_workday_jobs("https://acme.wd1.myworkdayjobs.com/acme-careers", "Acme"))
 
     assert jobs == []
 
 
-@patch("worker.handler.requests.get")
-@patch("worker.handler.requests.post")
+@patch("worker.handler._http_get")
+@patch("worker.handler._http_post")
 def test_fetch_workday_jobs_skips_irrelevant_titles_without_description_fetch(mock_post, mock_get) -> None:
     """_fetch_workday_jobs should never fetch a description for a title that isn't relevant."""
     mock_post.return_value.json.return_value = _workday_page([_workday_posting("Store Associate", "R001")], total=1)
     mock_post.return_value.raise_for_status.return_value = None
 
-    jobs = _fetch_workday_jobs("https://acme.wd1.myworkdayjobs.com/acme-careers")
+    jobs = list(_fetch_workday_jobs("https://acme.wd1.myworkdayjobs.com/acme-careers", "Acme"))
 
     assert jobs == []
     mock_get.assert_not_called()
 
 
-@patch("worker.handler.requests.get")
-@patch("worker.handler.requests.post")
+@patch("worker.handler._http_get")
+@patch("worker.handler._http_post")
+def test_fetch_workday_jobs_fetches_descriptions_concurrently_up_to_limit(
+    mock_post, mock_get, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """_fetch_workday_jobs should overlap description fetches, but never exceed WORKDAY_DESCRIPTION_CONCURRENCY."""
+    monkeypatch.setenv("WORKDAY_DESCRIPTION_CONCURRENCY", "3")
+    postings = [_workday_posting(f"Platform Engineer {i}", f"R00{i}") for i in range(10)]
+    _mock_workday_search(mock_post, {"platform": [_workday_page(postings, total=10)]})
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def fake_get(*args, **kwargs):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        mock_resp = MagicMock()
+        mock_resp.raise_for_status.return_value = None
+        mock_resp.json.return_value = _workday_job_detail("No clearance required.")
+        return mock_resp
+
+    mock_get.side_effect = fake_get
+
+    jobs = list(_fetch_workday_jobs("https://acme.wd1.myworkdayjobs.com/acme-careers", "Acme"))
+
+    assert [j["title"] for j in jobs] == [f"Platform Engineer {i}" for i in range(10)]
+    assert 1 < peak <= 3
+
+
+@patch("worker.handler._http_get")
+@patch("worker.handler._http_post")
 def test_fetch_workday_jobs_excludes_high_clearance_description(mock_post, mock_get) -> None:
     """_fetch_workday_jobs should drop a posting whose description requires a high clearance,
     even when the title itself gives no indication (the real CACI bug this guards against)."""
@@ -441,13 +1766,13 @@ def test_fetch_workday_jobs_excludes_high_clearance_description(mock_post, mock_
     mock_get.return_value.json.return_value = _workday_job_detail("Minimum Clearance Required to Start: TS/SCI")
     mock_get.return_value.raise_for_status.return_value = None
 
-    jobs = _fetch_workday_jobs("https://acme.wd1.myworkdayjobs.com/acme-careers")
+    jobs = list(_fetch_workday_jobs("https://acme.wd1.myworkdayjobs.com/acme-careers", "Acme"))
 
     assert jobs == []
 
 
-@patch("worker.handler.requests.get")
-@patch("worker.handler.requests.post")
+@patch("worker.handler._http_get")
+@patch("worker.handler._http_post")
 def test_fetch_workday_jobs_allows_public_trust_description(mock_post, mock_get) -> None:
     """_fetch_workday_jobs should keep a posting whose description only requires Public Trust."""
     mock_post.return_value.json.return_value = _workday_page([_workday_posting("Cloud Engineer", "R001")], total=1)
@@ -455,20 +1780,20 @@ def test_fetch_workday_jobs_allows_public_trust_description(mock_post, mock_get)
     mock_get.return_value.json.return_value = _workday_job_detail("Requires a Public Trust clearance.")
     mock_get.return_value.raise_for_status.return_value = None
 
-    jobs = _fetch_workday_jobs("https://acme.wd1.myworkdayjobs.com/acme-careers")
+    jobs = list(_fetch_workday_jobs("https://acme.wd1.myworkdayjobs.com/acme-careers", "Acme"))
 
     assert len(jobs) == 1
 
 
-@patch("worker.handler.requests.get")
-@patch("worker.handler.requests.post")
+@patch("worker.handler._http_get")
+@patch("worker.handler._http_post")
 def test_fetch_workday_jobs_description_fetch_failure_falls_back_to_title(mock_post, mock_get) -> None:
     """_fetch_workday_jobs should keep a relevant, clean-titled posting even if the detail fetch fails."""
     mock_post.return_value.json.return_value = _workday_page([_workday_posting("Platform Engineer", "R001")], total=1)
     mock_post.return_value.raise_for_status.return_value = None
     mock_get.side_effect = requests.RequestException("boom")
 
-    jobs = _fetch_workday_jobs("https://acme.wd1.myworkdayjobs.com/acme-careers")
+    jobs = list(_fetch_workday_jobs("https://acme.wd1.myworkdayjobs.com/acme-careers", "Acme"))
 
     assert len(jobs) == 1
 
@@ -514,15 +1839,17 @@ def _mock_builtin_gets(mock_get, pages: list[str], description: str = "No cleara
 
     Search-page requests carry a "page" key in their params kwarg; job-detail
     requests (_fetch_builtin_job_description) don't pass params at all, so
-    responses are dispatched based on that.
+    responses are dispatched based on that. Pages are served by number,
+    since a full crawl requests several at once; every page past the last
+    one is empty.
     """
-    responses = list(pages) + [_builtin_page_html([])]
 
     def fake_get(*args, **kwargs):
         mock_resp = MagicMock()
         mock_resp.raise_for_status.return_value = None
-        if kwargs.get("params", {}).get("page"):
-            mock_resp.text = responses.pop(0) if len(responses) > 1 else responses[0]
+        page = kwargs.get("params", {}).get("page")
+        if page:
+            mock_resp.text = pages[page - 1] if page <= len(pages) else _builtin_page_html([])
         else:
             mock_resp.text = f"<html><body>{description}</body></html>"
         return mock_resp
@@ -530,7 +1857,7 @@ def _mock_builtin_gets(mock_get, pages: list[str], description: str = "No cleara
     mock_get.side_effect = fake_get
 
 
-@patch("worker.handler.requests.get")
+@patch("worker.handler._http_get")
 def test_fetch_builtin_jobs_single_page(mock_get, aws_resources: dict) -> None:
     """_fetch_builtin_jobs should normalise job cards, including a per-job company key."""
     _mock_builtin_gets(
@@ -542,7 +1869,7 @@ def test_fetch_builtin_jobs_single_page(mock_get, aws_resources: dict) -> None:
         ],
     )
 
-    jobs = _fetch_builtin_jobs("https://builtin.com/jobs?search=AWS")
+    jobs = list(_fetch_builtin_jobs("https://builtin.com/jobs?search=AWS"))
 
     assert jobs == [
         {
@@ -553,11 +1880,12 @@ def test_fetch_builtin_jobs_single_page(mock_get, aws_resources: dict) -> None:
         }
     ]
     assert mock_get.call_args_list[0].kwargs["params"] == {"page": 1}
-    # Second call is the description fetch for the one relevant-titled posting.
-    assert mock_get.call_args_list[1].args[0] == "https://builtin.com/job/senior-platform-engineer/123"
+    # The only other request is the description fetch for the one relevant-titled posting.
+    description_calls = [c for c in mock_get.call_args_list if "params" not in c.kwargs]
+    assert [c.args[0] for c in description_calls] == ["https://builtin.com/job/senior-platform-engineer/123"]
 
 
-@patch("worker.handler.requests.get")
+@patch("worker.handler._http_get")
 def test_fetch_builtin_jobs_paginates_until_empty_page(mock_get, aws_resources: dict) -> None:
     """_fetch_builtin_jobs should keep requesting pages until one comes back with no job cards."""
     _mock_builtin_gets(
@@ -568,15 +1896,136 @@ def test_fetch_builtin_jobs_paginates_until_empty_page(mock_get, aws_resources:
         ],
     )
 
-    jobs = _fetch_builtin_jobs("https://builtin.com/jobs?search=AWS")
+    jobs = list(_fetch_builtin_jobs("https://builtin.com/jobs?search=AWS"))
 
     assert len(jobs) == 2
     search_calls = [c for c in mock_get.call_args_list if c.kwargs.get("params", {}).get("page")]
-    pages = [c.kwargs["params"]["page"] for c in search_calls]
-    assert pages == [1, 2, 3]
+    pages = sorted(c.kwargs["params"]["page"] for c in search_calls)
+    # Pages are fetched ahead BUILTIN_PAGE_CONCURRENCY (4) at a time, so at
+    # most three are requested past the empty page 3.
+    assert pages[:3] == [1, 2, 3]
+    assert pages[-1] <= 6
+
+
+@patch("worker.handler._http_get")
+def test_fetch_builtin_jobs_stops_at_page_of_known_postings(mock_get, aws_resources: dict) -> None:
+    """Once the search has a snapshot, paging should stop at the first page with nothing new on it."""
+    url = "https://builtin.com/jobs?search=AWS"
+    cards = [
+        _builtin_card_html(f"Platform Engineer {i}", f"/job/platform-engineer/{i}", "Acme", "Remote") for i in range(6)
+    ]
+    pages = [_builtin_page_html(cards[i : i + 2]) for i in range(0, 6, 2)]
+    _mock_builtin_gets(mock_get, pages)
+    assert len(list(_fetch_builtin_jobs(url, state := _CrawlState(url)))) == 6
+    _store_board_crawl_state(state)
+
+    new_card = _builtin_card_html("Platform Engineer New", "/job/platform-engineer/new", "Acme", "Remote")
+    shifted = [new_card, *cards]
+    _mock_builtin_gets(mock_get, [_builtin_page_html(shifted[i : i + 2]) for i in range(0, 7, 2)])
+    mock_get.reset_mock()
+
+    jobs = list(_fetch_builtin_jobs(url, state := _CrawlState(url)))
+    _store_board_crawl_state(state)
+
+    assert [j["title"] for j in jobs] == ["Platform Engineer New"]
+    search_calls = [c for c in mock_get.call_args_list if c.kwargs.get("params", {}).get("page")]
+    assert [c.kwargs["params"]["page"] for c in search_calls] == [1, 2]
+    assert state.diff_counts() == {"postings_added": 1, "postings_unchanged": 3}
+    stored = aws_resources["crawl_state_table"].get_item(Key={"board_url": url})["Item"]
+    assert len(stored["snapshot"].value) == 7 * 8
+
+
+@patch("worker.handler._http_get")
+def test_fetch_builtin_jobs_stores_no_state_when_a_page_fails(mock_get, aws_resources: dict) -> None:
+    """A crawl cut short by a failed page shouldn't let the next crawl stop before the pages it never read."""
+    url = "https://builtin.com/jobs?search=AWS"
+    cards = [
+        _builtin_card_html(f"Platform Engineer {i}", f"/job/platform-engineer/{i}", "Acme", "Remote") for i in range(6)
+    ]
+    _mock_builtin_gets(mock_get, [_builtin_page_html(cards[i : i + 2]) for i in range(0, 6, 2)])
+    assert len(list(_fetch_builtin_jobs(url, state := _CrawlState(url)))) == 6
+    _store_board_crawl_state(state)
+
+    new_cards = [
+        _builtin_card_html(f"Platform Engineer New {i}", f"/job/platform-engineer/new-{i}", "Acme", "Remote")
+        for i in range(4)
+    ]
+    shifted = [*new_cards, *cards]
+    _mock_builtin_gets(mock_get, [_builtin_page_html(shifted[i : i + 2]) for i in range(0, 10, 2)])
+    serve = mock_get.side_effect
+
+    def flaky_get(*args, **kwargs):
+        if kwargs.get("params", {}).get("page") == 2:
+            raise requests.RequestException("503 Service Unavailable")
+        return serve(*args, **kwargs)
+
+    mock_get.side_effect = flaky_get
+    assert len(list(_fetch_builtin_jobs(url, state := _CrawlState(url)))) == 2
+    _store_board_crawl_state(state)
+
+    mock_get.side_effect = serve
+    jobs = list(_fetch_builtin_jobs(url, _CrawlState(url)))
+
+    assert {"Platform Engineer New 2", "Platform Engineer New 3"} <= {j["title"] for j in jobs}
+
+
+def test_builtin_page_jobs_parses_saved_search_page() -> None:
+    """The streaming card parser should read every card of a saved search page, dropping the one without a company."""
+    jobs = _builtin_page_jobs((FIXTURES / "builtin_search_page.html").read_text())
+
+    assert len(jobs) == 24
+    assert jobs[0] == {
+        "title": "Product Designer",
+        "url": "https://builtin.com/job/product-designer/4000000",
+        "location": "Remote, USA (Remote)",
+        "company": "Cobalt Health",
+    }
+    assert not [j for j in jobs if j["url"].endswith("/4000007")]
+
+
+def test_builtin_description_text_matches_full_tree_text() -> None:
+    """The streaming description text should equal a full BeautifulSoup tree's text with the page chrome removed."""
+    html = (FIXTURES / "builtin_job_page.html").read_text()
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup(["script", "style", "noscript", "header", "footer", "nav"]):
+        tag.decompose()
+
+    text = _builtin_description_text(html)
+
+    assert text == soup.get_text(separator=" ", strip=True)
+    assert "Ability to obtain a Public Trust clearance" in text
+    assert "window.__dl" not in text and "Software Jobs" not in text
+
 
+def test_parse_pool_parses_in_worker_processes() -> None:
+    """A _ParsePool should parse concurrent callers' pages in its workers, and parse in-thread once one dies."""
+    html = (FIXTURES / "builtin_search_page.html").read_text()
+    expected = _builtin_card_fields(html)
+    pool = _ParsePool(2)
+    try:
+        with ThreadPoolExecutor(max_workers=4) as callers:
+            assert list(callers.map(lambda _: pool.run(_builtin_card_fields, html), range(4))) == [expected] * 4
+        assert not pool.broken
 
-@patch("worker.handler.requests.get")
+        pool._workers[0].kill()
+        pool._workers[0].join()
+        # Two calls in a row check out both workers, the dead one included.
+        assert [pool.run(_builtin_card_fields, html) for _ in range(2)] == [expected] * 2
+        assert pool.broken
+    finally:
+        pool.close()
+
+
+def test_parse_processes_is_capped_at_vcpus(monkeypatch: pytest.MonkeyPatch) -> None:
+    """BUILTIN_PARSE_PROCESSES should be "auto" for one process per vCPU, or a count no higher than that."""
+    monkeypatch.setattr("worker.handler.os.cpu_count", lambda: 6)
+    assert _parse_processes() == 0
+    for setting, expected in [("auto", 6), ("3", 3), ("32", 6), ("0", 0)]:
+        monkeypatch.setenv("BUILTIN_PARSE_PROCESSES", setting)
+        assert _parse_processes() == expected
+
+
+@patch("worker.handler._http_get")
 def test_fetch_builtin_jobs_skips_known_companies(mock_get, aws_resources: dict) -> None:
     """_fetch_builtin_jobs should drop jobs whose company is already tracked in companies.json."""
     _seed_companies(aws_resources["companies_table"], "Datadog")
@@ -592,12 +2041,12 @@ def test_fetch_builtin_jobs_skips_known_companies(mock_get, aws_resources: dict)
         ],
     )
 
-    jobs = _fetch_builtin_jobs("https://builtin.com/jobs?search=AWS")
+    jobs = list(_fetch_builtin_jobs("https://builtin.com/jobs?search=AWS"))
 
     assert [j["company"] for j in jobs] == ["Some New Startup"]
 
 
-@patch("worker.handler.requests.get")
+@patch("worker.handler._http_get")
 def test_fetch_builtin_jobs_skips_known_companies_by_substring(mock_get, aws_resources: dict) -> None:
     """_fetch_builtin_jobs should match tracked companies even with a differing display name."""
     _seed_companies(aws_resources["companies_table"], "CACI International")
@@ -606,22 +2055,153 @@ def test_fetch_builtin_jobs_skips_known_companies_by_substring(mock_get, aws_res
         [_builtin_page_html([_builtin_card_html("Cloud Engineer", "/job/cloud-engineer/1", "CACI", "Remote")])],
     )
 
-    jobs = _fetch_builtin_jobs("https://builtin.com/jobs?search=AWS")
+    jobs = list(_fetch_builtin_jobs("https://builtin.com/jobs?search=AWS"))
+
+    assert jobs == []
+
+
+def test_known_company_index_matches_differing_display_names() -> None:
+    """_KnownCompanyIndex should ignore corporate suffixes and match on whole leading words only."""
+    index = _KnownCompanyIndex.from_names(
+        ["CACI International", "Coinbase", "Booz Allen Hamilton", "Dropbox", "Home Depot", "Washington Post"]
+    )
+
+    assert index.matches("CACI")
+    assert index.matches("Coinbase Global, Inc.")
+    assert index.matches("coinbase")
+    assert index.matches("Booz Allen")
+    assert index.matches("CACI Federal")
+    assert index.matches("The Home Depot")
+    assert index.matches("The Washington Post")
+    assert not index.matches("Box")
+    assert not index.matches("Allen Hamilton")
+    assert not index.matches("Inc.")
+    assert _company_name_key("Global") == ("global",)
+    assert _company_name_key("The Group") == ("group",)
+
+
+def test_known_company_index_follows_scan_pages(aws_resources: dict, monkeypatch: pytest.MonkeyPatch) -> None:
+    """_known_company_index should read every page of a paginated companies table scan."""
+    pages = [
+        {"Items": [{"company_name": "Datadog"}], "LastEvaluatedKey": {"company_name": "Datadog"}},
+        {"Items": [{"company_name": "Coinbase"}]},
+    ]
+    scan = MagicMock(side_effect=pages)
+    monkeypatch.setattr("worker.handler.dynamodb.meta.client.scan", scan)
+
+    index = _known_company_index()
+
+    assert index.matches("Datadog") and index.matches("Coinbase")
+    assert scan.call_args_list[1].kwargs["ExclusiveStartKey"] == {"company_name": "Datadog"}
+
+
+def test_known_company_index_is_cached_until_ttl(aws_resources: dict, monkeypatch: pytest.MonkeyPatch) -> None:
+    """_known_company_index should reuse its index across calls, and rescan the table once it expires."""
+    now = [1000.0]
+    monkeypatch.setattr("worker.handler.time.monotonic", lambda: now[0])
+    _seed_companies(aws_resources["companies_table"], "Datadog")
+    assert not _known_company_index().matches("Coinbase")
+
+    _seed_companies(aws_resources["companies_table"], "Coinbase")
+    now[0] += _KNOWN_COMPANIES_TTL_SECONDS - 1
+    assert not _known_company_index().matches("Coinbase")
+
+    now[0] += 1
+    assert _known_company_index().matches("Coinbase")
+
+
+@patch("worker.handler._http_get")
+def test_fetch_builtin_jobs_skips_description_fetch_for_known_jobs(mock_get, aws_resources: dict) -> None:
+    """_fetch_builtin_jobs should drop a posting already in the jobs table without fetching its description."""
+    aws_resources["table"].put_item(
+        Item={"job_id": _make_job_id("Acme", "Platform Engineer", "https://builtin.com/job/platform-engineer/1")}
+    )
+    _mock_builtin_gets(
+        mock_get,
+        [_builtin_page_html([_builtin_card_html("Platform Engineer", "/job/platform-engineer/1", "Acme", "Remote")])],
+    )
+
+    jobs = list(_fetch_builtin_jobs("https://builtin.com/jobs?search=AWS"))
 
     assert jobs == []
+    assert all(c.kwargs.get("params", {}).get("page") for c in mock_get.call_args_list)
 
 
-@patch("worker.handler.requests.get")
+@patch("worker.handler._http_get")
 def test_fetch_builtin_jobs_request_failure_returns_empty(mock_get, aws_resources: dict) -> None:
     """_fetch_builtin_jobs should return [] when the HTTP request raises."""
     mock_get.side_effect = requests.RequestException("boom")
 
-    jobs = _fetch_builtin_jobs("https://builtin.com/jobs?search=AWS")
+    jobs = list(_fetch_builtin_jobs("https://builtin.com/jobs?search=AWS"))
 
     assert jobs == []
 
 
-@patch("worker.handler.requests.get")
+@patch("worker.handler._http_get")
+def test_fetch_builtin_jobs_reuses_description_verdicts_across_searches(mock_get, aws_resources: dict) -> None:
+    """A posting checked by one search should not have its description fetched again by the next."""
+    card = _builtin_card_html("Cloud Engineer", "/job/cloud-engineer/1", "Acme", "Remote")
+    _mock_builtin_gets(mock_get, [_builtin_page_html([card])], description="Requires an active TS/SCI clearance.")
+    assert list(_fetch_builtin_jobs("https://builtin.com/jobs?search=AWS")) == []
+    detail_calls = [c for c in mock_get.call_args_list if not c.kwargs.get("params")]
+    assert len(detail_calls) == 1
+
+    mock_get.reset_mock()
+    _mock_builtin_gets(mock_get, [_builtin_page_html([card])], description="Requires an active TS/SCI clearance.")
+    assert list(_fetch_builtin_jobs("https://builtin.com/jobs?search=Platform")) == []
+
+    assert [c for c in mock_get.call_args_list if not c.kwargs.get("params")] == []
+
+
+def test_cached_description_verdicts_ignores_expired_and_normalises_urls(aws_resources: dict) -> None:
+    """Expired verdicts should read as missing, and URLs should match regardless of query string."""
+    verdicts = aws_resources["verdicts_table"]
+    now = int(time.time())
+    verdicts.put_item(Item={"job_url": "https://builtin.com/job/1", "excluded": True, "expires_at": now + 3600})
+    verdicts.put_item(Item={"job_url": "https://builtin.com/job/2", "excluded": True, "expires_at": now - 1})
+    jobs = [
+        {"title": "Platform Engineer", "url": "https://builtin.com/job/1?utm_source=search"},
+        {"title": "Platform Engineer", "url": "https://builtin.com/job/2"},
+        {"title": "Platform Engineer", "url": "https://builtin.com/job/3"},
+    ]
+
+    assert _cached_description_verdicts(jobs) == [True, None, None]
+
+
+def test_store_description_verdicts_writes_in_batches(aws_resources: dict) -> None:
+    """Verdicts should be written across several BatchWriteItem requests, one item per canonical URL."""
+    verdicts = [(f"https://builtin.com/job/{i}", i % 2 == 0, "No clearance required.") for i in range(30)]
+    verdicts.append(("https://builtin.com/job/0?utm_source=search", True, "No clearance required."))
+
+    _store_description_verdicts(verdicts)
+
+    items = aws_resources["verdicts_table"].scan()["Items"]
+    assert len(items) == 30
+    assert _cached_description_verdicts([{"title": "SRE", "url": "https://builtin.com/job/1"}]) == [False]
+
+
+@patch("worker.handler._http_get")
+def test_fetch_builtin_jobs_keeps_earlier_pages_when_a_later_page_fails(mock_get, aws_resources: dict) -> None:
+    """A page that still fails after retries should end the crawl without losing the pages before it."""
+    page1 = _builtin_page_html([_builtin_card_html("Platform Engineer", "/job/platform-engineer/1", "Acme", "Remote")])
+
+    def fake_get(*args, **kwargs):
+        page = kwargs.get("params", {}).get("page")
+        if page and page > 1:
+            raise requests.RequestException("503 Service Unavailable")
+        mock_resp = MagicMock()
+        mock_resp.raise_for_status.return_value = None
+        mock_resp.text = page1 if page else "<html><body>No clearance required.</body></html>"
+        return mock_resp
+
+    mock_get.side_effect = fake_get
+
+    jobs = list(_fetch_builtin_jobs("https://builtin.com/jobs?search=AWS"))
+
+    assert [j["title"] for j in jobs] == ["Platform Engineer"]
+
+
+@patch("worker.handler._http_get")
 def test_fetch_builtin_jobs_skips_irrelevant_titles_without_description_fetch(mock_get, aws_resources: dict) -> None:
     """_fetch_builtin_jobs should never fetch a description for a title that isn't relevant."""
     _mock_builtin_gets(
@@ -629,7 +2209,7 @@ def test_fetch_builtin_jobs_skips_irrelevant_titles_without_description_fetch(mo
         [_builtin_page_html([_builtin_card_html("Store Associate", "/job/store-associate/1", "Acme", "Remote")])],
     )
 
-    jobs = _fetch_builtin_jobs("https://builtin.com/jobs?search=AWS")
+    jobs = list(_fetch_builtin_jobs("https://builtin.com/jobs?search=AWS"))
 
     assert jobs == []
     # Every call made should be a paginated search-page call; none should be
@@ -637,7 +2217,7 @@ def test_fetch_builtin_jobs_skips_irrelevant_titles_without_description_fetch(mo
     assert all(c.kwargs.get("params", {}).get("page") for c in mock_get.call_args_list)
 
 
-@patch("worker.handler.requests.get")
+@patch("worker.handler._http_get")
 def test_fetch_builtin_jobs_skips_non_matching_location_without_description_fetch(
     mock_get, aws_resources: dict
 ) -> None:
@@ -647,13 +2227,13 @@ def test_fetch_builtin_jobs_skips_non_matching_location_without_description_fetc
         [_builtin_page_html([_builtin_card_html("Platform Engineer", "/job/platform-engineer/1", "Acme", "Hybrid")])],
     )
 
-    jobs = _fetch_builtin_jobs("https://builtin.com/jobs?search=AWS")
+    jobs = list(_fetch_builtin_jobs("https://builtin.com/jobs?search=AWS"))
 
     assert jobs == []
     assert all(c.kwargs.get("params", {}).get("page") for c in mock_get.call_args_list)
 
 
-@patch("worker.handler.requests.get")
+@patch("worker.handler._http_get")
 def test_fetch_builtin_jobs_keeps_remote_by_default(mock_get, aws_resources: dict) -> None:
     """_fetch_builtin_jobs should keep a Remote job under the default (location-blank) config."""
     _mock_builtin_gets(
@@ -661,12 +2241,12 @@ def test_fetch_builtin_jobs_keeps_remote_by_default(mock_get, aws_resources: dic
         [_builtin_page_html([_builtin_card_html("Platform Engineer", "/job/platform-engineer/1", "Acme", "Remote")])],
     )
 
-    jobs = _fetch_builtin_jobs("https://builtin.com/jobs?search=AWS")
+    jobs = list(_fetch_builtin_jobs("https://builtin.com/jobs?search=AWS"))
 
     assert len(jobs) == 1
 
 
-@patch("worker.handler.requests.get")
+@patch("worker.handler._http_get")
 def test_fetch_builtin_jobs_keeps_remote_shown_via_separate_workplace_badge(mock_get, aws_resources: dict) -> None:
     """A card whose geography badge says "USA" (not "remote") but whose separate
     work-model badge says "Remote" must still be kept under the default config.
@@ -685,12 +2265,12 @@ def test_fetch_builtin_jobs_keeps_remote_shown_via_separate_workplace_badge(mock
         ],
     )
 
-    jobs = _fetch_builtin_jobs("https://builtin.com/jobs?search=AWS")
+    jobs = list(_fetch_builtin_jobs("https://builtin.com/jobs?search=AWS"))
 
     assert len(jobs) == 1
 
 
-@patch("worker.handler.requests.get")
+@patch("worker.handler._http_get")
 def test_fetch_builtin_jobs_drops_non_remote_by_default(mock_get, aws_resources: dict) -> None:
     """_fetch_builtin_jobs should drop a specific-city job under the default (location-blank) config."""
     _mock_builtin_gets(
@@ -702,12 +2282,12 @@ def test_fetch_builtin_jobs_drops_non_remote_by_default(mock_get, aws_resources:
         ],
     )
 
-    jobs = _fetch_builtin_jobs("https://builtin.com/jobs?search=AWS")
+    jobs = list(_fetch_builtin_jobs("https://builtin.com/jobs?search=AWS"))
 
     assert jobs == []
 
 
-@patch("worker.handler.requests.get")
+@patch("worker.handler._http_get")
 def test_fetch_builtin_jobs_respects_custom_location_env(mock_get, aws_resources: dict, monkeypatch) -> None:
     """_fetch_builtin_jobs should keep a job in a specific place when BUILTIN_LOCATION is configured."""
     monkeypatch.setenv("BUILTIN_LOCATION", "Reston, VA")
@@ -720,12 +2300,12 @@ def test_fetch_builtin_jobs_respects_custom_location_env(mock_get, aws_resources
         ],
     )
 
-    jobs = _fetch_builtin_jobs("https://builtin.com/jobs?search=AWS")
+    jobs = list(_fetch_builtin_jobs("https://builtin.com/jobs?search=AWS"))
 
     assert len(jobs) == 1
 
 
-@patch("worker.handler.requests.get")
+@patch("worker.handler._http_get")
 def test_fetch_builtin_jobs_respects_custom_work_type_env(mock_get, aws_resources: dict, monkeypatch) -> None:
     """_fetch_builtin_jobs should honor a custom BUILTIN_WORK_TYPE env var."""
     monkeypatch.setenv("BUILTIN_LOCATION", "")
@@ -735,12 +2315,12 @@ def test_fetch_builtin_jobs_respects_custom_work_type_env(mock_get, aws_resource
         [_builtin_page_html([_builtin_card_html("Platform Engineer", "/job/platform-engineer/1", "Acme", "Hybrid")])],
     )
 
-    jobs = _fetch_builtin_jobs("https://builtin.com/jobs?search=AWS")
+    jobs = list(_fetch_builtin_jobs("https://builtin.com/jobs?search=AWS"))
 
     assert len(jobs) == 1
 
 
-@patch("worker.handler.requests.get")
+@patch("worker.handler._http_get")
 def test_fetch_builtin_jobs_excludes_high_clearance_description(mock_get, aws_resources: dict) -> None:
     """_fetch_builtin_jobs should drop a posting whose description requires a high clearance,
     even when the title itself gives no indication."""
@@ -750,12 +2330,12 @@ def test_fetch_builtin_jobs_excludes_high_clearance_description(mock_get, aws_re
         description="CLEARANCE TYPE: Top Secret",
     )
 
-    jobs = _fetch_builtin_jobs("https://builtin.com/jobs?search=AWS")
+    jobs = list(_fetch_builtin_jobs("https://builtin.com/jobs?search=AWS"))
 
     assert jobs == []
 
 
-@patch("worker.handler.requests.get")
+@patch("worker.handler._http_get")
 def test_fetch_builtin_jobs_allows_public_trust_description(mock_get, aws_resources: dict) -> None:
     """_fetch_builtin_jobs should keep a posting whose description only requires Public Trust."""
     _mock_builtin_gets(
@@ -764,12 +2344,12 @@ def test_fetch_builtin_jobs_allows_public_trust_description(mock_get, aws_resour
         description="Requires a Public Trust clearance.",
     )
 
-    jobs = _fetch_builtin_jobs("https://builtin.com/jobs?search=AWS")
+    jobs = list(_fetch_builtin_jobs("https://builtin.com/jobs?search=AWS"))
 
     assert len(jobs) == 1
 
 
-@patch("worker.handler.requests.get")
+@patch("worker.handler._http_get")
 def test_fetch_builtin_jobs_description_fetch_failure_falls_back_to_title(mock_get, aws_resources: dict) -> None:
     """_fetch_builtin_jobs should keep a relevant, clean-titled posting even if the detail fetch fails."""
     page = _builtin_page_html([_builtin_card_html("Platform Engineer", "/job/platform-engineer/1", "Acme", "Remote")])
@@ -785,18 +2365,22 @@ def test_fetch_builtin_jobs_description_fetch_failure_falls_back_to_title(mock_g
 
     mock_get.side_effect = fake_get
 
-    jobs = _fetch_builtin_jobs("https://builtin.com/jobs?search=AWS")
+    jobs = list(_fetch_builtin_jobs("https://builtin.com/jobs?search=AWS"))
 
     assert len(jobs) == 1
 
 
-# --- _filter_relevant_jobs unit tests ---
+# --- _iter_relevant_jobs unit tests ---
 
 
 def _job(title: str, location: str = "Remote") -> dict:
     return {"title": title, "url": f"https://example.com/{title}", "location": location}
 
 
+def _relevant_jobs(jobs: list[dict]) -> list[dict]:
+    return list(_iter_relevant_jobs(jobs, _listing_skip_counts()))
+
+
 @pytest.mark.parametrize(
     "title",
     [
@@ -815,8 +2399,8 @@ def _job(title: str, location: str = "Remote") -> dict:
     ],
 )
 def test_filter_passes_relevant_titles(title: str) -> None:
-    """_filter_relevant_jobs should keep titles matching a target keyword."""
-    result = _filter_relevant_jobs([_job(title)], "Acme")
+    """_iter_relevant_jobs should keep titles matching a target keyword."""
+    result = _relevant_jobs([_job(title)])
     assert len(result) == 1
 
 
@@ -832,8 +2416,8 @@ def test_filter_passes_relevant_titles(title: str) -> None:
     ],
 )
 def test_filter_drops_irrelevant_titles(title: str) -> None:
-    """_filter_relevant_jobs should drop titles that don't match any keyword."""
-    result = _filter_relevant_jobs([_job(title)], "Acme")
+    """_iter_relevant_jobs should drop titles that don't match any keyword."""
+    result = _relevant_jobs([_job(title)])
     assert len(result) == 0
 
 
@@ -848,8 +2432,8 @@ def test_filter_drops_irrelevant_titles(title: str) -> None:
     ],
 )
 def test_filter_drops_management_titles_despite_keyword_match(title: str) -> None:
-    """_filter_relevant_jobs should drop management/leadership titles even if they match a target keyword."""
-    result = _filter_relevant_jobs([_job(title)], "Acme")
+    """_iter_relevant_jobs should drop management/leadership titles even if they match a target keyword."""
+    result = _relevant_jobs([_job(title)])
     assert len(result) == 0
 
 
@@ -865,14 +2449,14 @@ def test_filter_drops_management_titles_despite_keyword_match(title: str) -> Non
     ],
 )
 def test_filter_drops_clearance_gated_titles(title: str) -> None:
-    """_filter_relevant_jobs should drop titles indicating a clearance above Public Trust."""
-    result = _filter_relevant_jobs([_job(title)], "Acme")
+    """_iter_relevant_jobs should drop titles indicating a clearance above Public Trust."""
+    result = _relevant_jobs([_job(title)])
     assert len(result) == 0
 
 
 def test_filter_keeps_public_trust_titles() -> None:
-    """_filter_relevant_jobs should keep titles that only require a Public Trust clearance."""
-    result = _filter_relevant_jobs([_job("Cloud Engineer (Public Trust)")], "Acme")
+    """_iter_relevant_jobs should keep titles that only require a Public Trust clearance."""
+    result = _relevant_jobs([_job("Cloud Engineer (Public Trust)")])
     assert len(result) == 1
 
 
@@ -891,8 +2475,8 @@ def test_filter_keeps_public_trust_titles() -> None:
     ],
 )
 def test_filter_drops_non_us_locations(location: str) -> None:
-    """_filter_relevant_jobs should drop jobs whose location indicates a non-US posting."""
-    result = _filter_relevant_jobs([_job("Platform Engineer", location=location)], "Acme")
+    """_iter_relevant_jobs should drop jobs whose location indicates a non-US posting."""
+    result = _relevant_jobs([_job("Platform Engineer", location=location)])
     assert len(result) == 0
 
 
@@ -908,30 +2492,30 @@ def test_filter_drops_non_us_locations(location: str) -> None:
     ],
 )
 def test_filter_keeps_ambiguous_or_us_locations(location: str, monkeypatch: pytest.MonkeyPatch) -> None:
-    """_filter_relevant_jobs should keep US and ambiguous (no country signal) locations.
+    """_iter_relevant_jobs should keep US and ambiguous (no country signal) locations.
 
     WORK_TYPE=any disables the separate remote/hybrid/office filter so this
     test isolates the non-US location check specifically.
     """
     monkeypatch.setenv("WORK_TYPE", "any")
-    result = _filter_relevant_jobs([_job("Platform Engineer", location=location)], "Acme")
+    result = _relevant_jobs([_job("Platform Engineer", location=location)])
     assert len(result) == 1
 
 
 def test_filter_drops_non_remote_jobs_by_default() -> None:
-    """_filter_relevant_jobs should drop a non-Built-In job whose location isn't remote by default."""
-    result = _filter_relevant_jobs([_job("Platform Engineer", location="Arlington, VA")], "Acme")
+    """_iter_relevant_jobs should drop a non-Built-In job whose location isn't remote by default."""
+    result = _relevant_jobs([_job("Platform Engineer", location="Arlington, VA")])
     assert result == []
 
 
 def test_filter_keeps_remote_jobs_by_default() -> None:
-    """_filter_relevant_jobs should keep a non-Built-In job whose location is remote."""
-    result = _filter_relevant_jobs([_job("Platform Engineer", location="Remote")], "Acme")
+    """_iter_relevant_jobs should keep a non-Built-In job whose location is remote."""
+    result = _relevant_jobs([_job("Platform Engineer", location="Remote")])
     assert len(result) == 1
 
 
 def test_filter_exempts_builtin_jobs_from_work_type_check() -> None:
-    """_filter_relevant_jobs should not apply LOCATION/WORK_TYPE to jobs carrying their own "company" key.
+    """_iter_relevant_jobs should not apply LOCATION/WORK_TYPE to jobs carrying their own "company" key.
 
     Built In jobs set this key (see _fetch_builtin_jobs) and are already
     filtered by their own independent BUILTIN_LOCATION/BUILTIN_WORK_TYPE
@@ -944,21 +2528,21 @@ def test_filter_exempts_builtin_jobs_from_work_type_check() -> None:
         "location": "Arlington, VA",
         "company": "ZS",
     }
-    result = _filter_relevant_jobs([job], "Built In - AWS Search")
+    result = _relevant_jobs([job])
     assert len(result) == 1
 
 
 def test_filter_respects_custom_work_type_env(monkeypatch: pytest.MonkeyPatch) -> None:
-    """_filter_relevant_jobs should honor a custom WORK_TYPE for non-Built-In jobs."""
+    """_iter_relevant_jobs should honor a custom WORK_TYPE for non-Built-In jobs."""
     monkeypatch.setenv("WORK_TYPE", "hybrid")
-    result = _filter_relevant_jobs([_job("Platform Engineer", location="Hybrid")], "Acme")
+    result = _relevant_jobs([_job("Platform Engineer", location="Hybrid")])
     assert len(result) == 1
-    result = _filter_relevant_jobs([_job("Platform Engineer", location="Remote")], "Acme")
+    result = _relevant_jobs([_job("Platform Engineer", location="Remote")])
     assert result == []
 
 
 def test_filter_mixed_batch_keeps_only_matches() -> None:
-    """_filter_relevant_jobs should keep only the matching subset of a mixed list."""
+    """_iter_relevant_jobs should keep only the matching subset of a mixed list."""
     jobs = [
         _job("Platform Engineer"),
         _job("Software Engineer"),
@@ -966,15 +2550,56 @@ def test_filter_mixed_batch_keeps_only_matches() -> None:
         _job("Product Manager"),
         _job("Senior Manager, Platform Engineering"),
     ]
-    result = _filter_relevant_jobs(jobs, "Acme")
+    result = _relevant_jobs(jobs)
     assert len(result) == 2
     titles = {j["title"] for j in result}
     assert titles == {"Platform Engineer", "DevOps Engineer"}
 
 
+def test_iter_relevant_jobs_counts_each_stage() -> None:
+    """_iter_relevant_jobs should count every dropped job against the first stage it failed."""
+    jobs = [
+        _job("Platform Engineer"),
+        _job("Product Designer"),
+        _job("Platform Engineering Manager"),
+        _job("Platform Engineer (TS/SCI)"),
+        _job("Platform Engineer", location="London, UK"),
+        _job("Platform Engineer", location="Austin, TX"),
+    ]
+    skipped = _listing_skip_counts()
+
+    result = list(_iter_relevant_jobs(jobs, skipped))
+
+    assert result == [jobs[0]]
+    assert skipped == {"title": 1, "excluded_title": 1, "title_clearance": 1, "non_us": 1, "work_type": 1}
+
+
+def test_location_filter_config_is_compiled_once_per_env_value(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The LOCATION/WORK_TYPE config should be reused until the env vars change."""
+    monkeypatch.setenv("WORK_TYPE", "Hybrid")
+    hybrid = _location_filter_config()
+    assert _location_filter_config() is hybrid
+    assert hybrid.work_type_keywords == ("hybrid",)
+
+    monkeypatch.setenv("WORK_TYPE", "remote")
+    assert _location_filter_config() is not hybrid
+
+
+def test_classify_location_memoizes_repeated_locations() -> None:
+    """Filtering many jobs sharing a location should classify that location only once."""
+    _classify_location.cache_clear()
+    jobs = [_job(f"Platform Engineer {i}", location="Remote - US") for i in range(50)]
+
+    with patch("worker.handler._is_non_us_location", wraps=_is_non_us_location) as mock_non_us:
+        result = _relevant_jobs(jobs)
+
+    assert len(result) == 50
+    assert mock_non_us.call_count == 1
+
+
 def test_filter_empty_input_returns_empty() -> None:
-    """_filter_relevant_jobs should handle an empty input list gracefully."""
-    assert _filter_relevant_jobs([], "Acme") == []
+    """_iter_relevant_jobs should handle an empty input list gracefully."""
+    assert _relevant_jobs([]) == []
 
 
 # --- _requires_excluded_clearance unit tests ---
@@ -1037,6 +2662,60 @@ def test_requires_excluded_clearance_still_catches_real_polygraph_mention() -> N
     assert _requires_excluded_clearance("Must be willing to submit to a polygraph examination.") is True
 
 
+def _naive_requires_excluded_clearance(text: str) -> bool:
+    """Reference implementation: one substring scan per keyword, as before the compiled matcher."""
+    text_lower = text.lower()
+    for phrase in _CLEARANCE_FALSE_POSITIVE_PHRASES:
+        text_lower = text_lower.replace(phrase, "")
+    if any(kw in text_lower for kw in _HIGH_CLEARANCE_KEYWORDS):
+        return True
+    if "public trust" in text_lower:
+        return False
+    if any(phrase in text_lower for phrase in _NO_CLEARANCE_PHRASES):
+        return False
+    return any(kw in text_lower for kw in _GENERIC_CLEARANCE_KEYWORDS)
+
+
+_CLEARANCE_PHRASES = [
+    *_HIGH_CLEARANCE_KEYWORDS,
+    *_GENERIC_CLEARANCE_KEYWORDS,
+    *_NO_CLEARANCE_PHRASES,
+    *_CLEARANCE_FALSE_POSITIVE_PHRASES,
+    "public trust",
+]
+
+
+def test_requires_excluded_clearance_matches_naive_scan_for_every_phrase_pair() -> None:
+    """The single-pass matcher should agree with per-keyword scanning on every phrase and pair of phrases.
+
+    Covers overlapping phrases (e.g. "security clearance is not required"
+    contains both a generic and a no-clearance phrase), anchors that prefix
+    each other ("poly"/"polygraph") and mixed case.
+    """
+    texts = [f"Role details: {a.upper()} and {b}." for a in _CLEARANCE_PHRASES for b in _CLEARANCE_PHRASES]
+    texts += [f"{a}{b}" for a in _CLEARANCE_PHRASES for b in _CLEARANCE_PHRASES]
+    texts += [
+        "Security clearance is not required.",
+        "Employee Polygraph Protection Act notice; no polygraph required.",
+        "Employee Polygraph Protection Act",
+        "employee polygraph protection actclearance",
+        "",
+    ]
+    for text in texts:
+        assert _requires_excluded_clearance(text) is _naive_requires_excluded_clearance(text), text
+
+
+def test_listing_filter_title_stages_match_naive_scan() -> None:
+    """The compiled title stages should agree with per-keyword scanning, including keywords inside words."""
+    titles = [f"Senior {kw.title()}" for kw in _TITLE_KEYWORDS]
+    titles += [f"{kw} {ex}" for kw in _TITLE_KEYWORDS for ex in _EXCLUDE_TITLE_KEYWORDS]
+    titles += ["Staff DevOps Engineering Manager", "Account Executive", "Platform"]
+    for title in titles:
+        lower = title.lower()
+        expected = any(kw in lower for kw in _TITLE_KEYWORDS) and not any(kw in lower for kw in _EXCLUDE_TITLE_KEYWORDS)
+        assert (_listing_filter_stage({"title": title}, None) is None) is expected, title
+
+
 # --- _is_non_us_location unit tests ---
 
 
@@ -1082,97 +2761,97 @@ def test_is_non_us_location_false(location: str) -> None:
     assert _is_non_us_location(location) is False
 
 
-# --- _builtin_location_matches unit tests ---
+# --- _builtin_filter_config unit tests ---
 
 
 @pytest.mark.parametrize(
     "location",
     ["Remote", "Remote - USA", "Fully Distributed", "Anywhere in the US"],
 )
-def test_builtin_location_matches_default_remote(location: str) -> None:
-    """_builtin_location_matches should keep remote jobs under the default BUILTIN_WORK_TYPE."""
-    assert _builtin_location_matches(location) is True
+def test_builtin_filter_config_matches_default_remote(location: str) -> None:
+    """The BUILTIN_LOCATION / BUILTIN_WORK_TYPE config should keep remote jobs under the default BUILTIN_WORK_TYPE."""
+    assert _builtin_filter_config().matches(location) is True
 
 
 @pytest.mark.parametrize("location", ["Reston, VA", "Arlington, VA", "Hybrid", "New York, NY", "", "In-Office"])
-def test_builtin_location_matches_default_excludes_non_remote_locations(location: str) -> None:
-    """_builtin_location_matches should drop any non-remote location by default (location match is disabled)."""
-    assert _builtin_location_matches(location) is False
+def test_builtin_filter_config_matches_default_excludes_non_remote_locations(location: str) -> None:
+    """The Built In filter config should drop any non-remote location by default (location match is disabled)."""
+    assert _builtin_filter_config().matches(location) is False
 
 
-def test_builtin_location_matches_custom_location_env(monkeypatch: pytest.MonkeyPatch) -> None:
-    """_builtin_location_matches should honor a custom BUILTIN_LOCATION."""
+def test_builtin_filter_config_matches_custom_location_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The BUILTIN_LOCATION / BUILTIN_WORK_TYPE config should honor a custom BUILTIN_LOCATION."""
     monkeypatch.setenv("BUILTIN_LOCATION", "Austin, TX")
     monkeypatch.setenv("BUILTIN_WORK_TYPE", "any")
-    assert _builtin_location_matches("Austin, TX, USA") is True
+    assert _builtin_filter_config().matches("Austin, TX, USA") is True
 
 
-def test_builtin_location_matches_custom_work_type_env(monkeypatch: pytest.MonkeyPatch) -> None:
-    """_builtin_location_matches should honor a custom BUILTIN_WORK_TYPE."""
+def test_builtin_filter_config_matches_custom_work_type_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The BUILTIN_LOCATION / BUILTIN_WORK_TYPE config should honor a custom BUILTIN_WORK_TYPE."""
     monkeypatch.setenv("BUILTIN_LOCATION", "")
     monkeypatch.setenv("BUILTIN_WORK_TYPE", "hybrid")
-    assert _builtin_location_matches("Hybrid") is True
-    assert _builtin_location_matches("Remote") is False
+    assert _builtin_filter_config().matches("Hybrid") is True
+    assert _builtin_filter_config().matches("Remote") is False
 
 
-def test_builtin_location_matches_work_type_any_matches_everything(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_builtin_filter_config_matches_work_type_any_matches_everything(monkeypatch: pytest.MonkeyPatch) -> None:
     """BUILTIN_WORK_TYPE=any should disable the work-type half of the check."""
     monkeypatch.setenv("BUILTIN_LOCATION", "")
     monkeypatch.setenv("BUILTIN_WORK_TYPE", "any")
-    assert _builtin_location_matches("Wherever, XY") is True
+    assert _builtin_filter_config().matches("Wherever, XY") is True
 
 
-def test_builtin_location_matches_is_case_insensitive(monkeypatch: pytest.MonkeyPatch) -> None:
-    """_builtin_location_matches should match regardless of case."""
-    assert _builtin_location_matches("REMOTE") is True
+def test_builtin_filter_config_matches_is_case_insensitive(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The BUILTIN_LOCATION / BUILTIN_WORK_TYPE config should match regardless of case."""
+    assert _builtin_filter_config().matches("REMOTE") is True
 
     monkeypatch.setenv("BUILTIN_LOCATION", "Reston, VA")
-    assert _builtin_location_matches("reston, va") is True
+    assert _builtin_filter_config().matches("reston, va") is True
 
 
-def test_builtin_location_matches_any_with_no_location_ignores_blank(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_builtin_filter_config_matches_any_with_no_location_ignores_blank(monkeypatch: pytest.MonkeyPatch) -> None:
     """BUILTIN_WORK_TYPE=any with no BUILTIN_LOCATION should disable the check entirely, blank location included."""
     monkeypatch.setenv("BUILTIN_LOCATION", "")
     monkeypatch.setenv("BUILTIN_WORK_TYPE", "any")
-    assert _builtin_location_matches("") is True
+    assert _builtin_filter_config().matches("") is True
 
 
-# --- _location_matches unit tests ---
+# --- _location_filter_config unit tests ---
 
 
 @pytest.mark.parametrize(
     "location",
     ["Remote", "Remote - USA", "Fully Distributed", "Anywhere in the US"],
 )
-def test_location_matches_default_remote(location: str) -> None:
-    """_location_matches should keep remote jobs under the default WORK_TYPE."""
-    assert _location_matches(location) is True
+def test_location_filter_config_matches_default_remote(location: str) -> None:
+    """The LOCATION / WORK_TYPE config should keep remote jobs under the default WORK_TYPE."""
+    assert _location_filter_config().matches(location) is True
 
 
 @pytest.mark.parametrize("location", ["Reston, VA", "Arlington, VA", "Hybrid", "New York, NY", "", "In-Office"])
-def test_location_matches_default_excludes_non_remote_locations(location: str) -> None:
-    """_location_matches should drop any non-remote location by default (location match is disabled)."""
-    assert _location_matches(location) is False
+def test_location_filter_config_matches_default_excludes_non_remote_locations(location: str) -> None:
+    """The LOCATION / WORK_TYPE config should drop any non-remote location by default (location match is disabled)."""
+    assert _location_filter_config().matches(location) is False
 
 
-def test_location_matches_custom_location_env(monkeypatch: pytest.MonkeyPatch) -> None:
-    """_location_matches should honor a custom LOCATION, independent of BUILTIN_LOCATION."""
+def test_location_filter_config_matches_custom_location_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The LOCATION / WORK_TYPE config should honor a custom LOCATION, independent of BUILTIN_LOCATION."""
     monkeypatch.setenv("LOCATION", "Reston, VA")
     monkeypatch.setenv("WORK_TYPE", "any")
-    assert _location_matches("Reston, VA, USA") is True
+    assert _location_filter_config().matches("Reston, VA, USA") is True
 
 
-def test_location_matches_custom_work_type_env(monkeypatch: pytest.MonkeyPatch) -> None:
-    """_location_matches should honor a custom WORK_TYPE, independent of BUILTIN_WORK_TYPE."""
+def test_location_filter_config_matches_custom_work_type_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The LOCATION / WORK_TYPE config should honor a custom WORK_TYPE, independent of BUILTIN_WORK_TYPE."""
     monkeypatch.setenv("WORK_TYPE", "hybrid")
-    assert _location_matches("Hybrid") is True
-    assert _location_matches("Remote") is False
+    assert _location_filter_config().matches("Hybrid") is True
+    assert _location_filter_config().matches("Remote") is False
 
 
-def test_location_matches_is_independent_of_builtin_env_vars(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_location_filter_config_matches_is_independent_of_builtin_env_vars(monkeypatch: pytest.MonkeyPatch) -> None:
     """LOCATION/WORK_TYPE and BUILTIN_LOCATION/BUILTIN_WORK_TYPE should be entirely independent settings."""
     monkeypatch.setenv("BUILTIN_LOCATION", "Reston, VA")
     monkeypatch.setenv("BUILTIN_WORK_TYPE", "any")
-    # LOCATION/WORK_TYPE are untouched, so _location_matches still uses its own defaults.
-    assert _location_matches("Reston, VA, USA") is False
-    assert _location_matches("Remote") is True
+    # LOCATION/WORK_TYPE are untouched, so their config still uses its own defaults.
+    assert _location_filter_config().matches("Reston, VA, USA") is False
+    assert _location_filter_config().matches("Remote") is True
@@ -1,10 +1,16 @@
 """Worker Lambda handler.
 
-Triggered by SQS. Each message contains a company name, careers URL, and
-optional ATS type. Dispatches to the appropriate ATS handler to fetch and
-parse job listings, applies a keyword filter, then writes new postings to
-the DynamoDB `jobs` table. Deduplication is achieved by hashing
-company+title+url as the DynamoDB partition key (job_id).
+Triggered by SQS. Each message contains a company name, careers URL,
+optional ATS type, and optional per-backend ats_options (e.g. Greenhouse
+departments/offices to narrow the fetch to). The messages of one batch are
+processed concurrently, and each failed message is reported back
+individually (batchItemFailures), so only the companies that failed are
+redelivered. Dispatches to the appropriate ATS handler to fetch and parse
+job listings, applies a keyword filter, then writes new postings to the
+DynamoDB `jobs` table. The three stages stream: each ATS handler is a
+generator, and jobs are filtered and written as they're parsed.
+Deduplication is achieved by hashing company+title+url as the DynamoDB
+partition key (job_id).
 
 ATS backends:
     greenhouse - JSON API
@@ -20,6 +26,15 @@ Environment variables expected:
     JOBS_TABLE      - DynamoDB table name for job postings
     COMPANIES_TABLE - DynamoDB table name for tracked companies (used by the
                        builtin ATS backend to skip already-tracked companies)
+    DESCRIPTION_CACHE_TABLE - DynamoDB table of clearance verdicts for already
+                       fetched job descriptions, shared across containers
+                       (optional; unset disables the shared cache)
+    CRAWL_STATE_TABLE - DynamoDB table of each board's state after its last
+                       complete crawl — HTTP validators (ETag and
+                       Last-Modified) for Greenhouse/Lever, and a snapshot of
+                       posting fingerprints for every backend — used to skip
+                       unchanged boards and postings (optional; unset always
+                       crawls and filters in full)
     LOCATION          - Location substring to additionally keep for every ATS
                          backend except builtin (defaults to "" — disabled,
                          i.e. remote-only)
@@ -30,36 +45,240 @@ Environment variables expected:
                          — independent setting (defaults to "" — disabled)
     BUILTIN_WORK_TYPE - Same as WORK_TYPE, but for the builtin ATS backend only
                          — independent setting (defaults to "remote")
+    WORKDAY_DESCRIPTION_CONCURRENCY - Max concurrent description fetches per
+                         Workday tenant (defaults to 8, capped at the per-host
+                         HTTP connection pool size)
+    WORKDAY_SEARCH_CONCURRENCY - Max concurrent keyword-search page requests
+                         per Workday tenant (defaults to 4, same cap; 1 runs
+                         the searches one page at a time)
+    BUILTIN_PAGE_CONCURRENCY - Max concurrent page requests per Built In
+                         search — search pages during a full crawl, and job
+                         pages for descriptions (defaults to 4, same cap; 1
+                         fetches one page at a time)
+    BUILTIN_PARSE_PROCESSES - Worker processes that Built In pages are parsed
+                         in: "auto" for one per vCPU, or a count, capped at
+                         the vCPU count (defaults to 0 — parsed in the
+                         fetching threads)
+    RESPONSE_CACHE_TTL_SECONDS - How long a successful ATS response is served
+                         from the on-disk response cache instead of being
+                         re-downloaded (defaults to 3600; 0 disables it)
+    RESPONSE_CACHE_PATH - SQLite file backing that cache (defaults to
+                         /tmp/worker-response-cache.sqlite3)
 """
 
 from __future__ import annotations
 
+import codecs
 import hashlib
 import json
+import multiprocessing
 import os
+import queue
+import random
 import re
+import sqlite3
+import threading
+import time
+import zlib
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from functools import cache, lru_cache
+from html.parser import HTMLParser
+from multiprocessing.connection import Connection
 from typing import Any
+from urllib.parse import urlsplit
 
 import boto3
 import requests
 from aws_lambda_powertools import Logger
-from bs4 import BeautifulSoup
-from bs4.element import Tag
+from botocore.exceptions import BotoCoreError, ClientError
+from requests.adapters import HTTPAdapter
+from requests.utils import get_encoding_from_headers
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
 logger = Logger(service="worker")
 
 dynamodb = boto3.resource("dynamodb")
 
+_GREENHOUSE_BOARD_RE = re.compile(r"^(https://boards-api\.greenhouse\.io/v1/boards/[^/?#]+)")
 _WORKDAY_URL_RE = re.compile(r"^https://([^./]+)\.(wd\d+)\.myworkdayjobs\.com/([^/?#]+)")
+# Postings per Workday search page, and the most an ats_options
+# "page_size" override may ask for.
 _WORKDAY_PAGE_SIZE = 20
+_WORKDAY_MAX_PAGE_SIZE = 100
 _WORKDAY_MAX_JOBS_PER_KEYWORD = 1000
+# A Workday search result's postedOn, e.g. "Posted Today", "Posted 3 Days
+# Ago" or "Posted 30+ Days Ago" (see _workday_posted_days_ago).
+_WORKDAY_POSTED_ON_RE = re.compile(r"^posted\s+(?:(today)|(yesterday)|(\d+)(\+)?\s+days?\s+ago)$", re.IGNORECASE)
+# Workday crawl plans an ats_options "strategy" may force (see
+# _fetch_workday_jobs); "auto" picks one per tenant from a probe request.
+_WORKDAY_STRATEGIES = ("auto", "full", "keywords")
+# Default for WORKDAY_DESCRIPTION_CONCURRENCY — how many description fetches
+# run at once against a single Workday tenant (see _fetch_workday_jobs).
+_WORKDAY_DEFAULT_DESCRIPTION_CONCURRENCY = 8
+# Default for WORKDAY_SEARCH_CONCURRENCY — how many keyword-search pages are
+# in flight at once against a single Workday tenant.
+_WORKDAY_DEFAULT_SEARCH_CONCURRENCY = 4
+
+# BatchGetItem's per-request key limit, and how many times to re-request
+# UnprocessedKeys (throttled keys) before giving up on them — see
+# _known_job_flags. BatchWriteItem's per-request item limit, whose
+# UnprocessedItems get the same number of attempts.
+_DYNAMODB_BATCH_GET_LIMIT = 100
+_DYNAMODB_BATCH_GET_ATTEMPTS = 4
+_DYNAMODB_BATCH_WRITE_LIMIT = 25
+# How long a description's clearance verdict is reused from
+# DESCRIPTION_CACHE_TABLE before the description is fetched and checked
+# again (see _cached_description_verdicts). Enforced by the table's TTL.
+_DESCRIPTION_VERDICT_TTL_SECONDS = 7 * 24 * 3600
+# How long a board's state in CRAWL_STATE_TABLE can vouch for it, counted
+# from the last crawl that started without one (see _CrawlState). Once it
+# expires the board is crawled and filtered in full again, so filter changes
+# shipped in code still reach boards and postings that never change.
+_CRAWL_STATE_TTL_SECONDS = 7 * 24 * 3600
+# Bytes of each posting fingerprint in a board snapshot (see
+# _posting_fingerprint), and the most postings a snapshot holds — 40,000
+# fingerprints is 320 KB, under DynamoDB's 400 KB item size limit. Larger
+# boards are stored without one and so are filtered in full every time.
+_SNAPSHOT_FINGERPRINT_BYTES = 8
+_SNAPSHOT_MAX_POSTINGS = 40_000
+# How many conditional put_item calls _put_new_jobs keeps in flight at once.
+_DYNAMODB_WRITE_CONCURRENCY = 8
+# Max jobs buffered between the fetch/filter stage and the DynamoDB writers
+# (see _put_new_jobs): the fetcher is paused once this many writes are in
+# flight, so memory stays flat however large a board is.
+_DYNAMODB_WRITE_BUFFER_SIZE = 4 * _DYNAMODB_WRITE_CONCURRENCY
+
+# Lever postings API paging (skip/limit), and the most pages one board is
+# read to — 10,000 postings, well past any real board.
+_LEVER_PAGE_SIZE = 100
+_LEVER_MAX_PAGES = 100
+# ats_options keys passed through to the Lever postings API as query filters.
+_LEVER_FILTER_OPTIONS = ("team", "department", "location", "commitment")
 
 _BUILTIN_BASE_URL = "https://builtin.com"
 _BUILTIN_MAX_PAGES = 15
+# Built In job card badges read by _BuiltinCards: the field each one's text
+# goes to, by the class of the Font Awesome icon next to it.
+_BUILTIN_BADGE_ICONS = {"fa-location-dot": "geo", "fa-house-building": "workplace"}
+# HTML elements that never have an end tag, so never stay open.
+_HTML_VOID_ELEMENTS = frozenset(
+    {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+)
+# Elements whose text is left out of a Built In job description (see
+# _BuiltinDescriptionText).
+_BUILTIN_DESCRIPTION_SKIP_TAGS = frozenset({"script", "style", "noscript", "header", "footer", "nav"})
+# Default for BUILTIN_PAGE_CONCURRENCY — how many search pages a full crawl
+# of one Built In search, or how many job pages its description fetches,
+# keep in flight at once (see _fetch_builtin_jobs).
+_BUILTIN_DEFAULT_PAGE_CONCURRENCY = 4
+# Default for BUILTIN_PARSE_PROCESSES (see _builtin_parse).
+_BUILTIN_DEFAULT_PARSE_PROCESSES = "0"
+# How long a warm container reuses its index of COMPANIES_TABLE's names
+# before scanning the table again (see _known_company_index).
+_KNOWN_COMPANIES_TTL_SECONDS = 15 * 60
+# Words dropped from the end of a company name before it's matched against
+# the tracked ones (see _company_name_key): legal-entity and corporate-group
+# suffixes that Built In and companies.json disagree on, e.g. "Coinbase
+# Global, Inc." vs "Coinbase".
+_COMPANY_NAME_SUFFIXES = frozenset(
+    {
+        "ag",
+        "co",
+        "company",
+        "corp",
+        "corporation",
+        "gmbh",
+        "global",
+        "group",
+        "holdings",
+        "inc",
+        "incorporated",
+        "international",
+        "limited",
+        "llc",
+        "lp",
+        "ltd",
+        "plc",
+    }
+)
+# Words dropped from the start of a company name, e.g. Built In's "The Home
+# Depot" vs companies.json's "Home Depot".
+_COMPANY_NAME_PREFIXES = frozenset({"a", "an", "the"})
+_COMPANY_NAME_WORD_RE = re.compile(r"[a-z0-9]+")
+
+_HTTP_TIMEOUT = 30
+# How long before the Lambda deadline handler stops waiting on the batch's
+# records and reports the unfinished ones for redelivery — enough to log
+# and return, so a timeout never fails the whole batch.
+_HANDLER_DEADLINE_MARGIN_SECONDS = 15
+# Upper bound on simultaneously open keep-alive connections per host. Sized
+# to comfortably cover the worker's own concurrency against a single host, so
+# parallel requests reuse pooled connections instead of opening (and then
+# discarding) extra ones.
+_HTTP_POOL_MAXSIZE = 16
+# Only connection-level failures are retried by urllib3 — a 30s read
+# timeout is not worth paying twice. Throttling and gateway errors are
+# retried by _http_request instead, which can honour Retry-After and slow
+# the whole host down rather than just the one request (so urllib3's own
+# Retry-After handling, which would retry 429/503 by itself, is off).
+_HTTP_RETRY = Retry(
+    total=2,
+    connect=2,
+    read=0,
+    backoff_factor=0.5,
+    allowed_methods=None,
+    raise_on_status=False,
+    respect_retry_after_header=False,
+)
+# Responses _http_request retries; any other status (4xx responses won't
+# change on retry) goes straight to the caller's raise_for_status, as does
+# the last attempt's response once _HTTP_MAX_ATTEMPTS is used up.
+_HTTP_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+_HTTP_MAX_ATTEMPTS = 4
+# Full-jitter exponential backoff: attempt n waits uniform(0, base * 2**n)
+# seconds. The max also caps how long a Retry-After header is honoured, so
+# one overloaded host can't eat the invocation's whole timeout.
+_HTTP_BACKOFF_BASE = 0.5
+_HTTP_BACKOFF_MAX = 20.0
+# Sustained requests/second and burst allowed per host, per container (see
+# _HostRateLimiter). The burst matches the connection pool, so a fully
+# concurrent fan-out against one host starts without waiting.
+_HTTP_RATE_PER_HOST = 20.0
+_HTTP_BURST_PER_HOST = _HTTP_POOL_MAXSIZE
+
+# On-disk response cache (see _cached_response). /tmp persists for the life
+# of a warm container; the size bound (of compressed bodies) keeps it well
+# inside Lambda's default 512 MB of ephemeral storage.
+_RESPONSE_CACHE_DEFAULT_PATH = "/tmp/worker-response-cache.sqlite3"
+_RESPONSE_CACHE_DEFAULT_TTL_SECONDS = 3600
+_RESPONSE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Bytes read from the network at a time when a Greenhouse or Lever board is
+# parsed incrementally (see _iter_json_array) — comfortably more than one
+# posting, so an element rarely needs more than one retry to decode.
+_JSON_STREAM_CHUNK_SIZE = 64 * 1024
+_JSON_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+_JSON_DECODER = json.JSONDecoder()
+# ACCEPT_ENCODING advertises br/zstd only when urllib3 can actually decode
+# them (i.e. the optional brotli/zstandard packages are installed).
+_HTTP_DEFAULT_HEADERS = {
+    "Accept-Encoding": ACCEPT_ENCODING,
+    "Accept": "application/json, text/html;q=0.9, */*;q=0.8",
+}
+
+# Distinct location strings whose classification (see _classify_location)
+# is memoized per container. Boards repeat a handful of strings ("Remote -
+# US", "McLean, VA", ...) across thousands of postings.
+_LOCATION_CACHE_SIZE = 4096
 
 # Defaults for the LOCATION/WORK_TYPE and BUILTIN_LOCATION/BUILTIN_WORK_TYPE
-# env var pairs (see _location_matches / _builtin_location_matches). Kept
+# env var pairs (see _location_filter_config / _builtin_filter_config). Kept
 # deliberately independent: Built In is a broad discovery search where
 # remote-only is a sensible default, while the curated company list includes
 # companies chosen for their proximity to a specific future location (e.g.
@@ -77,6 +296,95 @@ _WORK_TYPE_KEYWORDS = {
     "office": ["in-office", "in office", "on-site", "onsite"],
 }
 
+
+def _trie_pattern(words: list[str]) -> str:
+    """Build a regex alternation for words with shared prefixes factored out.
+
+    e.g. ["poly", "polygraph", "public"] -> "p(?:oly(?:graph)?|ublic)". The
+    regex engine then tests each text position against one branch per
+    distinct next character instead of every word in turn, and the greedy
+    optional groups make it prefer the longest word at a given position.
+    """
+    trie: dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+@dataclass(frozen=True)
+class _KeywordMatcher:
+    """Case-insensitive substring matcher over several named keyword classes.
+
+    Built once at import by _compile_keyword_matcher. Rather than scanning
+    the text once per keyword, it scans once for a small set of anchor
+    words (each keyword's longest word, compiled into one _trie_pattern
+    regex) and only verifies the full keywords registered under an anchor
+    where that anchor actually occurs — which, in a job description, is
+    rarely and in few places. Keeps plain substring semantics: anchors
+    aren't word-bounded, the scan resumes one character after each anchor
+    hit so overlapping keywords are all found, and an anchor's entry also
+    carries the keywords of any shorter anchor that is its prefix (e.g.
+    "poly" under "polygraph"), since only the longest is reported per
+    position.
+    """
+
+    pattern: re.Pattern[str]
+    keywords_by_anchor: dict[str, list[tuple[str, int, str]]]
+    mask_class: str
+
+    def match(self, text: str) -> frozenset[str]:
+        """Return the names of every keyword class with a match in text.
+
+        Matches overlapping a mask_class match are discarded (and the mask
+        class itself is never reported) — equivalent to deleting mask_class
+        phrases from the text before matching.
+        """
+        text_lower = text.lower()
+        hits: list[tuple[int, int, str]] = []
+        search = self.pattern.search
+        pos = 0
+        while (anchor := search(text_lower, pos)) is not None:
+            anchor_start = anchor.start()
+            for keyword, offset, keyword_class in self.keywords_by_anchor[anchor.group()]:
+                start = anchor_start - offset
+                if start >= 0 and text_lower.startswith(keyword, start):
+                    hits.append((start, start + len(keyword), keyword_class))
+            pos = anchor_start + 1
+
+        masks = [(start, end) for start, end, keyword_class in hits if keyword_class == self.mask_class]
+        return frozenset(
+            keyword_class
+            for start, end, keyword_class in hits
+            if keyword_class != self.mask_class
+            and not any(start < mask_end and mask_start < end for mask_start, mask_end in masks)
+        )
+
+
+def _compile_keyword_matcher(keyword_classes: dict[str, list[str]], mask_class: str = "") -> _KeywordMatcher:
+    """Compile lowercase keyword lists, keyed by class name, into a _KeywordMatcher."""
+    keywords_by_anchor: dict[str, list[tuple[str, int, str]]] = {}
+    for keyword_class, keywords in keyword_classes.items():
+        for keyword in keywords:
+            anchor = max(keyword.split(" "), key=len)
+            keywords_by_anchor.setdefault(anchor, []).append((keyword, keyword.index(anchor), keyword_class))
+    for anchor in keywords_by_anchor:
+        for other, entries in list(keywords_by_anchor.items()):
+            if other != anchor and anchor.startswith(other):
+                keywords_by_anchor[anchor] = keywords_by_anchor[anchor] + entries
+    return _KeywordMatcher(re.compile(_trie_pattern(list(keywords_by_anchor))), keywords_by_anchor, mask_class)
+
+
 # Keywords used for post-extraction title matching (case-insensitive).
 _TITLE_KEYWORDS = [
     "platform",
@@ -95,6 +403,8 @@ _EXCLUDE_TITLE_KEYWORDS = [
     "director",
 ]
 
+_TITLE_MATCHER = _compile_keyword_matcher({"title": _TITLE_KEYWORDS, "exclude_title": _EXCLUDE_TITLE_KEYWORDS})
+
 # Clearance tiers above Public Trust — the highest tier the user will pursue.
 # A "public trust" mention (with none of these) is explicitly allowed.
 _HIGH_CLEARANCE_KEYWORDS = [
@@ -147,6 +457,19 @@ _CLEARANCE_FALSE_POSITIVE_PHRASES = [
     "employee polygraph protection act",
 ]
 
+# Every clearance keyword list above in one matcher, so a description is
+# scanned once rather than once per keyword (see _requires_excluded_clearance).
+_CLEARANCE_MATCHER = _compile_keyword_matcher(
+    {
+        "false_positive": _CLEARANCE_FALSE_POSITIVE_PHRASES,
+        "high_clearance": _HIGH_CLEARANCE_KEYWORDS,
+        "public_trust": ["public trust"],
+        "no_clearance": _NO_CLEARANCE_PHRASES,
+        "generic_clearance": _GENERIC_CLEARANCE_KEYWORDS,
+    },
+    mask_class="false_positive",
+)
+
 
 def _requires_excluded_clearance(text: str) -> bool:
     """Check whether text indicates a clearance requirement above Public Trust.
@@ -156,18 +479,15 @@ def _requires_excluded_clearance(text: str) -> bool:
     allowed, as is an explicit "no clearance required" negation. A
     generic/unspecified clearance mention with no level given is treated as
     excluded by default. Known false-positive boilerplate (e.g. the EPPA
-    notice) is stripped before matching.
+    notice) is ignored. Every keyword class is found in a single scan of the
+    text by _CLEARANCE_MATCHER, then decided in that order of precedence.
     """
-    text_lower = text.lower()
-    for phrase in _CLEARANCE_FALSE_POSITIVE_PHRASES:
-        text_lower = text_lower.replace(phrase, "")
-    if any(kw in text_lower for kw in _HIGH_CLEARANCE_KEYWORDS):
+    hits = _CLEARANCE_MATCHER.match(text)
+    if "high_clearance" in hits:
         return True
-    if "public trust" in text_lower:
-        return False
-    if any(phrase in text_lower for phrase in _NO_CLEARANCE_PHRASES):
+    if "public_trust" in hits or "no_clearance" in hits:
         return False
-    return any(kw in text_lower for kw in _GENERIC_CLEARANCE_KEYWORDS)
+    return "generic_clearance" in hits
 
 
 # Countries, business regions, and common offshore/nearshore tech-hub cities
@@ -323,156 +643,1239 @@ def _is_non_us_location(location: str) -> bool:
     return bool(_NON_US_LOCATION_RE.search(location))
 
 
-def _title_looks_relevant(title: str) -> bool:
-    """Cheap title-only pre-check mirroring _filter_relevant_jobs's keyword logic.
-
-    Used by fetchers that can fetch a full job description at the cost of an
-    extra request per posting (e.g. Workday), to avoid paying that cost for
-    postings that would be dropped by _filter_relevant_jobs anyway.
-    """
-    title_lower = title.lower()
-    if not any(kw in title_lower for kw in _TITLE_KEYWORDS):
-        return False
-    return not any(kw in title_lower for kw in _EXCLUDE_TITLE_KEYWORDS)
-
-
 def _make_job_id(company: str, title: str, url: str) -> str:
     """Derive a stable deduplication key from company, title, and URL."""
     raw = f"{company}|{title}|{url}"
     return hashlib.sha256(raw.encode()).hexdigest()
 
 
-def _filter_relevant_jobs(jobs: list[dict[str, str]], company: str) -> list[dict[str, str]]:
-    """Drop jobs whose title doesn't match a target-role keyword, or matches an excluded one.
+def _batch_get_items(table_name: str, key_name: str, key_values: list[str], projection: str) -> list[dict[str, Any]]:
+    """Fetch the items stored under key_values (a string hash key) from table_name.
 
-    Performs case-insensitive substring matching against _TITLE_KEYWORDS,
-    then drops any of those matches whose title also hits _EXCLUDE_TITLE_KEYWORDS
-    (management/leadership roles), indicates a clearance requirement above
-    Public Trust, has a location indicating a non-US posting, or (for every
-    backend except "builtin") doesn't match the configured LOCATION/WORK_TYPE.
-    Built In jobs are exempt from that last check since they're already
-    filtered by their own independent BUILTIN_LOCATION/BUILTIN_WORK_TYPE
-    config in _fetch_builtin_jobs — detected here via the per-job "company"
-    key, which only the builtin backend sets. The clearance check is
-    title-only here and applies uniformly across every ATS backend;
-    _fetch_greenhouse_jobs, _fetch_workday_jobs, and _fetch_builtin_jobs
-    additionally check the full job description. Logs extracted vs. matched
-    counts so the keyword lists can be tuned.
+    Issues BatchGetItem requests of up to _DYNAMODB_BATCH_GET_LIMIT keys,
+    projecting only projection, and re-requests UnprocessedKeys with a short
+    backoff. Fails open: a DynamoDB error or keys still unprocessed after
+    _DYNAMODB_BATCH_GET_ATTEMPTS just leave those items out of the result.
+    Goes through the resource's client, as it runs on the batch's record
+    threads (see _put_new_job).
+    """
+    unique_values = list(dict.fromkeys(key_values))
+    items: list[dict[str, Any]] = []
+    try:
+        for start in range(0, len(unique_values), _DYNAMODB_BATCH_GET_LIMIT):
+            chunk = unique_values[start : start + _DYNAMODB_BATCH_GET_LIMIT]
+            request = {table_name: {"Keys": [{key_name: value} for value in chunk], "ProjectionExpression": projection}}
+            for attempt in range(_DYNAMODB_BATCH_GET_ATTEMPTS):
+                if attempt:
+                    time.sleep(0.05 * 2**attempt)
+                resp = dynamodb.meta.client.batch_get_item(RequestItems=request)
+                items.extend(resp.get("Responses", {}).get(table_name, []))
+                request = resp.get("UnprocessedKeys") or {}
+                if not request:
+                    break
+    except (BotoCoreError, ClientError) as exc:
+        logger.warning("DynamoDB batch lookup failed", table=table_name, error=str(exc))
+    return items
+
+
+def _existing_job_ids(job_ids: list[str]) -> set[str]:
+    """Return the subset of job_ids that are already stored in JOBS_TABLE.
+
+    Fails open (see _batch_get_items), and when JOBS_TABLE is unset: a
+    missed ID just costs the description fetch this check exists to avoid
+    — the conditional put_item in handler still catches the duplicate.
+    """
+    table_name = os.environ.get("JOBS_TABLE")
+    if not table_name or not job_ids:
+        return set()
+    return {item["job_id"] for item in _batch_get_items(table_name, "job_id", job_ids, "job_id")}
 
-    Args:
-        jobs: Raw list of job dicts with at least a "title" key.
-        company: Company name used for structured log context.
 
-    Returns:
-        Subset of jobs whose title matched a target keyword, hit no exclude
-        or excluded-clearance keyword, whose location isn't non-US, and
-        (unless from the builtin backend) matches the configured work type.
-    """
-    matched = [j for j in jobs if any(kw in j.get("title", "").lower() for kw in _TITLE_KEYWORDS)]
-    filtered = [j for j in matched if not any(kw in j["title"].lower() for kw in _EXCLUDE_TITLE_KEYWORDS)]
-    cleared = [j for j in filtered if not _requires_excluded_clearance(j["title"])]
-    us_only = [j for j in cleared if not _is_non_us_location(j.get("location", ""))]
-    work_type_matched = [j for j in us_only if "company" in j or _location_matches(j.get("location", ""))]
+def _known_job_flags(jobs: list[dict[str, str]], company: str) -> list[bool]:
+    """Flag which of jobs are already stored in JOBS_TABLE, in the same order.
+
+    _make_job_id is deterministic, so a fetcher can compute a posting's
+    job_id from listing data alone and skip the per-posting description
+    request for anything handler would only reject as a duplicate later.
+    Each job's own "company" key (set by the builtin backend) takes
+    precedence over company, mirroring handler.
+    """
+    job_ids = [_make_job_id(job.get("company") or company, job["title"], job["url"]) for job in jobs]
+    existing = _existing_job_ids(job_ids)
+    return [job_id in existing for job_id in job_ids]
+
+
+def _canonical_job_url(url: str) -> str:
+    """Normalise a posting URL to the key it's cached under: no query string, fragment or trailing slash."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc.lower()}{parts.path.rstrip('/')}"
+
+
+def _cached_description_verdicts(jobs: list[dict[str, str]]) -> list[bool | None]:
+    """Look up each job's shared clearance verdict in DESCRIPTION_CACHE_TABLE, in the same order.
+
+    True/False is the cached _requires_excluded_clearance result for the
+    posting's title and full description; None means there's no unexpired
+    verdict, so the description has to be fetched. The table is shared by
+    every container — a Built In posting surfacing under several searches,
+    or a Workday posting checked on an earlier day, is only fetched once
+    per _DESCRIPTION_VERDICT_TTL_SECONDS. Mostly that saves fetches for
+    clearance-excluded postings, which (never being stored in JOBS_TABLE)
+    the known-job check can't skip. Items past expires_at are ignored even
+    before DynamoDB's TTL sweep deletes them. Fails open to None throughout
+    (see _batch_get_items), including when DESCRIPTION_CACHE_TABLE is unset.
+    """
+    table_name = os.environ.get("DESCRIPTION_CACHE_TABLE")
+    if not table_name or not jobs:
+        return [None] * len(jobs)
+    urls = [_canonical_job_url(job["url"]) for job in jobs]
+    now = time.time()
+    items = _batch_get_items(table_name, "job_url", urls, "job_url, excluded, expires_at")
+    verdicts = {item["job_url"]: bool(item["excluded"]) for item in items if item.get("expires_at", 0) > now}
+    return [verdicts.get(url) for url in urls]
+
+
+def _store_description_verdicts(verdicts: list[tuple[str, bool, str]]) -> None:
+    """Record (job url, excluded, description) clearance verdicts in DESCRIPTION_CACHE_TABLE.
+
+    Each item also carries a hash of the description it was derived from
+    and an expires_at for the table's TTL. Callers only pass verdicts from
+    a successfully fetched, non-empty description — a failed fetch's
+    title-only verdict shouldn't be reused. Written in BatchWriteItem
+    requests of up to _DYNAMODB_BATCH_WRITE_LIMIT items through the
+    resource's client (see _put_new_job), re-sending UnprocessedItems with
+    the same backoff as _batch_get_items. Best effort: errors, and items
+    still unprocessed after _DYNAMODB_BATCH_GET_ATTEMPTS, are logged and
+    dropped.
+    """
+    table_name = os.environ.get("DESCRIPTION_CACHE_TABLE")
+    if not table_name or not verdicts:
+        return
+    expires_at = int(time.time()) + _DESCRIPTION_VERDICT_TTL_SECONDS
+    # One item per URL: a BatchWriteItem request can't hold the same key twice.
+    items = {
+        _canonical_job_url(url): {
+            "job_url": _canonical_job_url(url),
+            "excluded": excluded,
+            "description_hash": hashlib.sha256(description.encode()).hexdigest(),
+            "expires_at": expires_at,
+        }
+        for url, excluded, description in verdicts
+    }
+    puts = [{"PutRequest": {"Item": item}} for item in items.values()]
+    unprocessed = 0
+    try:
+        for start in range(0, len(puts), _DYNAMODB_BATCH_WRITE_LIMIT):
+            request = {table_name: puts[start : start + _DYNAMODB_BATCH_WRITE_LIMIT]}
+            for attempt in range(_DYNAMODB_BATCH_GET_ATTEMPTS):
+                if attempt:
+                    time.sleep(0.05 * 2**attempt)
+                resp = dynamodb.meta.client.batch_write_item(RequestItems=request)
+                request = resp.get("UnprocessedItems") or {}
+                if not request:
+                    break
+            unprocessed += len(request.get(table_name, []))
+    except (BotoCoreError, ClientError) as exc:
+        logger.warning("Description verdict store failed", table=table_name, error=str(exc))
+        return
+    if unprocessed:
+        logger.warning("Description verdicts dropped after retries", table=table_name, dropped=unprocessed)
+
+
+def _crawl_filter_key() -> str:
+    """Fingerprint the LOCATION/WORK_TYPE and BUILTIN_* settings a crawl's output depends on."""
+    return hashlib.sha256(repr((_location_filter_config(), _builtin_filter_config())).encode()).hexdigest()
+
+
+def _posting_fingerprint(job: dict[str, str]) -> bytes:
+    """Hash a normalised posting's listing fields (company, title, url, location) to a snapshot fingerprint."""
+    raw = "\x1f".join((job.get("company", ""), job["title"], job["url"], job.get("location", "")))
+    return hashlib.blake2b(raw.encode(), digest_size=_SNAPSHOT_FINGERPRINT_BYTES).digest()
+
+
+def _board_crawl_state(careers_url: str) -> dict[str, Any] | None:
+    """Return the state CRAWL_STATE_TABLE holds from careers_url's last complete crawl, or None.
+
+    Only returned while it can still vouch for the board: unexpired, and
+    recorded under the current filter settings — an unchanged board can
+    still have a different set of jobs passing a different filter. Fails
+    open to None (a full crawl), including when CRAWL_STATE_TABLE is unset.
+    Uses the client rather than a Table resource, as _put_new_job does,
+    since records are processed on concurrent threads.
+    """
+    table_name = os.environ.get("CRAWL_STATE_TABLE")
+    if not table_name:
+        return None
+    try:
+        item = dynamodb.meta.client.get_item(TableName=table_name, Key={"board_url": careers_url}).get("Item")
+    except (BotoCoreError, ClientError) as exc:
+        logger.warning("Crawl state lookup failed", table=table_name, url=careers_url, error=str(exc))
+        return None
+    if not item or item.get("expires_at", 0) <= time.time() or item.get("filter_key") != _crawl_filter_key():
+        return None
+    return item
+
+
+def _conditional_headers(previous: dict[str, Any] | None) -> dict[str, str]:
+    """Build If-None-Match / If-Modified-Since request headers from a board's stored validators."""
+    headers = {}
+    if previous and previous.get("etag"):
+        headers["If-None-Match"] = previous["etag"]
+    if previous and previous.get("last_modified"):
+        headers["If-Modified-Since"] = previous["last_modified"]
+    return headers
+
+
+def _board_not_modified(careers_url: str, response: requests.Response, crawl_state: _CrawlState | None) -> bool:
+    """Return whether a board answered its conditional request with 304 Not Modified, marking it unchanged.
+
+    The board's jobs are then all already stored, so the whole
+    filter/write path for it is skipped; that's logged here. A server
+    that ignores the conditional headers (or mints a new ETag per
+    response) just sends the board again, and the snapshot diff skips
+    every posting in it instead (see _CrawlState).
+    """
+    if crawl_state is None or response.status_code != 304:
+        return False
+    logger.info("Board unchanged, skipping", url=careers_url, reason="not_modified")
+    crawl_state.mark_unchanged()
+    return True
+
+
+def _board_validators(response: requests.Response) -> dict[str, str]:
+    """Return the HTTP validators of a board response, to store with its crawl state."""
+    return {"etag": response.headers.get("ETag", ""), "last_modified": response.headers.get("Last-Modified", "")}
+
+
+@dataclass
+class _CrawlState:
+    """One record's crawl of a board: the state its last complete crawl left, and the state this one will.
+
+    _process_record creates one per record and threads it through
+    _fetch_jobs. The backend loads the previous state, checks every posting
+    against its snapshot before any filter or description work (is_new —
+    on a steady-state day nearly every posting is unchanged, so the work
+    done is proportional to the board's churn rather than its size), and
+    calls complete() once the board has been yielded in full — or, for a
+    crawl that deliberately stopped at postings it already knows
+    (partial=True), once everything newer than them has. Only then,
+    and only after every job is persisted, does _process_record store it
+    (see _store_board_crawl_state) — a failed record is filtered in full
+    again on redelivery rather than having its postings skipped as seen.
+    """
+
+    board_url: str
+    previous: dict[str, Any] | None = None
+    previous_snapshot: frozenset[bytes] = frozenset()
+    seen: set[bytes] = field(default_factory=set)
+    validators: dict[str, str] = field(default_factory=dict)
+    # Backend-specific markers of how far the board has been read (see
+    # _fetch_workday_jobs), stored alongside the snapshot.
+    high_water: dict[str, Any] = field(default_factory=dict)
+    completed: bool = False
+    partial: bool = False
+    board_unchanged: bool = False
+
+    def load(self) -> dict[str, Any] | None:
+        """Load the board's previous state (see _board_crawl_state) and return it."""
+        self.previous = _board_crawl_state(self.board_url)
+        blob = bytes(self.previous.get("snapshot", b"")) if self.previous else b""
+        self.previous_snapshot = frozenset(
+            blob[i : i + _SNAPSHOT_FINGERPRINT_BYTES] for i in range(0, len(blob), _SNAPSHOT_FINGERPRINT_BYTES)
+        )
+        return self.previous
+
+    def is_new(self, job: dict[str, str]) -> bool:
+        """Record a posting as seen, returning whether it's missing from the previous snapshot."""
+        fingerprint = _posting_fingerprint(job)
+        self.seen.add(fingerprint)
+        return fingerprint not in self.previous_snapshot
+
+    def complete(self, validators: dict[str, str] | None = None, partial: bool = False) -> None:
+        """Mark the board as yielded in full, with the response validators to store alongside its snapshot.
+
+        partial marks a crawl that skipped postings it knew to be old: they
+        weren't seen, but weren't removed either, so the stored snapshot
+        keeps the previous one's postings too.
+        """
+        self.validators = validators or {}
+        self.completed = True
+        self.partial = partial
+
+    def mark_unchanged(self) -> None:
+        """Record the whole board as unchanged since its last crawl, which leaves nothing new to store."""
+        self.seen = set(self.previous_snapshot)
+        self.board_unchanged = True
+
+    def diff_counts(self) -> dict[str, int]:
+        """Return the postings added, removed and unchanged since the previous snapshot.
+
+        Empty unless the crawl completed (or found the board unchanged) —
+        a crawl that stopped early saw too little to diff — and without
+        postings_removed for a partial crawl, which can't tell.
+        """
+        if not (self.completed or self.board_unchanged):
+            return {}
+        unchanged = len(self.seen & self.previous_snapshot)
+        if self.partial:
+            return {"postings_added": len(self.seen) - unchanged, "postings_unchanged": unchanged}
+        return {
+            "postings_added": len(self.seen) - unchanged,
+            "postings_removed": len(self.previous_snapshot) - unchanged,
+            "postings_unchanged": unchanged,
+        }
+
+
+def _store_board_crawl_state(crawl_state: _CrawlState) -> None:
+    """Record a completely crawled board's validators, snapshot and high-water marks in CRAWL_STATE_TABLE.
+
+    The expiry carries over from the previous state, so a board is still
+    filtered in full once every _CRAWL_STATE_TTL_SECONDS however often it
+    changes. Best effort: errors are logged and dropped.
+    """
+    table_name = os.environ.get("CRAWL_STATE_TABLE")
+    if not table_name or not crawl_state.completed:
+        return
+    previous = crawl_state.previous
+    item: dict[str, Any] = {
+        "board_url": crawl_state.board_url,
+        **crawl_state.validators,
+        "filter_key": _crawl_filter_key(),
+        "expires_at": int(previous["expires_at"]) if previous else int(time.time()) + _CRAWL_STATE_TTL_SECONDS,
+    }
+    if crawl_state.high_water:
+        item["high_water"] = crawl_state.high_water
+    seen = crawl_state.seen | crawl_state.previous_snapshot if crawl_state.partial else crawl_state.seen
+    if len(seen) <= _SNAPSHOT_MAX_POSTINGS:
+        item["snapshot"] = b"".join(sorted(seen))
+    try:
+        dynamodb.meta.client.put_item(TableName=table_name, Item=item)
+    except (BotoCoreError, ClientError) as exc:
+        logger.warning("Crawl state store failed", table=table_name, url=crawl_state.board_url, error=str(exc))
+
+
+def _put_new_job(table_name: str, item: dict[str, str]) -> bool:
+    """Insert item unless its job_id already exists. Returns whether it was written.
+
+    Uses the resource's underlying client (which still (de)serializes plain
+    Python values) rather than a Table resource because this runs on
+    _put_new_jobs's writer threads, and boto3 resources aren't thread-safe
+    while clients are.
+    """
+    client = dynamodb.meta.client
+    try:
+        client.put_item(
+            TableName=table_name,
+            Item=item,
+            ConditionExpression="attribute_not_exists(job_id)",
+        )
+    except client.exceptions.ConditionalCheckFailedException:
+        logger.debug("Duplicate skipped", job_id=item["job_id"])
+        return False
+    logger.info("Wrote new job", title=item["title"], company=item["company"])
+    return True
+
+
+def _put_new_jobs(table_name: str, items: Iterable[dict[str, str]]) -> tuple[int, int]:
+    """Insert every item whose job_id isn't already stored, returning (written, duplicates).
+
+    Keeps the insert-if-absent semantics of a conditional put_item per item
+    — there's no batch write API that supports condition expressions short
+    of all-or-nothing transactions, where one duplicate would fail the whole
+    batch — but issues them from a pool of _DYNAMODB_WRITE_CONCURRENCY
+    writer threads instead of one synchronous round trip after another.
+    Any error other than a duplicate propagates, as it did before.
+
+    items is consumed lazily: each item is submitted as soon as it's
+    produced, and pulling the next one waits while
+    _DYNAMODB_WRITE_BUFFER_SIZE writes are still in flight. Fed straight
+    from a fetcher generator (see handler), jobs are persisted while the
+    board is still being crawled, so a Lambda timeout only loses the jobs
+    not yet reached.
+    """
+    written = duplicates = 0
+    in_flight: set[Future[bool]] = set()
+    with ThreadPoolExecutor(max_workers=_DYNAMODB_WRITE_CONCURRENCY, thread_name_prefix="dynamodb-writer") as writers:
+        for item in items:
+            if len(in_flight) >= _DYNAMODB_WRITE_BUFFER_SIZE:
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.result():
+                        written += 1
+                    else:
+                        duplicates += 1
+            in_flight.add(writers.submit(_put_new_job, table_name, item))
+        for future in in_flight:
+            if future.result():
+                written += 1
+            else:
+                duplicates += 1
+    return written, duplicates
+
+
+# Listing-level filter stages, in the order _listing_filter_stage runs them.
+# Each only needs the fields every backend's search/list response already
+# carries (title, location), so they're all checked before any per-posting
+# description work.
+_LISTING_FILTER_STAGES = ("title", "excluded_title", "title_clearance", "non_us", "work_type")
+
+
+def _listing_filter_stage(job: dict[str, str], config: _FilterConfig | None) -> str | None:
+    """Return the first _LISTING_FILTER_STAGES stage job fails, or None if it passes them all.
+
+    Stages, cheapest and most selective first: the title must hit a
+    _TITLE_KEYWORDS entry, must not hit an _EXCLUDE_TITLE_KEYWORDS one, must
+    not itself state a clearance above Public Trust, the location must not
+    be non-US, and it must match config (_location_filter_config(), or
+    _builtin_filter_config() for Built In; None skips the work-type stage).
+    Both location stages come from one memoized _classify_location lookup.
+    Fetchers call this on listing fields before fetching or scanning a full
+    description, so that work is only spent on postings that can survive
+    _iter_relevant_jobs anyway.
+    """
+    title = job.get("title", "")
+    hits = _TITLE_MATCHER.match(title)
+    if "title" not in hits:
+        return "title"
+    if "exclude_title" in hits:
+        return "excluded_title"
+    if _requires_excluded_clearance(title):
+        return "title_clearance"
+    non_us, work_type_matches = _classify_location(job.get("location", ""), config)
+    if non_us:
+        return "non_us"
+    if not work_type_matches:
+        return "work_type"
+    return None
+
+
+def _listing_skip_counts() -> dict[str, int]:
+    """Return a zeroed per-stage skip counter, counted into by a record's fetcher and logged by _log_filter_counts."""
+    return dict.fromkeys(_LISTING_FILTER_STAGES, 0)
+
+
+def _iter_relevant_jobs(jobs: Iterable[dict[str, str]], skipped: dict[str, int]) -> Iterator[dict[str, str]]:
+    """Yield the jobs passing every listing-level stage, counting the rest into skipped by stage.
+
+    handler streams each company's fetched jobs through this, so every
+    backend's jobs get the same _listing_filter_stage checks. Fetchers
+    already apply the stages before their description work, counting what
+    they drop into the same skipped counter (see _fetch_jobs), so this final
+    pass rarely drops anything; its counts just add to theirs.
+
+    The LOCATION/WORK_TYPE config is resolved once for the whole pass;
+    "builtin" jobs (the only ones carrying a "company" key) skip that stage,
+    since _fetch_builtin_jobs already filtered them by their own independent
+    BUILTIN_LOCATION/BUILTIN_WORK_TYPE config.
+    """
+    config = _location_filter_config()
+    for job in jobs:
+        stage = _listing_filter_stage(job, None if "company" in job else config)
+        if stage is None:
+            yield job
+        else:
+            skipped[stage] += 1
+
+
+def _log_filter_counts(
+    company: str, relevant: int, skipped: dict[str, int], diff_counts: dict[str, int] | None = None
+) -> None:
+    """Log the "Job filter complete" counters for one company: its fetcher's and _iter_relevant_jobs's drops.
+
+    diff_counts (see _CrawlState.diff_counts) adds how many of the board's
+    postings were added, removed or unchanged since its last snapshot —
+    only the added ones reach the filter at all.
+    """
+    dropped = sum(skipped.values())
     logger.info(
         "Job filter complete",
         company=company,
-        extracted=len(jobs),
-        matched=len(matched),
-        excluded=len(matched) - len(filtered),
-        clearance_excluded=len(filtered) - len(cleared),
-        non_us_excluded=len(cleared) - len(us_only),
-        work_type_excluded=len(us_only) - len(work_type_matched),
-        dropped=len(jobs) - len(work_type_matched),
+        extracted=relevant + dropped,
+        matched=relevant + dropped - skipped["title"],
+        excluded=skipped["excluded_title"],
+        clearance_excluded=skipped["title_clearance"],
+        non_us_excluded=skipped["non_us"],
+        work_type_excluded=skipped["work_type"],
+        dropped=dropped,
+        **(diff_counts or {}),
     )
-    return work_type_matched
 
 
-def _fetch_greenhouse_jobs(careers_url: str) -> list[dict[str, str]]:
+# One keep-alive Session per host, kept at module level so pooled connections
+# (and their already-negotiated TLS sessions) survive across warm Lambda
+# invocations, not just across requests within one. See _http_session.
+_http_sessions: dict[str, requests.Session] = {}
+_http_sessions_lock = threading.Lock()
+
+
+def _http_session(url: str) -> requests.Session:
+    """Return the shared, pooled Session for url's host, creating it on first use.
+
+    Every fetcher goes through this (via _http_get / _http_post) rather than
+    the bare requests.get / requests.post, which open — and TLS-handshake —
+    a fresh connection per call. That matters most for Workday and Built In,
+    which issue one detail request per relevant posting against the same
+    host. Each Session is mounted with a sized connection pool and a retry
+    adapter for connection-level failures, and negotiates compressed bodies.
+    """
+    host = urlsplit(url).netloc
+    with _http_sessions_lock:
+        session = _http_sessions.get(host)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(_HTTP_DEFAULT_HEADERS)
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=_HTTP_POOL_MAXSIZE, max_retries=_HTTP_RETRY)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _http_sessions[host] = session
+    return session
+
+
+class _HostRateLimiter:
+    """Token bucket shared by every request to one host (see _http_request).
+
+    Refills at rate tokens per second up to burst; each request takes one,
+    waiting for it if the bucket is empty. pause() holds back every request
+    to the host until a deadline — set when the host answers 429/5xx, so
+    all the worker's threads back off together instead of each one
+    discovering the overload (and hammering it) independently.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until the host is not paused and a token is available, then take it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = max(self._paused_until - now, (1 - self._tokens) / self._rate)
+            time.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every request to the host for at least seconds from now."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+_http_rate_limiters: dict[str, _HostRateLimiter] = {}
+
+
+def _http_rate_limiter(url: str) -> _HostRateLimiter:
+    """Return the shared _HostRateLimiter for url's host, creating it on first use."""
+    host = urlsplit(url).netloc
+    with _http_sessions_lock:
+        limiter = _http_rate_limiters.get(host)
+        if limiter is None:
+            limiter = _HostRateLimiter(_HTTP_RATE_PER_HOST, _HTTP_BURST_PER_HOST)
+            _http_rate_limiters[host] = limiter
+    return limiter
+
+
+def _retry_after_seconds(response: requests.Response) -> float | None:
+    """Parse a response's Retry-After header (delta-seconds or HTTP-date), if any."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+# The cache's SQLite connection (opened lazily, for the current
+# RESPONSE_CACHE_PATH), the running total of compressed bytes it holds, and
+# its cumulative counters, all guarded by one lock — lookups and writes are
+# quick next to the network round trips they save.
+_response_cache_lock = threading.Lock()
+_response_cache_db: dict[str, sqlite3.Connection] = {}
+_response_cache_bytes: dict[sqlite3.Connection, int] = {}
+_response_cache_counters = {"hits": 0, "misses": 0, "bytes_saved": 0}
+
+
+def _response_cache() -> sqlite3.Connection:
+    """Return the connection to the response cache, opening (and creating) it on first use.
+
+    Callers must hold _response_cache_lock. Entries that have outlived the
+    TTL are purged when the file is opened, i.e. once per cold start, and
+    the size of what's left is summed into _response_cache_bytes, which
+    _store_response keeps up to date from then on.
+    """
+    path = os.environ.get("RESPONSE_CACHE_PATH", _RESPONSE_CACHE_DEFAULT_PATH)
+    db = _response_cache_db.get(path)
+    if db is None:
+        db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, stored_at REAL NOT NULL, accessed_at REAL NOT NULL, "
+            "content_type TEXT NOT NULL, body BLOB NOT NULL, size INTEGER NOT NULL)"
+        )
+        db.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+        db.execute("DELETE FROM responses WHERE stored_at < ?", (time.time() - _response_cache_ttl(),))
+        _response_cache_bytes[db] = db.execute("SELECT COALESCE(SUM(LENGTH(body)), 0) FROM responses").fetchone()[0]
+        _response_cache_db[path] = db
+    return db
+
+
+def _response_cache_ttl() -> int:
+    """Return RESPONSE_CACHE_TTL_SECONDS; 0 (or less) disables the response cache."""
+    return int(os.environ.get("RESPONSE_CACHE_TTL_SECONDS", _RESPONSE_CACHE_DEFAULT_TTL_SECONDS))
+
+
+def _response_cache_key(method: str, url: str, kwargs: dict[str, Any]) -> str:
+    """Key a request by everything that selects its response: method, URL, query params and JSON body."""
+    raw = json.dumps([method, url, kwargs.get("params"), kwargs.get("json")], sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _cached_response(key: str, url: str, ttl: int) -> requests.Response | None:
+    """Return the cached response for key as a requests.Response, or None if absent or older than ttl.
+
+    Sits under every fetcher via _http_request — Greenhouse and Lever
+    boards, Workday searches and detail JSON, Built In search and detail
+    pages — so a warm container that already downloaded something within
+    the TTL (e.g. a redelivered SQS message, or a Built In posting that
+    shows up under several searches) doesn't download it again. A hit
+    refreshes the entry's LRU position. Cache errors (a full or corrupt
+    /tmp) fail open to a normal request.
+    """
+    with _response_cache_lock:
+        try:
+            db = _response_cache()
+            row = db.execute(
+                "SELECT stored_at, content_type, body, size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            now = time.time()
+            if row is None or now - row[0] > ttl:
+                _response_cache_counters["misses"] += 1
+                return None
+            db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        except sqlite3.Error as exc:
+            logger.warning("Response cache lookup failed", url=url, error=str(exc))
+            return None
+        _response_cache_counters["hits"] += 1
+        _response_cache_counters["bytes_saved"] += row[3]
+
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response.headers["Content-Type"] = row[1]
+    response.encoding = get_encoding_from_headers(response.headers)
+    response._content = zlib.decompress(row[2])
+    response._content_consumed = True
+    return response
+
+
+def _store_response(key: str, url: str, response: requests.Response) -> None:
+    """Cache a successful response's body (zlib-compressed) under key, evicting LRU entries over the size bound."""
+    body = response.content
+    compressed = zlib.compress(body)
+    now = time.time()
+    with _response_cache_lock:
+        try:
+            db = _response_cache()
+            replaced = db.execute("SELECT LENGTH(body) FROM responses WHERE key = ?", (key,)).fetchone()
+            db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, now, now, response.headers.get("Content-Type", ""), compressed, len(body)),
+            )
+            total = _response_cache_bytes[db] + len(compressed) - (replaced[0] if replaced else 0)
+            if total > _RESPONSE_CACHE_MAX_BYTES:
+                for evict_key, evict_size in db.execute(
+                    "SELECT key, LENGTH(body) FROM responses ORDER BY accessed_at"
+                ).fetchall():
+                    if total <= _RESPONSE_CACHE_MAX_BYTES:
+                        break
+                    db.execute("DELETE FROM responses WHERE key = ?", (evict_key,))
+                    total -= evict_size
+            _response_cache_bytes[db] = total
+        except sqlite3.Error as exc:
+            logger.warning("Response cache write failed", url=url, error=str(exc))
+
+
+def _response_cache_stats() -> dict[str, int]:
+    """Return cumulative response cache counters (hits, misses, bytes_saved) for the container's lifetime."""
+    with _response_cache_lock:
+        return dict(_response_cache_counters)
+
+
+def _http_request(method: str, url: str, **kwargs: Any) -> requests.Response:
+    """Send a request through its host's pooled Session, rate limited and retried.
+
+    Every attempt first takes a token from the host's _HostRateLimiter. A
+    _HTTP_RETRY_STATUSES response is retried up to _HTTP_MAX_ATTEMPTS
+    attempts in total, after the server's Retry-After if it sent one, else a
+    full-jitter exponential backoff — both capped at _HTTP_BACKOFF_MAX. The
+    wait is applied as a pause of the whole host, so concurrent requests to
+    it (other Workday search pages, description fetches, ...) slow down too.
+    The final response is returned whatever its status, for the caller's
+    raise_for_status.
+
+    Checks the response cache first (see _cached_response), and caches the
+    final response if it's a 200 — unless the caller asked to stream it
+    (stream=True), since caching needs the whole body in memory. A streamed
+    request is never stored, so it skips the lookup too.
+    """
+    kwargs.setdefault("timeout", _HTTP_TIMEOUT)
+    cache_ttl = 0 if kwargs.get("stream") else _response_cache_ttl()
+    cache_key = _response_cache_key(method, url, kwargs) if cache_ttl > 0 else ""
+    if cache_key and (cached := _cached_response(cache_key, url, cache_ttl)) is not None:
+        return cached
+    session = _http_session(url)
+    limiter = _http_rate_limiter(url)
+    attempt = 0
+    while True:
+        limiter.acquire()
+        response = session.request(method, url, **kwargs)
+        attempt += 1
+        if response.status_code not in _HTTP_RETRY_STATUSES or attempt >= _HTTP_MAX_ATTEMPTS:
+            if cache_key and response.status_code == 200:
+                _store_response(cache_key, url, response)
+            return response
+        delay = _retry_after_seconds(response)
+        if delay is None:
+            delay = random.uniform(0, _HTTP_BACKOFF_BASE * 2**attempt)
+        delay = min(delay, _HTTP_BACKOFF_MAX)
+        logger.warning(
+            "HTTP request throttled, retrying",
+            url=url,
+            status=response.status_code,
+            attempt=attempt,
+            delay_seconds=round(delay, 2),
+        )
+        response.close()
+        limiter.pause(delay)
+
+
+def _http_get(url: str, **kwargs: Any) -> requests.Response:
+    """GET url through its host's pooled, rate-limited Session (see _http_request)."""
+    return _http_request("GET", url, **kwargs)
+
+
+def _http_post(url: str, **kwargs: Any) -> requests.Response:
+    """POST to url through its host's pooled, rate-limited Session (see _http_request)."""
+    return _http_request("POST", url, **kwargs)
+
+
+def _http_connection_stats() -> dict[str, int]:
+    """Return cumulative connection counters across every pooled Session.
+
+    Read from urllib3's own per-pool counters: num_connections counts
+    connections opened, num_requests counts requests sent over any
+    connection, so the difference is requests that reused a kept-alive
+    connection. Cumulative for the container's lifetime — handler diffs a
+    snapshot taken at the start of the invocation to get per-invocation
+    numbers.
+    """
+    with _http_sessions_lock:
+        sessions = list(_http_sessions.values())
+    opened = sent = 0
+    for session in sessions:
+        for adapter in {id(a): a for a in session.adapters.values()}.values():
+            if not isinstance(adapter, HTTPAdapter):
+                continue
+            pools = adapter.poolmanager.pools
+            # RecentlyUsedContainer deliberately doesn't support iteration.
+            for key in pools.keys():  # noqa: SIM118
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                opened += pool.num_connections
+                sent += pool.num_requests
+    return {"connections_opened": opened, "requests_sent": sent}
+
+
+class _JsonArrayStream:
+    """Incremental decoder for one JSON array inside a document arriving in chunks (see _iter_json_array)."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+
+    def _read(self) -> bool:
+        """Append the next chunk to the buffer, dropping what's been consumed. False at end of stream."""
+        chunk = next(self._chunks, None)
+        self._buffer = self._buffer[self._pos :] + self._decoder.decode(chunk or b"", final=chunk is None)
+        self._pos = 0
+        return chunk is not None
+
+    def _peek(self) -> str:
+        """Skip whitespace and return the next character, or "" at end of stream."""
+        while True:
+            match = _JSON_WHITESPACE_RE.match(self._buffer, self._pos)
+            self._pos = match.end() if match else self._pos
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._read():
+                return ""
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise json.JSONDecodeError(f"Expecting {char!r}", self._buffer, self._pos)
+        self._pos += 1
+
+    def _value(self) -> Any:
+        """Decode the next complete JSON value, reading more of the stream until it's all buffered."""
+        self._peek()
+        while True:
+            try:
+                value, end = _JSON_DECODER.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._read():
+                    continue
+                raise
+            # A number ending exactly at the buffer's end may continue in the next chunk.
+            if end == len(self._buffer) and self._read():
+                continue
+            self._pos = end
+            return value
+
+    def items(self, key: str | None) -> Iterator[Any]:
+        """Yield the array's elements: the document itself if key is None, else the top-level object's key."""
+        if key is not None:
+            self._expect("{")
+            while True:
+                if self._peek() == "}":
+                    return
+                name = self._value()
+                self._expect(":")
+                if name == key:
+                    break
+                self._value()
+                if self._peek() == ",":
+                    self._pos += 1
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+        else:
+            while True:
+                yield self._value()
+                char = self._peek()
+                if char not in (",", "]"):
+                    raise json.JSONDecodeError("Expecting ',' delimiter", self._buffer, self._pos)
+                self._pos += 1
+                if char == "]":
+                    break
+        # Read whatever follows (e.g. Greenhouse's "meta") so the response is consumed in full.
+        for _ in self._chunks:
+            pass
+
+
+def _iter_json_array(chunks: Iterable[bytes], key: str | None = None) -> Iterator[Any]:
+    """Yield the elements of a JSON array one at a time, as the document's chunks arrive.
+
+    The array is the document itself (key None — Lever) or the value of key
+    in the top-level object ("jobs" — Greenhouse). Only the element being
+    decoded and an unconsumed chunk or so are held at once, so memory stays
+    flat however large the board — where json.loads would hold the whole
+    body and every posting's parsed HTML content at the same time. Raises
+    json.JSONDecodeError (a ValueError) on a malformed document, possibly
+    after yielding the elements before the error.
+    """
+    return _JsonArrayStream(chunks).items(key)
+
+
+def _fetch_greenhouse_jobs(
+    careers_url: str,
+    crawl_state: _CrawlState | None = None,
+    departments: list[str] | None = None,
+    offices: list[str] | None = None,
+    skipped: dict[str, int] | None = None,
+    company_name: str = "",
+) -> Iterator[dict[str, str]]:
     """Fetch job listings from a Greenhouse JSON API endpoint.
 
     Requests full job descriptions (content=true) at no extra cost — the
     Greenhouse list endpoint includes them in the same response — so postings
     requiring a clearance above Public Trust can be dropped even when the
-    title alone doesn't say so.
+    title alone doesn't say so. Scanning that HTML is by far the most
+    expensive per-posting step, so it only runs for postings that pass the
+    listing-level stages first (see _listing_filter_stage) — on a typical
+    board, a small minority.
+
+    That payload runs to megabytes for large boards, so it's streamed and
+    decoded one posting at a time (see _iter_json_array): each posting's
+    content is dropped as soon as its title and location have been
+    checked, unless it passes. It also rarely changes between crawls, so
+    given a crawl_state the request is conditional on the validators stored
+    by the board's last complete crawl, and a 304 yields nothing (see
+    _board_not_modified); otherwise only postings missing from the last
+    snapshot are filtered (see _CrawlState).
+
+    Given departments and/or offices (the company's ats_options), only
+    postings in those departments/offices are fetched instead — see
+    _fetch_greenhouse_narrowed_jobs.
 
     Args:
         careers_url: Greenhouse board API URL (already returns JSON).
-
-    Returns:
-        Normalised list of job dicts with title, url, location keys.
+        crawl_state: The board's _CrawlState, completed with the response's
+            validators once the board has been yielded in full. None
+            crawls and filters the whole board unconditionally.
+        departments: Department name substrings to narrow the fetch to.
+        offices: Office name substrings to narrow the fetch to.
+        skipped: The record's _listing_skip_counts counter, which postings
+            dropped by the listing-level stages are counted into. None
+            counts into a fresh one.
+        company_name: The company name job_ids are computed from, so the
+            narrowed fetch can skip content requests for postings already
+            stored (see _known_job_flags).
+
+    Yields:
+        Normalised job dicts with title, url, location keys.
     """
+    if departments or offices:
+        board_match = _GREENHOUSE_BOARD_RE.match(careers_url)
+        if board_match:
+            yield from _fetch_greenhouse_narrowed_jobs(
+                careers_url, board_match.group(1), departments or [], offices or [], crawl_state, company_name, skipped
+            )
+            return
+        logger.warning("Greenhouse departments/offices need a board API URL, fetching the full board", url=careers_url)
+
+    previous = crawl_state.load() if crawl_state is not None else None
     try:
-        resp = requests.get(careers_url, params={"content": "true"}, timeout=30)
+        resp = _http_get(careers_url, params={"content": "true"}, headers=_conditional_headers(previous), stream=True)
         resp.raise_for_status()
     except requests.RequestException as exc:
         logger.warning("Greenhouse fetch failed", url=careers_url, error=str(exc))
-        return []
+        return
+    if _board_not_modified(careers_url, resp, crawl_state):
+        return
 
+    count = 0
+    location_config = _location_filter_config()
+    skipped = skipped if skipped is not None else _listing_skip_counts()
+    clearance_skipped = 0
     try:
-        data = resp.json()
-    except requests.exceptions.JSONDecodeError:
+        for posting in _iter_json_array(resp.iter_content(_JSON_STREAM_CHUNK_SIZE), "jobs"):
+            job = {
+                "title": posting.get("title", ""),
+                "url": posting.get("absolute_url", careers_url),
+                "location": posting.get("location", {}).get("name", ""),
+            }
+            if crawl_state is not None and not crawl_state.is_new(job):
+                continue
+            stage = _listing_filter_stage(job, location_config)
+            if stage is not None:
+                skipped[stage] += 1
+                continue
+            if _requires_excluded_clearance(f"{job['title']} {posting.get('content', '')}"):
+                clearance_skipped += 1
+                continue
+            count += 1
+            yield job
+    except (json.JSONDecodeError, UnicodeDecodeError):
         logger.warning(
             "Greenhouse response is not JSON — careers_url must be the board API endpoint "
             "(e.g. https://boards-api.greenhouse.io/v1/boards/{slug}/jobs), not the human-facing page",
             url=careers_url,
         )
-        return []
+        return
+    except requests.RequestException as exc:
+        logger.warning("Greenhouse fetch failed", url=careers_url, error=str(exc))
+        return
+    finally:
+        resp.close()
+    if crawl_state is not None:
+        crawl_state.complete(_board_validators(resp))
+    logger.info(
+        "Greenhouse jobs fetched",
+        url=careers_url,
+        count=count,
+        clearance_skipped=clearance_skipped,
+    )
+
+
+def _greenhouse_group_matches(group: dict[str, Any], groups_by_id: dict[Any, dict[str, Any]], terms: list[str]) -> bool:
+    """Return whether a Greenhouse department/office's name, or any of its ancestors' names, contains a term."""
+    visited = set()
+    current: dict[str, Any] | None = group
+    while current is not None and current.get("id") not in visited:
+        visited.add(current.get("id"))
+        name = (current.get("name") or "").lower()
+        if any(term in name for term in terms):
+            return True
+        current = groups_by_id.get(current.get("parent_id"))
+    return False
+
+
+def _greenhouse_group_jobs(groups: list[dict[str, Any]], terms: list[str]) -> dict[Any, dict[str, Any]]:
+    """Collect the jobs, keyed by id, listed under every department or office matching terms.
+
+    Matching is a case-insensitive substring match that's inherited down
+    the parent_id hierarchy, so "Engineering" also selects an
+    "Engineering > Infrastructure" sub-department. Departments list their
+    jobs directly; offices list them under their own departments.
+    """
+    lowered = [term.lower() for term in terms]
+    groups_by_id = {group.get("id"): group for group in groups}
+    jobs: dict[Any, dict[str, Any]] = {}
+    for group in groups:
+        if not _greenhouse_group_matches(group, groups_by_id, lowered):
+            continue
+        for job in group.get("jobs", []):
+            jobs[job.get("id")] = job
+        for department in group.get("departments", []):
+            for job in department.get("jobs", []):
+                jobs[job.get("id")] = job
+    return jobs
+
+
+def _fetch_greenhouse_job_content(board_url: str, job_id: Any) -> str:
+    """Fetch one Greenhouse posting's HTML content via the per-job endpoint.
+
+    Returns "" on failure, so the posting fails open to title-only
+    clearance checking — the same as a failed Workday or Built In
+    description fetch.
+    """
+    url = f"{board_url}/jobs/{job_id}"
+    try:
+        resp = _http_get(url)
+        resp.raise_for_status()
+        return resp.json().get("content", "") or ""
+    except (requests.RequestException, requests.exceptions.JSONDecodeError) as exc:
+        logger.warning("Greenhouse job content fetch failed", url=url, error=str(exc))
+        return ""
+
+
+def _fetch_greenhouse_narrowed_jobs(
+    careers_url: str,
+    board_url: str,
+    departments: list[str],
+    offices: list[str],
+    crawl_state: _CrawlState | None,
+    company_name: str,
+    skipped: dict[str, int] | None = None,
+) -> Iterator[dict[str, str]]:
+    """Fetch a Greenhouse board's postings in the given departments and/or offices only.
+
+    The boards API's departments and offices endpoints list every posting
+    (title, URL, location — no content) grouped by department or office,
+    a small fraction of the full content=true board's bytes. Postings in a
+    matching department (and, if offices are given too, a matching office)
+    go through the snapshot diff and listing-level stages as usual, and
+    only the survivors' content is fetched, one per-job request each.
+    Survivors already in JOBS_TABLE are dropped first (see
+    _known_job_flags), and the content request is skipped when the shared
+    verdict cache already has the posting's clearance verdict (see
+    _cached_description_verdicts).
+
+    The listings are small enough to fetch unconditionally, so unlike the
+    full-board fetch this sends no conditional request.
+    """
+    if crawl_state is not None:
+        crawl_state.load()
+
+    selected: dict[Any, dict[str, Any]] | None = None
+    for endpoint, terms in (("departments", departments), ("offices", offices)):
+        if not terms:
+            continue
+        try:
+            resp = _http_get(f"{board_url}/{endpoint}")
+            resp.raise_for_status()
+            groups = resp.json().get(endpoint, [])
+        except (requests.RequestException, requests.exceptions.JSONDecodeError) as exc:
+            logger.warning("Greenhouse fetch failed", url=f"{board_url}/{endpoint}", error=str(exc))
+            return
+        jobs = _greenhouse_group_jobs(groups, terms)
+        selected = jobs if selected is None else {job_id: job for job_id, job in selected.items() if job_id in jobs}
+
+    location_config = _location_filter_config()
+    skipped = skipped if skipped is not None else _listing_skip_counts()
+    candidates: list[tuple[Any, dict[str, str]]] = []
+    for job_id, posting in (selected or {}).items():
+        job = {
+            "title": posting.get("title", ""),
+            "url": posting.get("absolute_url", careers_url),
+            "location": (posting.get("location") or {}).get("name", ""),
+        }
+        if crawl_state is not None and not crawl_state.is_new(job):
+            continue
+        stage = _listing_filter_stage(job, location_config)
+        if stage is not None:
+            skipped[stage] += 1
+            continue
+        candidates.append((job_id, job))
+
+    known = _known_job_flags([job for _, job in candidates], company_name)
+    fresh = [candidate for candidate, is_known in zip(candidates, known, strict=True) if not is_known]
 
-    jobs = []
+    count = 0
+    verdicts_cached = 0
     clearance_skipped = 0
-    for posting in data.get("jobs", []):
-        title = posting.get("title", "")
-        if _requires_excluded_clearance(f"{title} {posting.get('content', '')}"):
+    new_verdicts: list[tuple[str, bool, str]] = []
+    cached = _cached_description_verdicts([job for _, job in fresh])
+    for (job_id, job), verdict in zip(fresh, cached, strict=True):
+        if verdict is None:
+            content = _fetch_greenhouse_job_content(board_url, job_id)
+            verdict = _requires_excluded_clearance(f"{job['title']} {content}")
+            if content:
+                new_verdicts.append((job["url"], verdict, content))
+        else:
+            verdicts_cached += 1
+        if verdict:
             clearance_skipped += 1
             continue
-        jobs.append(
-            {
-                "title": title,
-                "url": posting.get("absolute_url", careers_url),
-                "location": posting.get("location", {}).get("name", ""),
-            }
-        )
-    logger.info("Greenhouse jobs fetched", url=careers_url, count=len(jobs), clearance_skipped=clearance_skipped)
-    return jobs
+        count += 1
+        yield job
+    _store_description_verdicts(new_verdicts)
+
+    if crawl_state is not None:
+        crawl_state.complete()
+    logger.info(
+        "Greenhouse jobs fetched",
+        url=careers_url,
+        count=count,
+        departments=departments,
+        offices=offices,
+        selected=len(selected or {}),
+        known_skipped=len(candidates) - len(fresh),
+        verdicts_cached=verdicts_cached,
+        clearance_skipped=clearance_skipped,
+    )
+
 
+def _lever_description_text(posting: dict[str, Any]) -> str:
+    """Join a Lever posting's description fields: descriptionPlain, each of its lists, and additionalPlain.
 
-def _fetch_lever_jobs(careers_url: str) -> list[dict[str, str]]:
+    The postings API returns these with every listing, so the clearance
+    check needs no per-posting request. lists (e.g. "Requirements") carry
+    HTML content, which the clearance patterns match through just fine.
+    """
+    parts = [posting.get("descriptionPlain") or ""]
+    for section in posting.get("lists") or []:
+        parts.append(section.get("text") or "")
+        parts.append(section.get("content") or "")
+    parts.append(posting.get("additionalPlain") or "")
+    return " ".join(parts)
+
+
+def _fetch_lever_jobs(
+    careers_url: str,
+    crawl_state: _CrawlState | None = None,
+    filters: dict[str, list[str]] | None = None,
+    skipped: dict[str, int] | None = None,
+) -> Iterator[dict[str, str]]:
     """Fetch job listings from a Lever JSON API endpoint.
 
+    Pages through the board with the API's skip/limit params,
+    _LEVER_PAGE_SIZE postings at a time, until a short page. Like
+    _fetch_greenhouse_jobs, each page is streamed and decoded one posting at
+    a time, postings yielded as they're decoded, and postings that pass the
+    listing-level stages are also checked for a clearance requirement in
+    their description fields (see _lever_description_text) — already in the
+    listing, so without an extra request. filters (the company's
+    ats_options) are passed as the API's own query filters, so a large board
+    can be narrowed server-side to e.g. one department.
+
+    Given a crawl_state, postings unchanged since the board's last snapshot
+    are skipped (see _CrawlState). A board that fit in one page is also
+    requested conditionally next time, and skipped whole on a 304 (see
+    _board_not_modified); a larger board's first page being unchanged says
+    nothing about the rest, so no validators are kept for it.
+
     Args:
         careers_url: Lever postings API URL (already returns JSON).
-
-    Returns:
-        Normalised list of job dicts with title, url, location keys.
+        crawl_state: The board's _CrawlState (see _fetch_greenhouse_jobs).
+        filters: Lever query filters — team, department, location,
+            commitment — each a list of exact Lever category values.
+        skipped: The record's listing-stage skip counter (see
+            _fetch_greenhouse_jobs).
+
+    Yields:
+        Normalised job dicts with title, url, location keys.
     """
-    try:
-        resp = requests.get(careers_url, timeout=30)
-        resp.raise_for_status()
-    except requests.RequestException as exc:
-        logger.warning("Lever fetch failed", url=careers_url, error=str(exc))
-        return []
+    previous = crawl_state.load() if crawl_state is not None else None
+    query = {key: values for key, values in (filters or {}).items() if values}
+
+    count = 0
+    pages = 0
+    validators: dict[str, str] = {}
+    location_config = _location_filter_config()
+    skipped = skipped if skipped is not None else _listing_skip_counts()
+    clearance_skipped = 0
+    while pages < _LEVER_MAX_PAGES:
+        try:
+            resp = _http_get(
+                careers_url,
+                params={**query, "skip": pages * _LEVER_PAGE_SIZE, "limit": _LEVER_PAGE_SIZE},
+                headers=_conditional_headers(previous) if pages == 0 else {},
+                stream=True,
+            )
+            resp.raise_for_status()
+        except requests.RequestException as exc:
+            logger.warning("Lever fetch failed", url=careers_url, page=pages + 1, error=str(exc))
+            return
+        if pages == 0:
+            if _board_not_modified(careers_url, resp, crawl_state):
+                return
+            validators = _board_validators(resp)
+
+        page_postings = 0
+        try:
+            for posting in _iter_json_array(resp.iter_content(_JSON_STREAM_CHUNK_SIZE)):
+                page_postings += 1
+                job = {
+                    "title": posting.get("text", ""),
+                    "url": posting.get("hostedUrl", careers_url),
+                    "location": posting.get("categories", {}).get("location", ""),
+                }
+                if crawl_state is not None and not crawl_state.is_new(job):
+                    continue
+                stage = _listing_filter_stage(job, location_config)
+                if stage is not None:
+                    skipped[stage] += 1
+                    continue
+                if _requires_excluded_clearance(f"{job['title']} {_lever_description_text(posting)}"):
+                    clearance_skipped += 1
+                    continue
+                count += 1
+                yield job
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            logger.warning(
+                "Lever response is not JSON — careers_url must be the postings API endpoint "
+                "(e.g. https://api.lever.co/v0/postings/{slug}), not the human-facing page",
+                url=careers_url,
+            )
+            return
+        except requests.RequestException as exc:
+            logger.warning("Lever fetch failed", url=careers_url, page=pages + 1, error=str(exc))
+            return
+        finally:
+            resp.close()
+        pages += 1
+        if page_postings < _LEVER_PAGE_SIZE:
+            break
 
-    try:
-        data = resp.json()
-    except requests.exceptions.JSONDecodeError:
-        logger.warning(
-            "Lever response is not JSON — careers_url must be the postings API endpoint "
-            "(e.g. https://api.lever.co/v0/postings/{slug}), not the human-facing page",
-            url=careers_url,
-        )
-        return []
-
-    jobs = []
-    for posting in data:
-        jobs.append(
-            {
-                "title": posting.get("text", ""),
-                "url": posting.get("hostedUrl", careers_url),
-                "location": posting.get("categories", {}).get("location", ""),
-            }
-        )
-    logger.info("Lever jobs fetched", url=careers_url, count=len(jobs))
-    return jobs
+    if crawl_state is not None:
+        crawl_state.complete(validators if pages == 1 else None)
+    logger.info(
+        "Lever jobs fetched",
+        url=careers_url,
+        count=count,
+        pages=pages,
+        filters=query,
+        clearance_skipped=clearance_skipped,
+    )
 
 
 def _fetch_workday_job_description(tenant: str, wd: str, site: str, external_path: str) -> str:
@@ -484,7 +1887,7 @@ def _fetch_workday_job_description(tenant: str, wd: str, site: str, external_pat
     """
     detail_url = f"https://{tenant}.{wd}.myworkdayjobs.com/wday/cxs/{tenant}/{site}{external_path}"
     try:
-        resp = requests.get(detail_url, timeout=30)
+        resp = _http_get(detail_url)
         resp.raise_for_status()
         data = resp.json()
     except (requests.RequestException, requests.exceptions.JSONDecodeError) as exc:
@@ -493,188 +1896,869 @@ def _fetch_workday_job_description(tenant: str, wd: str, site: str, external_pat
     return data.get("jobPostingInfo", {}).get("jobDescription", "")
 
 
-def _fetch_workday_jobs(careers_url: str) -> list[dict[str, str]]:
+def _workday_requisition_id(posting: dict[str, Any]) -> str:
+    """Return the requisition a Workday search result is a copy of.
+
+    Large tenants post one requisition once per location, each copy with its
+    own externalPath (e.g. /job/Dallas-TX/Engineer_R123 and
+    /job/Austin-TX/Engineer_R123-1) but the same description. The
+    requisition ID is the path's trailing _-separated suffix — or the first
+    of the posting's bulletFields, but only when that suffix is the ID
+    itself or a numbered copy of it ("R123-1"). Tenants fill bulletFields
+    with whatever they like, and trusting a shared value there would hand
+    unrelated postings one description and one clearance verdict. A path
+    without a suffix is its own requisition.
+
+    Copies of one requisition are still separate jobs (each location is
+    its own posting); they just share a single description fetch and
+    clearance verdict.
+    """
+    external_path = posting.get("externalPath", "")
+    _, separator, suffix = external_path.rpartition("_")
+    if not separator or not suffix:
+        return external_path
+    bullet_fields = posting.get("bulletFields") or []
+    requisition = str(bullet_fields[0]) if bullet_fields and bullet_fields[0] else ""
+    if requisition and (suffix == requisition or suffix.startswith(f"{requisition}-")):
+        return requisition
+    return suffix
+
+
+def _concurrency_setting(env_var: str, default: int) -> int:
+    """Read a per-host concurrency env var, clamped to [1, _HTTP_POOL_MAXSIZE].
+
+    The upper bound keeps every concurrent request on a pooled keep-alive
+    connection (see _http_session) rather than overflowing the pool.
+    """
+    concurrency = int(os.environ.get(env_var, default))
+    return max(1, min(concurrency, _HTTP_POOL_MAXSIZE))
+
+
+def _fetch_workday_search_page(
+    api_url: str, keyword: str, offset: int, page_size: int = _WORKDAY_PAGE_SIZE
+) -> dict[str, Any] | None:
+    """Fetch one page of a Workday keyword search ("" for the whole board). Returns None on any failure."""
+    try:
+        resp = _http_post(
+            api_url,
+            json={"limit": page_size, "offset": offset, "searchText": keyword},
+            headers={"Content-Type": "application/json"},
+        )
+        resp.raise_for_status()
+    except requests.RequestException as exc:
+        logger.warning("Workday fetch failed", url=api_url, keyword=keyword, offset=offset, error=str(exc))
+        return None
+
+    try:
+        return resp.json()
+    except requests.exceptions.JSONDecodeError:
+        logger.warning("Workday response is not JSON", url=api_url, keyword=keyword, offset=offset)
+        return None
+
+
+def _workday_posted_days_ago(posted_on: str) -> int | None:
+    """Parse a Workday search result's postedOn into days ago, or None if it isn't in a known form.
+
+    Workday caps the age it reports ("Posted 30+ Days Ago"). A capped age
+    is None too: it says nothing about how capped postings are ordered
+    among themselves, nor how old one will be tomorrow, so neither a page
+    holding one nor a mark taken from one can be trusted.
+    """
+    match = _WORKDAY_POSTED_ON_RE.match(posted_on.strip())
+    if not match:
+        return None
+    today, yesterday, days, capped = match.groups()
+    if today:
+        return 0
+    if yesterday:
+        return 1
+    if capped:
+        return None
+    return int(days)
+
+
+def _workday_high_water(posting: dict[str, Any], now: float) -> dict[str, Any]:
+    """Build a search's high-water mark from its newest posting, to store in the board's crawl state."""
+    mark: dict[str, Any] = {"path": posting.get("externalPath", ""), "marked_at": int(now)}
+    posted_days_ago = _workday_posted_days_ago(posting.get("postedOn", ""))
+    if posted_days_ago is not None:
+        mark["posted_days_ago"] = posted_days_ago
+    return mark
+
+
+def _workday_mark_age(mark: dict[str, Any], now: float) -> int | None:
+    """Return how many days ago a stored high-water mark's posting was posted, as of now.
+
+    Rounds the time since the mark was taken up to whole days, so a posting
+    that went up later on the day the mark was taken never counts as older
+    than it. None if the mark's own age wasn't known.
+    """
+    if "posted_days_ago" not in mark:
+        return None
+    elapsed_days = -(-max(0, int(now) - int(mark["marked_at"])) // 86400)
+    return int(mark["posted_days_ago"]) + elapsed_days
+
+
+def _workday_page_reaches_mark(
+    postings: list[dict[str, Any]], mark_path: str, mark_age: int | None, last_age: int | None
+) -> tuple[bool | None, int | None]:
+    """Check one page of a search against its high-water mark, returning (reached, last posting age).
+
+    Pages are read newest first, so once a page holds the mark's posting
+    itself, or ends on a posting posted before it, every later page is
+    older still. Nothing asks Workday for that order, though, so it's
+    checked rather than assumed: last_age is the age the previous page
+    ended on and carries the date-order check across pages, and reached is
+    None if the page turns out not to be in posting-date order (or has an
+    age that can't be parsed) — or if it holds the mark's posting at an age
+    the mark doesn't account for (see _workday_mark_age), as when a search
+    ordered by relevance keeps the same top result day after day. Either
+    way the mark can't say anything about later pages. Every posting on the
+    page is checked, the mark's included, before the mark is trusted.
+
+    This is what makes a Workday crawl incremental. Each search stores its
+    newest posting as its high-water mark (see _workday_high_water), and on
+    the next crawl its pages are walked one at a time instead of all queued
+    at once, stopping at the first page that reaches the mark — on a
+    steady-state day, a page or two per search rather than every page. A
+    search whose pages can't be trusted has the rest of them queued as
+    usual. A search that lost a page keeps its previous mark, so the lost
+    postings are read again next time, and every _CRAWL_STATE_TTL_SECONDS
+    the expired state makes for a full crawl again.
+    """
+    reached = False
+    for posting in postings:
+        age = _workday_posted_days_ago(posting.get("postedOn", ""))
+        if age is None or (last_age is not None and age < last_age):
+            return None, last_age
+        last_age = age
+        if posting.get("externalPath") == mark_path:
+            # The mark's age is rounded up to whole days since it was taken.
+            if mark_age is None or not mark_age - 1 <= age <= mark_age:
+                return None, last_age
+            reached = True
+    return reached or (mark_age is not None and last_age is not None and last_age > mark_age), last_age
+
+
+def _workday_crawl_plan(total: int, page_size: int) -> str:
+    """Pick the cheaper way to cover a Workday board of `total` postings.
+
+    `total` comes from a probe request — the first page of an empty search,
+    i.e. of the whole board — whose postings are kept either way. A full
+    scan needs ceil(total / page_size) pages, the first of which is the
+    probe already in hand; the keyword searches (one per _TITLE_KEYWORDS
+    entry, via the searchText param) need at least one page each on top of
+    it. So a board whose remaining pages number no more than the keywords
+    is scanned whole — one pass over every posting instead of several
+    overlapping fuzzy searches.
+
+    Board sizes vary enormously — a few hundred postings for a startup vs.
+    17,000+ for a national retail chain with a posting per store — but
+    Workday narrows keyword searches server-side, so their results stay a
+    manageable size regardless (empirically, CVS's ~17,700 postings narrow
+    to under 300 for any single keyword). A failed probe falls back to the
+    keyword searches, and an ats_options "strategy" can force either plan,
+    "keywords" skipping the probe altogether.
+    """
+    remaining_pages = max(0, -(-total // page_size) - 1)
+    return "full" if remaining_pages <= len(_TITLE_KEYWORDS) else "keywords"
+
+
+def _fetch_workday_jobs(
+    careers_url: str,
+    company_name: str,
+    crawl_state: _CrawlState | None = None,
+    strategy: str = "auto",
+    page_size: int = _WORKDAY_PAGE_SIZE,
+    skipped: dict[str, int] | None = None,
+) -> Iterator[dict[str, str]]:
     """Fetch job listings from a Workday-hosted careers site via its unofficial JSON API.
 
-    Parses the tenant/site from a myworkdayjobs.com careers URL, then issues
-    one paginated search per _TITLE_KEYWORDS entry (via the `searchText`
-    param) instead of paginating the company's entire board unfiltered.
-    Company board sizes vary enormously — a few hundred postings for a
-    startup vs. 17,000+ for a national retail chain with a posting per store
-    — but Workday's search narrows results server-side, so the keyword-
-    scoped subset stays a manageable size regardless of company size (e.g.
-    empirically, CVS's ~17,700 total postings narrow to under 300 for any
-    single one of these keywords). Workday's search is a fuzzy full-text
-    match, not an exact substring one (e.g. searching "platform" surfaces
-    unrelated titles too), so every result is still re-checked with the
-    exact _title_looks_relevant filter before being kept — this only saves
-    us from scanning thousands of irrelevant postings to find the relevant
-    ones. The same posting can surface under multiple keywords, so seen_paths
-    dedupes across searches to avoid double-processing (and double-fetching
-    descriptions for) the same posting. For postings whose title already
-    looks relevant, a follow-up request fetches the full description to
-    catch clearance requirements that aren't mentioned in the title.
+    Parses the tenant/site from a myworkdayjobs.com careers URL, probes the
+    board's size with the first page of an empty search, and either scans
+    the whole board or runs one paginated search per _TITLE_KEYWORDS entry
+    — whichever costs fewer requests (see _workday_crawl_plan). Search
+    matching is fuzzy, so every result still goes through the listing-level
+    stages (see _listing_filter_stage), and seen_paths dedupes postings that
+    surface under several keywords.
+
+    Every search's pages are requested concurrently (bounded by
+    WORKDAY_SEARCH_CONCURRENCY) and consumed in this thread as they
+    complete, which keeps seen_paths consistent without a lock. Postings
+    that pass are batch-checked against the jobs table (see
+    _known_job_flags) and the shared verdict cache (see
+    _cached_description_verdicts); only the rest have their description
+    fetched, one per requisition (see _workday_requisition_id), on a pool
+    bounded by WORKDAY_DESCRIPTION_CONCURRENCY, to catch clearance
+    requirements the title doesn't mention. Jobs are yielded batch by
+    batch, in (keyword, offset) order, while later pages are still being
+    searched.
+
+    Given a crawl_state, postings unchanged since the board's last snapshot
+    are skipped (see _CrawlState), and each search stops at the first page
+    that reaches its stored high-water mark (see
+    _workday_page_reaches_mark). A failed page, or a crawl that stopped
+    early, leaves a partial snapshot for the next crawl to fill in.
 
     Args:
         careers_url: Careers URL of the form
             https://{tenant}.wd{N}.myworkdayjobs.com/{site}.
-
-    Returns:
-        Normalised list of job dicts with title, url, location keys.
+        company_name: Company the postings belong to, used to compute their
+            job_ids for the known-job check.
+        crawl_state: The board's _CrawlState, completed once every search
+            has been yielded. None filters every posting.
+        strategy: "auto" to choose the plan from the probe's total, or
+            "full"/"keywords" to force one (see _WORKDAY_STRATEGIES).
+        page_size: Postings requested per search page.
+        skipped: The record's listing-stage skip counter (see
+            _fetch_greenhouse_jobs).
+
+    Yields:
+        Normalised job dicts with title, url, location keys.
     """
     match = _WORKDAY_URL_RE.match(careers_url)
     if not match:
         logger.warning("Not a parseable myworkdayjobs.com URL", url=careers_url)
-        return []
+        return
     tenant, wd, site = match.groups()
     base_url = f"https://{tenant}.{wd}.myworkdayjobs.com/{site}"
     api_url = f"https://{tenant}.{wd}.myworkdayjobs.com/wday/cxs/{tenant}/{site}/jobs"
-
-    jobs = []
-    clearance_skipped = 0
+    now = time.time()
+    previous_high_water: dict[str, dict[str, Any]] = {}
+    if crawl_state is not None:
+        previous = crawl_state.load()
+        previous_high_water = (previous or {}).get("high_water", {})
+    # The previous crawl's high-water mark per search, as (posting path, age
+    # in days as of now).
+    marks = {keyword: (mark["path"], _workday_mark_age(mark, now)) for keyword, mark in previous_high_water.items()}
+
+    search_concurrency = _concurrency_setting("WORKDAY_SEARCH_CONCURRENCY", _WORKDAY_DEFAULT_SEARCH_CONCURRENCY)
+    description_concurrency = _concurrency_setting(
+        "WORKDAY_DESCRIPTION_CONCURRENCY", _WORKDAY_DEFAULT_DESCRIPTION_CONCURRENCY
+    )
+    candidates: list[dict[str, str]] = []
+    candidate_keys: list[tuple[tuple[int, int, int], str, str]] = []
+    # Each pending job carries either its cached clearance verdict or its
+    # in-flight description fetch.
+    pending: deque[tuple[dict[str, str], bool | Future[str]]] = deque()
+    new_verdicts: list[tuple[str, bool, str]] = []
     seen_paths: set[str] = set()
+    # Description fetches by requisition ID, shared by all of its copies.
+    descriptions: dict[str, Future[str]] = {}
+    plan = strategy if strategy != "auto" else None
+    probe_total: int | None = None
+    high_water: dict[str, dict[str, Any]] = {}
+    # Offset each search pages up to, and the age of the last posting read
+    # so far from each search being walked incrementally.
+    last_offsets: dict[str, int] = {}
+    walking: dict[str, int | None] = {}
+    # Searches that lost a page to a failed request this crawl.
+    failed_searches: set[str] = set()
+    search_requests = 0
+    search_pages_skipped = 0
+    count = 0
+    location_config = _location_filter_config()
+    skipped = skipped if skipped is not None else _listing_skip_counts()
+    known_skipped = 0
+    verdicts_cached = 0
+    descriptions_shared = 0
+    clearance_skipped = 0
 
-    for keyword in _TITLE_KEYWORDS:
-        offset = 0
-        while offset < _WORKDAY_MAX_JOBS_PER_KEYWORD:
-            try:
-                resp = requests.post(
-                    api_url,
-                    json={"limit": _WORKDAY_PAGE_SIZE, "offset": offset, "searchText": keyword},
-                    headers={"Content-Type": "application/json"},
-                    timeout=30,
-                )
-                resp.raise_for_status()
-            except requests.RequestException as exc:
-                logger.warning("Workday fetch failed", url=api_url, keyword=keyword, error=str(exc))
-                break
-
-            try:
-                data = resp.json()
-            except requests.exceptions.JSONDecodeError:
-                logger.warning("Workday response is not JSON", url=api_url, keyword=keyword)
-                break
-
-            postings = data.get("jobPostings", [])
-            if not postings:
-                break
-
-            for posting in postings:
-                external_path = posting.get("externalPath", "")
-                if external_path in seen_paths:
-                    continue
-                title = posting.get("title", "")
-                if not _title_looks_relevant(title):
+    with (
+        ThreadPoolExecutor(max_workers=search_concurrency, thread_name_prefix=f"workday-search-{tenant}") as searcher,
+        ThreadPoolExecutor(max_workers=description_concurrency, thread_name_prefix=f"workday-{tenant}") as describer,
+    ):
+        # Searches are keyed (search index, searchText, offset); index 0 is
+        # the whole-board probe, so its postings sort ahead of the keywords'.
+        searches: dict[Future[dict[str, Any] | None], tuple[int, str, int]] = {}
+
+        def search(search_index: int, keyword: str, offset: int) -> None:
+            page = searcher.submit(_fetch_workday_search_page, api_url, keyword, offset, page_size)
+            searches[page] = (search_index, keyword, offset)
+
+        def search_keywords() -> None:
+            for keyword_index, keyword in enumerate(_TITLE_KEYWORDS, start=1):
+                search(keyword_index, keyword, 0)
+
+        if plan == "keywords":
+            search_keywords()
+        else:
+            search(0, "", 0)
+        while searches:
+            done, _ = wait(searches, return_when=FIRST_COMPLETED)
+            for future in done:
+                keyword_index, keyword, offset = searches.pop(future)
+                search_requests += 1
+                data = future.result()
+                if data is None:
+                    if keyword_index == 0 and offset == 0:
+                        plan = "keywords"
+                        search_keywords()
+                    else:
+                        failed_searches.add(keyword)
+                        walking.pop(keyword, None)
                     continue
-                seen_paths.add(external_path)
-                description = _fetch_workday_job_description(tenant, wd, site, external_path)
-                if _requires_excluded_clearance(f"{title} {description}"):
-                    clearance_skipped += 1
-                    continue
-                jobs.append(
-                    {
-                        "title": title,
+
+                postings = data.get("jobPostings", [])
+                if offset == 0:
+                    total = data.get("total", 0)
+                    if keyword_index == 0:
+                        probe_total = total
+                        plan = plan or _workday_crawl_plan(total, page_size)
+                        if plan == "full" and total > _WORKDAY_MAX_JOBS_PER_KEYWORD:
+                            logger.warning(
+                                "Workday board truncated",
+                                url=careers_url,
+                                total=total,
+                                read=_WORKDAY_MAX_JOBS_PER_KEYWORD,
+                            )
+                    if keyword_index == 0 and plan != "full":
+                        search_keywords()
+                    else:
+                        last_offsets[keyword] = min(total, _WORKDAY_MAX_JOBS_PER_KEYWORD)
+                        if postings:
+                            high_water[keyword] = _workday_high_water(postings[0], now)
+                        if keyword in marks:
+                            walking[keyword] = None
+                        else:
+                            for next_offset in range(page_size, last_offsets[keyword], page_size):
+                                search(keyword_index, keyword, next_offset)
+
+                if keyword in walking:
+                    reached, walking[keyword] = _workday_page_reaches_mark(postings, *marks[keyword], walking[keyword])
+                    next_offset = offset + page_size
+                    if reached is None:
+                        del walking[keyword]
+                        for later_offset in range(next_offset, last_offsets[keyword], page_size):
+                            search(keyword_index, keyword, later_offset)
+                    elif reached or next_offset >= last_offsets[keyword]:
+                        del walking[keyword]
+                        search_pages_skipped += len(range(next_offset, last_offsets[keyword], page_size))
+                    else:
+                        search(keyword_index, keyword, next_offset)
+
+                for position, posting in enumerate(postings):
+                    external_path = posting.get("externalPath", "")
+                    if external_path in seen_paths:
+                        continue
+                    seen_paths.add(external_path)
+                    job = {
+                        "title": posting.get("title", ""),
                         "url": base_url + external_path,
                         "location": posting.get("locationsText", ""),
                     }
+                    if crawl_state is not None and not crawl_state.is_new(job):
+                        continue
+                    stage = _listing_filter_stage(job, location_config)
+                    if stage is not None:
+                        skipped[stage] += 1
+                        continue
+                    candidates.append(job)
+                    candidate_keys.append(
+                        ((keyword_index, offset, position), external_path, _workday_requisition_id(posting))
+                    )
+
+            if len(candidates) >= _DYNAMODB_BATCH_GET_LIMIT or not searches:
+                known = _known_job_flags(candidates, company_name)
+                batch = sorted(
+                    zip(candidate_keys, candidates, known, strict=True), key=lambda candidate: candidate[0][0]
                 )
+                fresh = [
+                    ((external_path, requisition), job)
+                    for (_, external_path, requisition), job, is_known in batch
+                    if not is_known
+                ]
+                known_skipped += len(batch) - len(fresh)
+                cached = _cached_description_verdicts([job for _, job in fresh])
+                for ((external_path, requisition), job), verdict in zip(fresh, cached, strict=True):
+                    if verdict is None:
+                        if requisition in descriptions:
+                            descriptions_shared += 1
+                        else:
+                            descriptions[requisition] = describer.submit(
+                                _fetch_workday_job_description, tenant, wd, site, external_path
+                            )
+                        pending.append((job, descriptions[requisition]))
+                    else:
+                        verdicts_cached += 1
+                        pending.append((job, verdict))
+                candidates, candidate_keys = [], []
+
+            # Hand over every job whose verdict is already known or whose
+            # description is already in; once the searches are done, wait
+            # for the rest.
+            while pending and (not searches or isinstance(pending[0][1], bool) or pending[0][1].done()):
+                job, verdict = pending.popleft()
+                if not isinstance(verdict, bool):
+                    description = verdict.result()
+                    verdict = _requires_excluded_clearance(f"{job['title']} {description}")
+                    if description:
+                        new_verdicts.append((job["url"], verdict, description))
+                if verdict:
+                    clearance_skipped += 1
+                    continue
+                count += 1
+                yield job
+
+            if len(new_verdicts) >= _DYNAMODB_BATCH_GET_LIMIT or (new_verdicts and not searches):
+                _store_description_verdicts(new_verdicts)
+                new_verdicts = []
+
+    if crawl_state is not None:
+        # A search that lost a page keeps its previous mark, so the next
+        # crawl walks back over the postings that page held.
+        crawl_state.high_water = previous_high_water | {
+            keyword: mark for keyword, mark in high_water.items() if keyword not in failed_searches
+        }
+        crawl_state.complete(partial=search_pages_skipped > 0 or bool(failed_searches))
+    logger.info(
+        "Workday jobs fetched",
+        url=careers_url,
+        count=count,
+        known_skipped=known_skipped,
+        verdicts_cached=verdicts_cached,
+        descriptions_shared=descriptions_shared,
+        clearance_skipped=clearance_skipped,
+        strategy=plan,
+        probe_total=probe_total,
+        page_size=page_size,
+        incremental=bool(marks),
+        search_requests=search_requests,
+        search_pages_skipped=search_pages_skipped,
+        search_concurrency=search_concurrency,
+        description_concurrency=description_concurrency,
+    )
 
-            offset += _WORKDAY_PAGE_SIZE
-            if offset >= data.get("total", 0):
-                break
 
-    logger.info("Workday jobs fetched", url=careers_url, count=len(jobs), clearance_skipped=clearance_skipped)
-    return jobs
+def _company_name_key(name: str) -> tuple[str, ...]:
+    """Normalise a company name to the words it's matched on.
+
+    Lowercases it, splits it into words (so punctuation and "&" don't
+    count), and drops leading _COMPANY_NAME_PREFIXES and trailing
+    _COMPANY_NAME_SUFFIXES — unless that would leave nothing, as for a
+    company called "Global". E.g. "Coinbase Global, Inc." -> ("coinbase",),
+    "CACI International" -> ("caci",), "The Home Depot" -> ("home", "depot").
+    """
+    words = _COMPANY_NAME_WORD_RE.findall(name.lower())
+    start, end = 0, len(words)
+    while end - start > 1 and words[start] in _COMPANY_NAME_PREFIXES:
+        start += 1
+    while end - start > 1 and words[end - 1] in _COMPANY_NAME_SUFFIXES:
+        end -= 1
+    return tuple(words[start:end])
+
+
+@dataclass(frozen=True)
+class _KnownCompanyIndex:
+    """The companies tracked in COMPANIES_TABLE, indexed by name key for _fetch_builtin_jobs.
+
+    Built In's display name for a company often differs slightly from
+    companies.json's, so a card matches a tracked company when their
+    _company_name_key()s are equal, or one is a leading run of the other's
+    words ("Datadog Government" vs "Datadog", "Booz Allen" vs "Booz Allen
+    Hamilton"); a leading "The" is ignored on either side. Both directions
+    are set lookups, so a card costs one probe per word of its name however
+    many companies are tracked — and, unlike plain substring containment,
+    "Box" no longer matches "Dropbox".
+
+    Attributes:
+        keys: Every tracked company's name key.
+        prefixes: Every leading run of words of every tracked company's
+            name key, the keys themselves included.
+    """
 
+    keys: frozenset[tuple[str, ...]]
+    prefixes: frozenset[tuple[str, ...]]
 
-def _get_known_company_names() -> set[str]:
-    """Return the lowercased names of companies already tracked in COMPANIES_TABLE."""
-    table = dynamodb.Table(os.environ["COMPANIES_TABLE"])
-    items = table.scan(ProjectionExpression="company_name").get("Items", [])
-    return {item["company_name"].lower() for item in items}
+    @classmethod
+    def from_names(cls, names: Iterable[str]) -> _KnownCompanyIndex:
+        keys = {key for key in map(_company_name_key, names) if key}
+        prefixes = {key[:end] for key in keys for end in range(1, len(key) + 1)}
+        return cls(frozenset(keys), frozenset(prefixes))
 
+    def matches(self, company: str) -> bool:
+        """Check whether a Built In company name matches an already-tracked company."""
+        key = _company_name_key(company)
+        if not key:
+            return False
+        return key in self.prefixes or any(key[:end] in self.keys for end in range(1, len(key)))
 
-def _is_known_company(company: str, known_companies: set[str]) -> bool:
-    """Check whether a Built In company name matches an already-tracked company.
 
-    Uses substring containment (not just exact match) since Built In's display
-    name for a company often differs slightly from companies.json (e.g. "CACI"
-    vs "CACI International", "Coinbase Global, Inc." vs "Coinbase").
+# The _KnownCompanyIndex per COMPANIES_TABLE, with the time.monotonic() it
+# was built at, kept at module level so warm invocations — and the several
+# Built In searches a batch can hold — share one scan of the table.
+_known_company_indexes: dict[str, tuple[float, _KnownCompanyIndex]] = {}
+_known_company_indexes_lock = threading.Lock()
+
+
+def _scan_company_names(table_name: str) -> list[str]:
+    """Return the name of every company in a companies table, following the scan's pages.
+
+    Goes through the resource's client, as concurrent Built In searches in a
+    batch can get here at once (see _put_new_job).
     """
-    company_lower = company.lower()
-    return any(known in company_lower or company_lower in known for known in known_companies)
+    names: list[str] = []
+    kwargs: dict[str, Any] = {"TableName": table_name, "ProjectionExpression": "company_name"}
+    while True:
+        response = dynamodb.meta.client.scan(**kwargs)
+        names.extend(item["company_name"] for item in response.get("Items", []))
+        if "LastEvaluatedKey" not in response:
+            return names
+        kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
 
 
-def _work_type_matches(
-    location: str, location_env_var: str, work_type_env_var: str, default_location: str, default_work_type: str
-) -> bool:
-    """Shared implementation behind _location_matches and _builtin_location_matches.
+def _known_company_index() -> _KnownCompanyIndex:
+    """Return the _KnownCompanyIndex of COMPANIES_TABLE, rebuilt once _KNOWN_COMPANIES_TTL_SECONDS old.
+
+    The lock is held across the scan so concurrent Built In searches in a
+    batch wait for the first one's rather than each scanning the table.
+    """
+    table_name = os.environ["COMPANIES_TABLE"]
+    with _known_company_indexes_lock:
+        cached = _known_company_indexes.get(table_name)
+        if cached is not None and time.monotonic() - cached[0] < _KNOWN_COMPANIES_TTL_SECONDS:
+            return cached[1]
+        names = _scan_company_names(table_name)
+        index = _KnownCompanyIndex.from_names(names)
+        _known_company_indexes[table_name] = (time.monotonic(), index)
+    logger.info("Known companies loaded", table=table_name, companies=len(names), keys=len(index.keys))
+    return index
+
+
+@dataclass(frozen=True)
+class _FilterConfig:
+    """A compiled LOCATION/WORK_TYPE pair (or the BUILTIN_* pair).
 
     A job is kept if its location contains the configured target location
     substring, or its location indicates the configured work type (or the
-    work type env var is "any", or its value isn't a recognised keyword, in
-    which case it's matched literally as a substring too). If the work type
-    is "any" and no target location is configured, the whole check is
-    disabled and every job passes, blank location included. Otherwise an
-    empty location fails the match — this filter narrows down to a specific
-    set, unlike the fail-open non-US location filter.
+    work type is "any", or isn't a recognised keyword, in which case it's
+    matched literally as a substring too). If the work type is "any" and no
+    target location is configured, the whole check is disabled and every job
+    passes, blank location included. Otherwise an empty location fails the
+    match — this filter narrows down to a specific set, unlike the fail-open
+    non-US location filter.
+
+    Built by _filter_config, once per distinct env var value per container,
+    with the target location already lowercased and the work type already
+    resolved to its _WORK_TYPE_KEYWORDS list. Hashable, so it can key the
+    _classify_location memo.
     """
-    target_location = os.environ.get(location_env_var, default_location)
-    work_type = os.environ.get(work_type_env_var, default_work_type).lower()
 
-    if not target_location and work_type == "any":
-        return True
+    target_location: str
+    any_work_type: bool
+    work_type_keywords: tuple[str, ...]
+
+    def matches(self, location: str) -> bool:
+        """Apply the rules above to one location string."""
+        if not self.target_location and self.any_work_type:
+            return True
+        if not location:
+            return False
+        location_lower = location.lower()
+        if self.target_location and self.target_location in location_lower:
+            return True
+        if self.any_work_type:
+            return True
+        return any(kw in location_lower for kw in self.work_type_keywords)
+
+
+@cache
+def _compile_filter_config(target_location: str, work_type: str) -> _FilterConfig:
+    """Compile raw LOCATION/WORK_TYPE-style env values into a _FilterConfig (memoized)."""
+    work_type = work_type.lower()
+    return _FilterConfig(
+        target_location=target_location.lower(),
+        any_work_type=work_type == "any",
+        work_type_keywords=tuple(_WORK_TYPE_KEYWORDS.get(work_type, [work_type])),
+    )
 
-    if not location:
-        return False
-    location_lower = location.lower()
 
-    if target_location and target_location.lower() in location_lower:
-        return True
-    if work_type == "any":
-        return True
-    keywords = _WORK_TYPE_KEYWORDS.get(work_type, [work_type])
-    return any(kw in location_lower for kw in keywords)
+def _filter_config(
+    location_env_var: str, work_type_env_var: str, default_location: str, default_work_type: str
+) -> _FilterConfig:
+    """Return the compiled _FilterConfig for the current values of a location/work type env var pair.
+
+    Reads the env vars on every call — two dict lookups, done once per fetch
+    or filter pass rather than once per job — but compiles each distinct
+    pair of values only once per container.
+    """
+    return _compile_filter_config(
+        os.environ.get(location_env_var, default_location), os.environ.get(work_type_env_var, default_work_type)
+    )
 
 
-def _location_matches(location: str) -> bool:
-    """Check a job's location against the configured LOCATION / WORK_TYPE env vars.
+def _location_filter_config() -> _FilterConfig:
+    """Return the compiled LOCATION / WORK_TYPE config.
 
     Applies to every ATS backend except "builtin", which has its own
     independent BUILTIN_LOCATION / BUILTIN_WORK_TYPE config (see
-    _builtin_location_matches) — kept separate because the curated company
+    _builtin_filter_config) — kept separate because the curated company
     list includes companies chosen for proximity to a specific future
     location, so a hybrid/on-site preference there shouldn't be governed by
     the same "remote only" default that makes sense for Built In's broad
-    discovery search. Defaults to remote-only. See _work_type_matches for
-    the shared matching rules.
+    discovery search. Defaults to remote-only.
     """
-    return _work_type_matches(location, "LOCATION", "WORK_TYPE", _DEFAULT_LOCATION, _DEFAULT_WORK_TYPE)
+    return _filter_config("LOCATION", "WORK_TYPE", _DEFAULT_LOCATION, _DEFAULT_WORK_TYPE)
 
 
-def _builtin_location_matches(location: str) -> bool:
-    """Check a Built In job's location against the configured target location or work type.
+def _builtin_filter_config() -> _FilterConfig:
+    """Return the compiled BUILTIN_LOCATION / BUILTIN_WORK_TYPE config.
 
-    Controlled by the BUILTIN_LOCATION (default "" — disabled) and
-    BUILTIN_WORK_TYPE (default "remote") env vars, independent of the
-    LOCATION / WORK_TYPE env vars used by every other backend (see
-    _location_matches). Defaults to pure remote-only filtering, matching the
-    user's own manual search practice on builtin.com (leave location blank,
-    filter to Remote). See _work_type_matches for the shared matching rules.
+    BUILTIN_LOCATION defaults to "" (disabled) and BUILTIN_WORK_TYPE to
+    "remote", independent of the LOCATION / WORK_TYPE env vars used by every
+    other backend (see _location_filter_config). That's pure remote-only
+    filtering, matching the user's own manual search practice on builtin.com
+    (leave location blank, filter to Remote).
     """
-    return _work_type_matches(
-        location, "BUILTIN_LOCATION", "BUILTIN_WORK_TYPE", _BUILTIN_DEFAULT_LOCATION, _BUILTIN_DEFAULT_WORK_TYPE
+    return _filter_config(
+        "BUILTIN_LOCATION", "BUILTIN_WORK_TYPE", _BUILTIN_DEFAULT_LOCATION, _BUILTIN_DEFAULT_WORK_TYPE
     )
 
 
-def _builtin_card_text_by_icon(card: Tag, icon_class: str) -> str:
-    """Extract the text sibling next to a Font Awesome icon within a Built In job card."""
-    icon = card.select_one(f".{icon_class}")
-    if not icon:
-        return ""
-    parent = icon.find_parent("div")
-    sibling = parent.find_next_sibling() if parent else None
-    return sibling.get_text(strip=True) if sibling else ""
+@lru_cache(maxsize=_LOCATION_CACHE_SIZE)
+def _classify_location(location: str, config: _FilterConfig | None) -> tuple[bool, bool]:
+    """Return (is non-US, matches config) for a location string, memoized per container.
+
+    Location strings repeat heavily within and across boards, so each
+    distinct (location, config) pair runs the non-US regex and the work
+    type match only once. A None config always matches.
+    """
+    return _is_non_us_location(location), config is None or config.matches(location)
+
+
+def _parse_worker(conn: Connection) -> None:
+    """Serve a _ParsePool worker process: run each (function, page) received, until the pipe closes."""
+    while True:
+        try:
+            func, html = conn.recv()
+        except EOFError:
+            return
+        try:
+            conn.send((True, func(html)))
+        except Exception as exc:  # handed back to the caller to raise
+            conn.send((False, exc))
+
+
+class _ParsePool:
+    """Worker processes that HTML extraction is handed to, so it runs on every vCPU at once.
+
+    Parsing is pure-Python and CPU-bound, so threads only take turns at it.
+    Lambda has no /dev/shm, which multiprocessing's queues and locks (and so
+    ProcessPoolExecutor) need; each worker gets its own Pipe instead, and a
+    calling thread checks an idle worker out of a thread-side queue, sends it
+    the function and page, and blocks on the reply — the GIL released, so
+    its other fetching threads carry on. Functions and their results travel
+    pickled, so they're module-level and return plain strings and tuples.
+
+    Workers are spawned rather than forked, as the worker has threads
+    running by the time a pool starts. If one dies, the pool is marked
+    broken and every call from then on parses in the calling thread.
+    """
+
+    def __init__(self, processes: int) -> None:
+        context = multiprocessing.get_context("spawn")
+        self.processes = processes
+        self.broken = False
+        self._idle: queue.SimpleQueue[Connection] = queue.SimpleQueue()
+        self._workers: list[multiprocessing.process.BaseProcess] = []
+        for index in range(processes):
+            conn, worker_conn = context.Pipe()
+            worker = context.Process(target=_parse_worker, args=(worker_conn,), name=f"parse-{index}", daemon=True)
+            worker.start()
+            worker_conn.close()
+            self._workers.append(worker)
+            self._idle.put(conn)
+
+    def run[T](self, func: Callable[[str], T], html: str) -> T:
+        """Return func(html), computed in an idle worker process (or in this thread, once the pool is broken)."""
+        conn = self._idle.get()
+        try:
+            if not self.broken:
+                conn.send((func, html))
+                ok, result = conn.recv()
+                if not ok:
+                    raise result
+                return result
+        except (EOFError, OSError) as exc:
+            self.broken = True
+            logger.warning("Parse worker failed, parsing in-thread from now on", error=str(exc))
+        finally:
+            self._idle.put(conn)
+        return func(html)
+
+    def close(self) -> None:
+        """Stop the workers — each exits once its pipe is closed — and wait for them. Only call once idle."""
+        while not self._idle.empty():
+            self._idle.get().close()
+        for worker in self._workers:
+            worker.join()
+
+
+# One _ParsePool per process count, kept at module level so its workers (and
+# the imports they paid for) survive across warm Lambda invocations.
+_parse_pools: dict[int, _ParsePool] = {}
+_parse_pools_lock = threading.Lock()
+
+
+def _parse_processes() -> int:
+    """Read BUILTIN_PARSE_PROCESSES: how many worker processes to parse in, 0 or 1 meaning none."""
+    setting = os.environ.get("BUILTIN_PARSE_PROCESSES", _BUILTIN_DEFAULT_PARSE_PROCESSES).strip().lower()
+    cpus = os.cpu_count() or 1
+    return cpus if setting == "auto" else min(int(setting or 0), cpus)
+
+
+def _builtin_parse[T](func: Callable[[str], T], html: str) -> T:
+    """Run an HTML extraction function on a Built In page, in a _ParsePool if BUILTIN_PARSE_PROCESSES asks for one.
+
+    With a single process (or vCPU) there's nothing to gain over parsing in
+    the calling thread, so that's what happens.
+    """
+    processes = _parse_processes()
+    if processes <= 1:
+        return func(html)
+    with _parse_pools_lock:
+        pool = _parse_pools.get(processes)
+        if pool is None:
+            pool = _parse_pools[processes] = _ParsePool(processes)
+    return pool.run(func, html)
+
+
+class _BuiltinCards(HTMLParser):
+    """Extract the job cards of a Built In search results page in one pass of the stdlib tokenizer.
+
+    A card is an element with data-id="job-card". Within it, the first
+    data-id="job-card-title" element gives the title (and its href the
+    URL), the first data-id="company-title" element the company, and each
+    _BUILTIN_BADGE_ICONS icon a badge: the text of the element following the
+    div that holds the icon. Element text is its strings stripped and
+    concatenated, as BeautifulSoup's get_text(strip=True) has it.
+
+    Only the elements open inside the current card are tracked (an end tag
+    closes the most recent element of its name, like BeautifulSoup's
+    html.parser tree builder), and everything outside the cards is passed
+    over as it's tokenized, instead of building a tree of the whole page.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.cards: list[dict[str, str]] = []
+        self._card: dict[str, str] | None = None
+        # Tags of the elements open inside the current card, the card first.
+        self._open: list[str] = []
+        # Fields whose element is open, by its depth, collecting text.
+        self._captures: dict[str, tuple[int, list[str]]] = {}
+        # Badges whose icon's div is still open, by the div's depth, then
+        # badges waiting for the next element at that depth.
+        self._badge_divs: dict[str, int] = {}
+        self._badge_siblings: dict[str, int] = {}
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if self._card is None:
+            if ("data-id", "job-card") in attrs and tag not in _HTML_VOID_ELEMENTS:
+                self._card = {}
+                self._open = [tag]
+            return
+        attributes = dict(attrs)
+
+        depth = len(self._open)
+        for badge, sibling_depth in list(self._badge_siblings.items()):
+            if sibling_depth == depth:
+                del self._badge_siblings[badge]
+                self._capture(badge, depth)
+        data_id = attributes.get("data-id")
+        if data_id == "job-card-title" and "title" not in self._card and "title" not in self._captures:
+            self._card["href"] = attributes.get("href") or ""
+            self._capture("title", depth)
+        elif data_id == "company-title" and "company" not in self._card and "company" not in self._captures:
+            self._capture("company", depth)
+        for icon_class in (attributes.get("class") or "").split():
+            badge = _BUILTIN_BADGE_ICONS.get(icon_class)
+            if badge is None or any(
+                badge in seen for seen in (self._card, self._captures, self._badge_divs, self._badge_siblings)
+            ):
+                continue
+            div_depth = next((i for i in range(depth - 1, -1, -1) if self._open[i] == "div"), None)
+            if div_depth is None:
+                # An icon outside any div has no badge text.
+                self._card[badge] = ""
+            else:
+                self._badge_divs[badge] = div_depth
+        if tag in _HTML_VOID_ELEMENTS:
+            for name, (capture_depth, parts) in list(self._captures.items()):
+                if capture_depth == depth:
+                    del self._captures[name]
+                    self._card[name] = "".join(parts)
+        else:
+            self._open.append(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        if self._card is None or tag not in self._open:
+            return
+        depth = len(self._open) - 1 - self._open[::-1].index(tag)
+        del self._open[depth:]
+        for name, (capture_depth, parts) in list(self._captures.items()):
+            if capture_depth >= depth:
+                del self._captures[name]
+                self._card[name] = "".join(parts)
+        for badge, sibling_depth in list(self._badge_siblings.items()):
+            if sibling_depth > depth:
+                del self._badge_siblings[badge]
+        for badge, div_depth in list(self._badge_divs.items()):
+            if div_depth >= depth:
+                del self._badge_divs[badge]
+                if div_depth == depth:
+                    self._badge_siblings[badge] = depth
+        if depth == 0:
+            self.cards.append(self._card)
+            self._card = None
+            self._badge_siblings.clear()
+
+    def handle_data(self, data: str) -> None:
+        if self._captures and (text := data.strip()):
+            for _, parts in self._captures.values():
+                parts.append(text)
+
+    def _capture(self, name: str, depth: int) -> None:
+        self._captures[name] = (depth, [])
+
+
+class _BuiltinDescriptionText(HTMLParser):
+    """Collect a page's text outside _BUILTIN_DESCRIPTION_SKIP_TAGS elements, in document order.
+
+    Streams the page through the stdlib tokenizer rather than building a
+    BeautifulSoup tree just to decompose parts of it and walk the rest:
+    the text comes out the same as the tree's get_text(separator=" ",
+    strip=True) (each run of text between tags stripped, the non-empty ones
+    joined by spaces) at a fraction of the cost.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.parts: list[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in _BUILTIN_DESCRIPTION_SKIP_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _BUILTIN_DESCRIPTION_SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data: str) -> None:
+        if not self._skip_depth and (text := data.strip()):
+            self.parts.append(text)
+
+    def text(self) -> str:
+        return " ".join(self.parts)
+
+
+def _builtin_description_text(html: str) -> str:
+    """Return a Built In job page's text, minus scripts, styles and page chrome (see _BuiltinDescriptionText)."""
+    parser = _BuiltinDescriptionText()
+    parser.feed(html)
+    parser.close()
+    return parser.text()
 
 
 def _fetch_builtin_job_description(url: str) -> str:
@@ -686,197 +2770,457 @@ def _fetch_builtin_job_description(url: str) -> str:
     job outright over a transient error.
     """
     try:
-        resp = requests.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=30)
+        resp = _http_get(url, headers={"User-Agent": "Mozilla/5.0"})
         resp.raise_for_status()
     except requests.RequestException as exc:
         logger.warning("Built In job detail fetch failed", url=url, error=str(exc))
         return ""
-    soup = BeautifulSoup(resp.text, "html.parser")
-    for tag in soup(["script", "style", "noscript", "header", "footer", "nav"]):
-        tag.decompose()
-    return soup.get_text(separator=" ", strip=True)
+    return _builtin_parse(_builtin_description_text, resp.text)
 
 
-def _fetch_builtin_jobs(careers_url: str) -> list[dict[str, str]]:
+def _fetch_builtin_page(careers_url: str, page: int) -> str | None:
+    """Fetch one page of a Built In search's results. Returns None on any failure."""
+    try:
+        resp = _http_get(
+            careers_url,
+            params={"page": page},
+            headers={"User-Agent": "Mozilla/5.0"},
+        )
+        resp.raise_for_status()
+    except requests.RequestException as exc:
+        logger.warning("Built In fetch failed", url=careers_url, page=page, error=str(exc))
+        return None
+    return resp.text
+
+
+def _builtin_card_fields(html: str) -> list[tuple[str, str, str, str]]:
+    """Parse a Built In search results page into (title, href, location, company) tuples, one per card.
+
+    Cards missing a title or company are dropped. The page is streamed
+    through _BuiltinCards rather than built into a tree.
+    """
+    parser = _BuiltinCards()
+    parser.feed(html)
+    parser.close()
+    fields: list[tuple[str, str, str, str]] = []
+    for card in parser.cards:
+        if "title" not in card or "company" not in card:
+            continue
+        geo = card.get("geo", "")
+        workplace = card.get("workplace", "")
+        # Built In shows these as two separate badges — geography (e.g.
+        # "USA") and work model (e.g. "Remote") — verified directly:
+        # every card checked had both, and the geography badge alone
+        # rarely contains "remote" even for fully-remote roles, which
+        # silently excluded about half of genuinely-remote postings
+        # under the work-type filter before this was combined.
+        location = f"{geo} ({workplace})" if geo and workplace else geo or workplace
+        fields.append((card["title"], card["href"], location, card["company"]))
+    return fields
+
+
+def _builtin_page_jobs(html: str) -> list[dict[str, str]]:
+    """Parse a Built In search results page into job dicts with title, url, location and company keys.
+
+    An empty list means the page has no job cards, i.e. the search has no
+    more pages. See _builtin_card_fields.
+    """
+    return [
+        {"title": title, "url": _BUILTIN_BASE_URL + href, "location": location, "company": company}
+        for title, href, location, company in _builtin_parse(_builtin_card_fields, html)
+    ]
+
+
+def _fetch_builtin_page_jobs(careers_url: str, page: int) -> list[dict[str, str]] | None:
+    """Fetch and parse one page of a Built In search's results. Returns None on any fetch failure."""
+    html = _fetch_builtin_page(careers_url, page)
+    return _builtin_page_jobs(html) if html is not None else None
+
+
+def _iter_builtin_pages(careers_url: str, concurrency: int) -> Iterator[list[dict[str, str]] | None]:
+    """Yield each page of a Built In search's jobs in page order, keeping up to concurrency pages in flight.
+
+    Yields None for a page that failed, and stops after an empty (or
+    failed) page or _BUILTIN_MAX_PAGES; the consumer can stop earlier
+    still. Pages requested ahead of where the crawl stopped are discarded,
+    so at most concurrency - 1 requests are spent past the last page. Each
+    page is parsed on the thread that fetched it, so pages in flight are
+    parsed concurrently too (see _builtin_parse).
+    """
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="builtin-pages") as pages:
+        in_flight: deque[Future[list[dict[str, str]] | None]] = deque()
+        next_page = 1
+        try:
+            while True:
+                while len(in_flight) < concurrency and next_page <= _BUILTIN_MAX_PAGES:
+                    in_flight.append(pages.submit(_fetch_builtin_page_jobs, careers_url, next_page))
+                    next_page += 1
+                if not in_flight:
+                    return
+                jobs = in_flight.popleft().result()
+                yield jobs
+                if not jobs:
+                    return
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+
+def _fetch_builtin_jobs(
+    careers_url: str, crawl_state: _CrawlState | None = None, skipped: dict[str, int] | None = None
+) -> Iterator[dict[str, str]]:
     """Fetch job listings from a Built In (builtin.com) search results page.
 
     The search page is server-rendered, so a plain GET is enough — no
     headless browser needed. Paginates via the `page` query param until a
-    page returns no job cards.
+    page returns no job cards, or a page still fails after _http_request's
+    retries — the crawl stops there, keeping the pages already yielded but
+    leaving the search's crawl state as it was, so the next crawl reads on
+    past that page again.
+
     Built In aggregates postings across many employers, so each job dict
     carries its own "company" key; jobs from companies already tracked
     directly elsewhere in companies.json are skipped (they're covered, often
     more completely, by their own direct fetch). The search results don't
-    include job descriptions, so for postings whose title already looks
-    relevant (_title_looks_relevant), a follow-up request to the job's own
-    detail page fetches the full description to catch clearance requirements
-    that aren't mentioned in the title — same pattern as _fetch_workday_jobs,
-    and for the same reason (avoid an extra request per irrelevant posting).
-    Postings are also dropped by _builtin_location_matches (BUILTIN_LOCATION /
-    BUILTIN_WORK_TYPE env vars) before the description fetch, for the same
-    cost-avoidance reason.
+    include job descriptions, so for postings that pass the listing-level
+    stages (see _listing_filter_stage, with _builtin_filter_config() —
+    BUILTIN_LOCATION / BUILTIN_WORK_TYPE env vars — as the work-type stage),
+    a follow-up request to the job's own detail page fetches the full
+    description to catch clearance requirements that aren't mentioned in the
+    title — same pattern as _fetch_workday_jobs, and for the same reason
+    (avoid an extra request per irrelevant posting). Postings already stored
+    in the jobs table are skipped too — each page's survivors are
+    batch-checked first (see _known_job_flags), since handler would only
+    discard them as duplicates — and so are descriptions with a verdict in
+    the shared cache (see _cached_description_verdicts), which each page's
+    fresh verdicts are then added to. Given a crawl_state, postings
+    unchanged since the search's last snapshot are skipped before any of
+    that (see _CrawlState).
+
+    The crawl is incremental once the search has a snapshot: pages are
+    fetched one at a time, and the crawl stops at the first page whose
+    postings are all already in the snapshot — Built In lists the newest
+    postings first, so on a steady-state day that's page 1 or 2 rather than
+    all _BUILTIN_MAX_PAGES — and stores a partial snapshot (see
+    _CrawlState.complete). Without one (the first crawl, or once the state
+    has expired) every page is needed, so they're fetched ahead
+    concurrently instead, bounded by BUILTIN_PAGE_CONCURRENCY (see
+    _iter_builtin_pages), and still consumed in page order. Either way, a
+    page's descriptions are fetched concurrently, up to the same bound, and
+    both kinds of page can be parsed in worker processes (see
+    _builtin_parse).
 
     Args:
         careers_url: A Built In search URL, e.g.
             https://builtin.com/jobs?search=AWS&daysSinceUpdated=3
+        crawl_state: The search's _CrawlState, completed once the crawl
+            stops. None filters every posting.
+        skipped: The record's listing-stage skip counter (see
+            _fetch_greenhouse_jobs).
 
-    Returns:
-        Normalised list of job dicts with title, url, location, and company keys.
+    Yields:
+        Normalised job dicts with title, url, location, and company keys.
     """
-    known_companies = _get_known_company_names()
+    known_companies = _known_company_index()
+    if crawl_state is not None:
+        crawl_state.load()
+    incremental = crawl_state is not None and bool(crawl_state.previous_snapshot)
+    page_concurrency = (
+        1 if incremental else _concurrency_setting("BUILTIN_PAGE_CONCURRENCY", _BUILTIN_DEFAULT_PAGE_CONCURRENCY)
+    )
 
-    jobs = []
-    location_skipped = 0
+    count = 0
+    location_config = _builtin_filter_config()
+    skipped = skipped if skipped is not None else _listing_skip_counts()
+    known_skipped = 0
+    verdicts_cached = 0
     clearance_skipped = 0
-    for page in range(1, _BUILTIN_MAX_PAGES + 1):
-        try:
-            resp = requests.get(
-                careers_url,
-                params={"page": page},
-                headers={"User-Agent": "Mozilla/5.0"},
-                timeout=30,
-            )
-            resp.raise_for_status()
-        except requests.RequestException as exc:
-            logger.warning("Built In fetch failed", url=careers_url, page=page, error=str(exc))
-            return []
+    pages_fetched = 0
+    stopped_early = False
+    page_failed = False
+    description_concurrency = _concurrency_setting("BUILTIN_PAGE_CONCURRENCY", _BUILTIN_DEFAULT_PAGE_CONCURRENCY)
+    with ThreadPoolExecutor(max_workers=description_concurrency, thread_name_prefix="builtin-jobs") as describer:
+        for page_jobs in _iter_builtin_pages(careers_url, page_concurrency):
+            pages_fetched += 1
+            if not page_jobs:
+                page_failed = stopped_early = page_jobs is None
+                break
 
-        soup = BeautifulSoup(resp.text, "html.parser")
-        cards = soup.select('[data-id="job-card"]')
-        if not cards:
-            break
+            # Every card counts towards the snapshot, tracked companies' too, so
+            # a page of nothing but old postings is recognised as one.
+            new_jobs = [job for job in page_jobs if crawl_state is None or crawl_state.is_new(job)]
+            candidates: list[dict[str, str]] = []
+            for job in new_jobs:
+                if known_companies.matches(job["company"]):
+                    continue
+                stage = _listing_filter_stage(job, location_config)
+                if stage is not None:
+                    skipped[stage] += 1
+                    continue
+                candidates.append(job)
+
+            fresh = [
+                job for job, is_known in zip(candidates, _known_job_flags(candidates, ""), strict=True) if not is_known
+            ]
+            known_skipped += len(candidates) - len(fresh)
+            new_verdicts: list[tuple[str, bool, str]] = []
+            cached = _cached_description_verdicts(fresh)
+            descriptions = {
+                job["url"]: describer.submit(_fetch_builtin_job_description, job["url"])
+                for job, verdict in zip(fresh, cached, strict=True)
+                if verdict is None
+            }
+            for job, verdict in zip(fresh, cached, strict=True):
+                if verdict is None:
+                    description = descriptions[job["url"]].result()
+                    verdict = _requires_excluded_clearance(f"{job['title']} {description}")
+                    if description:
+                        new_verdicts.append((job["url"], verdict, description))
+                else:
+                    verdicts_cached += 1
+                if verdict:
+                    clearance_skipped += 1
+                    continue
+                count += 1
+                yield job
+            _store_description_verdicts(new_verdicts)
 
-        for card in cards:
-            title_el = card.select_one('[data-id="job-card-title"]')
-            company_el = card.select_one('[data-id="company-title"]')
-            if not title_el or not company_el:
-                continue
-            company = company_el.get_text(strip=True)
-            if _is_known_company(company, known_companies):
-                continue
-            title = title_el.get_text(strip=True)
-            if not _title_looks_relevant(title):
-                continue
-            geo = _builtin_card_text_by_icon(card, "fa-location-dot")
-            workplace = _builtin_card_text_by_icon(card, "fa-house-building")
-            # Built In shows these as two separate badges — geography (e.g.
-            # "USA") and work model (e.g. "Remote") — verified directly:
-            # every card checked had both, and the geography badge alone
-            # rarely contains "remote" even for fully-remote roles, which
-            # silently excluded about half of genuinely-remote postings
-            # under the work-type filter before this was combined.
-            location = f"{geo} ({workplace})" if geo and workplace else geo or workplace
-            if not _builtin_location_matches(location):
-                location_skipped += 1
-                continue
-            href = title_el.get("href", "")
-            job_url = _BUILTIN_BASE_URL + (href if isinstance(href, str) else "")
-            description = _fetch_builtin_job_description(job_url)
-            if _requires_excluded_clearance(f"{title} {description}"):
-                clearance_skipped += 1
-                continue
-            jobs.append(
-                {
-                    "title": title,
-                    "url": job_url,
-                    "location": location,
-                    "company": company,
-                }
-            )
+            if incremental and not new_jobs:
+                stopped_early = pages_fetched < _BUILTIN_MAX_PAGES
+                break
 
+    # A crawl cut short by a failed page stores no state: the pages after it
+    # were never read, so the next crawl mustn't take them for known.
+    if crawl_state is not None and not page_failed:
+        crawl_state.complete(partial=stopped_early)
     logger.info(
         "Built In jobs fetched",
         url=careers_url,
-        count=len(jobs),
-        location_skipped=location_skipped,
+        count=count,
+        known_skipped=known_skipped,
+        verdicts_cached=verdicts_cached,
         clearance_skipped=clearance_skipped,
+        parse_processes=max(_parse_processes(), 1),
+        incremental=incremental,
+        pages_fetched=pages_fetched,
+        pages_skipped=_BUILTIN_MAX_PAGES - pages_fetched if stopped_early else 0,
+        page_failed=page_failed,
+        page_concurrency=page_concurrency,
     )
-    return jobs
 
 
-def _fetch_jobs(company_name: str, careers_url: str, ats: str) -> list[dict[str, str]]:
-    """Dispatch to the appropriate ATS handler and return normalised job dicts.
+def _option_terms(ats_options: dict[str, Any], key: str) -> list[str]:
+    """Read a list-of-strings ats_options entry, accepting a single string too."""
+    value = ats_options.get(key)
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, list):
+        return [str(term) for term in value]
+    return []
+
+
+def _fetch_jobs(
+    company_name: str,
+    careers_url: str,
+    ats: str,
+    crawl_state: _CrawlState | None = None,
+    ats_options: dict[str, Any] | None = None,
+    skipped: dict[str, int] | None = None,
+) -> Iterator[dict[str, str]]:
+    """Dispatch to the appropriate ATS handler and return its normalised job dict generator.
 
     Args:
-        company_name: Unused; kept for a uniform call signature across backends.
+        company_name: Company the postings belong to. Used by the workday
+            and narrowed greenhouse fetches to compute job_ids for their
+            known-job check; ignored by the others (builtin postings carry
+            their own company).
         careers_url: URL passed to the ATS handler.
         ats: ATS backend identifier ("greenhouse", "lever", "workday", or "builtin").
+        crawl_state: The board's _CrawlState, passed to the backend to skip
+            unchanged boards and postings and record what it saw.
+        ats_options: The company's optional per-backend options: for
+            greenhouse, "departments" and "offices", lists of name
+            substrings to narrow the fetch to (see _fetch_greenhouse_jobs);
+            for lever, the _LEVER_FILTER_OPTIONS query filters (see
+            _fetch_lever_jobs); for workday, "strategy" (one of
+            _WORKDAY_STRATEGIES) and "page_size" (clamped to
+            [1, _WORKDAY_MAX_PAGE_SIZE]) — see _fetch_workday_jobs. An
+            unrecognised strategy or page_size is logged and replaced by
+            its default.
+        skipped: A _listing_skip_counts counter the backend counts the
+            postings its listing-level stages drop into, so the record's
+            "Job filter complete" log covers them (see _log_filter_counts).
 
     Returns:
-        Normalised list of job dicts with title, url, location keys (plus a
-        "company" key for the "builtin" backend, which aggregates postings
-        across many employers). Unrecognised ats values yield no jobs.
+        Iterator over normalised job dicts with title, url, location keys
+        (plus a "company" key for the "builtin" backend, which aggregates
+        postings across many employers), lazily fetched as it's consumed.
+        Unrecognised ats values yield no jobs.
     """
+    options = ats_options or {}
     if ats == "greenhouse":
-        return _fetch_greenhouse_jobs(careers_url)
+        return _fetch_greenhouse_jobs(
+            careers_url,
+            crawl_state,
+            departments=_option_terms(options, "departments"),
+            offices=_option_terms(options, "offices"),
+            skipped=skipped,
+            company_name=company_name,
+        )
     if ats == "lever":
-        return _fetch_lever_jobs(careers_url)
+        return _fetch_lever_jobs(
+            careers_url,
+            crawl_state,
+            filters={key: _option_terms(options, key) for key in _LEVER_FILTER_OPTIONS},
+            skipped=skipped,
+        )
     if ats == "workday":
-        return _fetch_workday_jobs(careers_url)
+        strategy = options.get("strategy", "auto")
+        if strategy not in _WORKDAY_STRATEGIES:
+            logger.warning("Unrecognised Workday strategy", company=company_name, strategy=strategy)
+            strategy = "auto"
+        try:
+            page_size = int(options.get("page_size", _WORKDAY_PAGE_SIZE))
+        except (TypeError, ValueError):
+            logger.warning("Unrecognised Workday page_size", company=company_name, page_size=options.get("page_size"))
+            page_size = _WORKDAY_PAGE_SIZE
+        page_size = max(1, min(page_size, _WORKDAY_MAX_PAGE_SIZE))
+        return _fetch_workday_jobs(
+            careers_url, company_name, crawl_state, strategy=strategy, page_size=page_size, skipped=skipped
+        )
     if ats == "builtin":
-        return _fetch_builtin_jobs(careers_url)
+        return _fetch_builtin_jobs(careers_url, crawl_state, skipped)
     logger.warning("Unrecognised ATS backend", company=company_name, ats=ats)
-    return []
+    return iter(())
+
+
+def _job_item(job: dict[str, str], company_name: str, discovered_at: str) -> dict[str, str]:
+    """Build the jobs table item for a fetched job."""
+    # "builtin" jobs carry their own company (Built In aggregates across
+    # employers); every other backend's jobs belong to company_name.
+    job_company = job.get("company") or company_name
+    return {
+        "job_id": _make_job_id(job_company, job["title"], job["url"]),
+        "company": job_company,
+        "title": job["title"],
+        "url": job["url"],
+        "location": job.get("location", ""),
+        "discovered_at": discovered_at,
+    }
+
+
+def _process_record(record: dict[str, Any], jobs_table_name: str) -> tuple[int, int]:
+    """Fetch, filter and persist one SQS record's company, returning (written, duplicates).
+
+    Fetches jobs via the appropriate ATS handler, applies the relevance
+    filter, and persists new job postings to DynamoDB — streamed end to end,
+    so each job is written while the rest of the board is still being
+    fetched (see _put_new_jobs). Only postings added since the board's last
+    snapshot are fetched past the listing at all, and the board's new state
+    is stored once all of its jobs are persisted (see _CrawlState).
+    """
+    body = json.loads(record["body"])
+    company_name: str = body["company_name"]
+    careers_url: str = body["careers_url"]
+    ats: str = body.get("ats", "unknown")
+    ats_options: dict[str, Any] = body.get("ats_options") or {}
+
+    logger.info("Processing company", company=company_name, url=careers_url, ats=ats, ats_options=ats_options)
+
+    discovered_at = datetime.now(UTC).isoformat()
+    skipped = _listing_skip_counts()
+    crawl_state = _CrawlState(careers_url)
+    jobs = _iter_relevant_jobs(_fetch_jobs(company_name, careers_url, ats, crawl_state, ats_options, skipped), skipped)
+    written, duplicates = _put_new_jobs(jobs_table_name, (_job_item(job, company_name, discovered_at) for job in jobs))
+    _store_board_crawl_state(crawl_state)
+    _log_filter_counts(company_name, written + duplicates, skipped, crawl_state.diff_counts())
+    logger.info("Jobs persisted", company=company_name, written=written, duplicates=duplicates)
+    return written, duplicates
 
 
 @logger.inject_lambda_context
 def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     """Entry point for the Worker Lambda.
 
-    Processes each SQS record, fetches jobs via the appropriate ATS handler,
-    applies the relevance filter, and persists new job postings to DynamoDB.
+    Processes every SQS record of the batch concurrently, one thread per
+    record (see _process_record) — each company's fetch is dominated by
+    network waits, so a batch takes about as long as its slowest company
+    rather than the sum of them. Each record is its own failure domain: an
+    exception is logged and its messageId reported in batchItemFailures
+    (the event source mapping has ReportBatchItemFailures enabled), so SQS
+    redelivers — and eventually dead-letters — only that company, while the
+    rest of the batch is deleted as done.
+
+    That includes running out of time: left to the Lambda timeout, one slow
+    company would fail the invocation and get every company in the batch
+    redelivered. Instead handler stops waiting _HANDLER_DEADLINE_MARGIN_SECONDS
+    before the deadline and reports the records still running as failures
+    like any other. Their threads are abandoned rather than interrupted;
+    anything they write before the container freezes is deduplicated on
+    redelivery.
 
     Args:
         event: SQS event containing one or more Records.
-        context: Lambda context object (unused).
+        context: Lambda context object, for the invocation's remaining time.
 
     Returns:
-        A summary dict with counts of records processed and jobs written.
+        A summary dict with counts of records processed, jobs written, and
+        jobs skipped as already-stored duplicates, plus the
+        batchItemFailures list of records to redeliver.
     """
     jobs_table_name = os.environ["JOBS_TABLE"]
-    table = dynamodb.Table(jobs_table_name)
+    http_stats_before = _http_connection_stats()
+    cache_stats_before = _response_cache_stats()
+    records = event.get("Records", [])
+    deadline = time.monotonic() + context.get_remaining_time_in_millis() / 1000 - _HANDLER_DEADLINE_MARGIN_SECONDS
 
     records_processed = 0
+    records_timed_out = 0
     jobs_written = 0
-
-    for record in event.get("Records", []):
-        body = json.loads(record["body"])
-        company_name: str = body["company_name"]
-        careers_url: str = body["careers_url"]
-        ats: str = body.get("ats", "unknown")
-
-        logger.info("Processing company", company=company_name, url=careers_url, ats=ats)
-
-        jobs = _filter_relevant_jobs(
-            _fetch_jobs(company_name, careers_url, ats),
-            company_name,
-        )
-
-        for job in jobs:
-            # "builtin" jobs carry their own company (Built In aggregates across
-            # employers); every other backend's jobs belong to company_name.
-            job_company = job.get("company") or company_name
-            job_id = _make_job_id(job_company, job["title"], job["url"])
-            item = {
-                "job_id": job_id,
-                "company": job_company,
-                "title": job["title"],
-                "url": job["url"],
-                "location": job.get("location", ""),
-                "discovered_at": datetime.now(UTC).isoformat(),
-            }
-            # condition_expression prevents overwriting existing items
-            try:
-                table.put_item(
-                    Item=item,
-                    ConditionExpression="attribute_not_exists(job_id)",
-                )
-                jobs_written += 1
-                logger.info("Wrote new job", title=job["title"], company=job_company)
-            except dynamodb.meta.client.exceptions.ConditionalCheckFailedException:
-                logger.debug("Duplicate skipped", job_id=job_id)
-
+    jobs_duplicate = 0
+    batch_item_failures = []
+
+    processors = ThreadPoolExecutor(max_workers=max(len(records), 1), thread_name_prefix="record")
+    futures = [processors.submit(_process_record, record, jobs_table_name) for record in records]
+    wait(futures, timeout=max(deadline - time.monotonic(), 0))
+    processors.shutdown(wait=False)
+    for record, future in zip(records, futures, strict=True):
+        if not future.done():
+            logger.error("Record timed out", message_id=record.get("messageId"))
+            batch_item_failures.append({"itemIdentifier": record.get("messageId")})
+            records_timed_out += 1
+            continue
+        try:
+            written, duplicates = future.result()
+        except Exception:
+            logger.exception("Record failed", message_id=record.get("messageId"))
+            batch_item_failures.append({"itemIdentifier": record.get("messageId")})
+            continue
+        jobs_written += written
+        jobs_duplicate += duplicates
         records_processed += 1
 
-    logger.info("Worker done", records_processed=records_processed, jobs_written=jobs_written)
-    return {"records_processed": records_processed, "jobs_written": jobs_written}
+    http_stats = _http_connection_stats()
+    connections_opened = http_stats["connections_opened"] - http_stats_before["connections_opened"]
+    requests_sent = http_stats["requests_sent"] - http_stats_before["requests_sent"]
+    cache_stats = _response_cache_stats()
+    logger.info(
+        "Worker done",
+        records_processed=records_processed,
+        records_failed=len(batch_item_failures),
+        records_timed_out=records_timed_out,
+        jobs_written=jobs_written,
+        jobs_duplicate=jobs_duplicate,
+        http_requests=requests_sent,
+        connections_opened=connections_opened,
+        connections_reused=requests_sent - connections_opened,
+        cache_hits=cache_stats["hits"] - cache_stats_before["hits"],
+        cache_misses=cache_stats["misses"] - cache_stats_before["misses"],
+        cache_bytes_saved=cache_stats["bytes_saved"] - cache_stats_before["bytes_saved"],
+    )
+    return {
+        "records_processed": records_processed,
+        "jobs_written": jobs_written,
+        "jobs_duplicate": jobs_duplicate,
+        "batchItemFailures": batch_item_failures,
+    }
@@ -61,9 +61,21 @@ resource "aws_iam_role_policy" "worker" {
       {
         Sid      = "DynamoDBWriteJobs"
         Effect   = "Allow"
-        Action   = ["dynamodb:PutItem", "dynamodb:GetItem"]
+        Action   = ["dynamodb:PutItem", "dynamodb:GetItem", "dynamodb:BatchGetItem"]
         Resource = aws_dynamodb_table.jobs.arn
       },
+      {
+        Sid      = "DynamoDBDescriptionVerdicts"
+        Effect   = "Allow"
+        Action   = ["dynamodb:BatchGetItem", "dynamodb:BatchWriteItem"]
+        Resource = aws_dynamodb_table.description_verdicts.arn
+      },
+      {
+        Sid      = "DynamoDBCrawlState"
+        Effect   = "Allow"
+        Action   = ["dynamodb:GetItem", "dynamodb:PutItem"]
+        Resource = aws_dynamodb_table.crawl_state.arn
+      },
       {
         Sid      = "DynamoDBScanCompanies"
         Effect   = "Allow"
@@ -173,20 +185,28 @@ resource "aws_lambda_function" "worker" {
 
   environment {
     variables = {
-      JOBS_TABLE        = aws_dynamodb_table.jobs.name
-      COMPANIES_TABLE   = aws_dynamodb_table.companies.name
-      BUILTIN_LOCATION  = var.builtin_location
-      BUILTIN_WORK_TYPE = var.builtin_work_type
-      LOCATION          = var.location
-      WORK_TYPE         = var.work_type
+      JOBS_TABLE                      = aws_dynamodb_table.jobs.name
+      COMPANIES_TABLE                 = aws_dynamodb_table.companies.name
+      DESCRIPTION_CACHE_TABLE         = aws_dynamodb_table.description_verdicts.name
+      CRAWL_STATE_TABLE               = aws_dynamodb_table.crawl_state.name
+      BUILTIN_LOCATION                = var.builtin_location
+      BUILTIN_WORK_TYPE               = var.builtin_work_type
+      BUILTIN_PAGE_CONCURRENCY        = tostring(var.builtin_page_concurrency)
+      BUILTIN_PARSE_PROCESSES         = var.builtin_parse_processes
+      LOCATION                        = var.location
+      WORK_TYPE                       = var.work_type
+      WORKDAY_DESCRIPTION_CONCURRENCY = tostring(var.workday_description_concurrency)
+      WORKDAY_SEARCH_CONCURRENCY      = tostring(var.workday_search_concurrency)
+      RESPONSE_CACHE_TTL_SECONDS      = tostring(var.response_cache_ttl_seconds)
     }
   }
 }
 
 resource "aws_lambda_event_source_mapping" "worker_sqs" {
-  event_source_arn = aws_sqs_queue.worker.arn
-  function_name    = aws_lambda_function.worker.arn
-  batch_size       = 1 # one company per invocation for isolation
+  event_source_arn        = aws_sqs_queue.worker.arn
+  function_name           = aws_lambda_function.worker.arn
+  batch_size              = var.worker_batch_size
+  function_response_types = ["ReportBatchItemFailures"] # only failed companies are redelivered
 }
 
 resource "aws_cloudwatch_log_group" "worker" {
@@ -300,6 +320,51 @@ resource "aws_dynamodb_table" "jobs" {
   }
 }
 
+# Clearance verdicts for job descriptions the Worker has already read, shared
+# across containers so a posting's description is fetched at most once a week.
+resource "aws_dynamodb_table" "description_verdicts" {
+  name         = "${local.prefix}-description-verdicts"
+  billing_mode = "PAY_PER_REQUEST"
+  hash_key     = "job_url"
+
+  attribute {
+    name = "job_url"
+    type = "S"
+  }
+
+  ttl {
+    attribute_name = "expires_at"
+    enabled        = true
+  }
+
+  tags = {
+    Name = "${local.prefix}-description-verdicts"
+  }
+}
+
+# Each board's state after its last complete crawl — HTTP validators (ETag,
+# Last-Modified) and a snapshot of posting fingerprints — so the Worker can
+# skip boards and postings that haven't changed.
+resource "aws_dynamodb_table" "crawl_state" {
+  name         = "${local.prefix}-crawl-state"
+  billing_mode = "PAY_PER_REQUEST"
+  hash_key     = "board_url"
+
+  attribute {
+    name = "board_url"
+    type = "S"
+  }
+
+  ttl {
+    attribute_name = "expires_at"
+    enabled        = true
+  }
+
+  tags = {
+    Name = "${local.prefix}-crawl-state"
+  }
+}
+
 
 resource "aws_cloudwatch_event_rule" "orchestrator" {
   name                = "${local.prefix}-orchestrator-schedule"
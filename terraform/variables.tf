@@ -44,6 +44,18 @@ variable "builtin_work_type" {
   default     = "remote"
 }
 
+variable "builtin_page_concurrency" {
+  description = "Max concurrent page requests per Built In search in the Worker Lambda: search pages during a full crawl, and job pages for descriptions (capped at 16; 1 fetches one page at a time)"
+  type        = number
+  default     = 4
+}
+
+variable "builtin_parse_processes" {
+  description = "Worker processes the Worker Lambda parses Built In pages in: \"auto\" for one per vCPU, or a count capped at the vCPU count; \"0\" parses in the fetching threads"
+  type        = string
+  default     = "0"
+}
+
 variable "location" {
   description = "Location substring to additionally keep for every ATS backend except builtin; blank disables it (remote-only). Independent of builtin_location"
   type        = string
@@ -73,3 +85,27 @@ variable "worker_memory_mb" {
   type        = number
   default     = 512
 }
+
+variable "response_cache_ttl_seconds" {
+  description = "Seconds a warm Worker Lambda container serves a successful ATS response from its /tmp response cache instead of re-downloading it (0 disables the cache)"
+  type        = number
+  default     = 3600
+}
+
+variable "worker_batch_size" {
+  description = "Max SQS messages (companies) per Worker Lambda invocation, processed concurrently; failed companies are redelivered individually (1-10)"
+  type        = number
+  default     = 5
+}
+
+variable "workday_description_concurrency" {
+  description = "Max concurrent job-description fetches per Workday tenant in the Worker Lambda (capped at 16)"
+  type        = number
+  default     = 8
+}
+
+variable "workday_search_concurrency" {
+  description = "Max concurrent keyword-search page requests per Workday tenant in the Worker Lambda (capped at 16; 1 searches one page at a time)"
+  type        = number
+  default     = 4
+}